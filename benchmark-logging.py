@@ -0,0 +1,70 @@
+"""Times the logging calls codelets make when logging is disabled, formatting
+messages before the call as codelets used to and lazily as they do now, and
+times a short run with logging disabled and enabled."""
+import io
+import json
+import os
+import sys
+import time
+import timeit
+
+from linguoplotter import Linguoplotter
+from linguoplotter.hyper_parameters import HyperParameters
+from linguoplotter.loggers import ActivityLogger, ErrorLogger, MockLogger, TextLogger
+
+PROGRAM_DIRECTORY = "example-programs/weather"
+PROGRAM_FILE = "narration-1.lisp"
+CODELETS = 500
+REPEATS = 100000
+
+
+def setup(activity_logger):
+    hyper_parameters = HyperParameters.from_dict(
+        json.load(open("default_hyper_parameters.json"))
+    )
+    hyper_parameters.CODELET_RUN_LIMIT = CODELETS
+    hyper_parameters.TESTING = True
+    loggers = {
+        "activity": activity_logger,
+        "structure": MockLogger(),
+        "text": TextLogger("", 0, PROGRAM_FILE, io.StringIO()),
+        "error": ErrorLogger(io.StringIO()),
+    }
+    linguoplotter = Linguoplotter.setup(hyper_parameters, loggers, random_seed=0)
+    linguoplotter.interpreter.interpret_file("builtin.lisp")
+    working_directory = os.getcwd()
+    os.chdir(PROGRAM_DIRECTORY)
+    linguoplotter.interpreter.interpret_file(PROGRAM_FILE)
+    os.chdir(working_directory)
+    return linguoplotter
+
+
+def time_run(activity_logger):
+    linguoplotter = setup(activity_logger)
+    start = time.time()
+    stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        linguoplotter.run()
+    finally:
+        sys.stdout = stdout
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    linguoplotter = setup(MockLogger())
+    logger = linguoplotter.bubble_chamber.loggers["activity"]
+    chunk = linguoplotter.bubble_chamber.input_nodes.get()
+    name = "chunks"
+    eager = timeit.timeit(
+        lambda: logger.log(f"{chunk} added to {name}"), number=REPEATS
+    )
+    lazy = timeit.timeit(
+        lambda: logger.log("{} added to {}", chunk, name), number=REPEATS
+    )
+    print(f"{REPEATS} disabled log calls formatted by the caller: {eager:.3f}s")
+    print(f"{REPEATS} disabled log calls formatted lazily: {lazy:.3f}s")
+    disabled = time_run(MockLogger())
+    enabled = time_run(ActivityLogger(io.StringIO()))
+    print(f"{CODELETS} codelets with logging disabled: {disabled:.2f}s")
+    print(f"{CODELETS} codelets with logging enabled: {enabled:.2f}s")
@@ -5,7 +5,10 @@ logs = "logs"
 
 log_directories = os.listdir(logs)
 for log_dir in log_directories:
-    structures = f"{logs}/{log_dir}/structures"
-    codelets = f"{logs}/{log_dir}/codelets"
-    shutil.rmtree(structures)
-    shutil.rmtree(codelets)
+    for directory in ["structures", "codelets", "graphs"]:
+        shutil.rmtree(f"{logs}/{log_dir}/{directory}", ignore_errors=True)
+    for file_name in ["structures.jsonl", "codelets.jsonl", "codelets_index.csv"]:
+        try:
+            os.remove(f"{logs}/{log_dir}/{file_name}")
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,4 @@
+(load "narration-kb.lisp")
+
+(load-raw-input-file "narration-1.csv" input-space
+  (list temperature-space time-space location-space))
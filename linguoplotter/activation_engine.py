@@ -0,0 +1,167 @@
+from typing import Iterable, List
+
+import numpy
+
+from .structure import Structure
+
+
+class ActivationEngine:
+    """Recalculates the activation buffers of the structures which receive
+    spreading activation from their relations and instances as array
+    operations.
+
+    The arrays mirror the links of those structures and are only rebuilt when
+    one of their link or instance sets changes. All other structures are
+    recalculated one at a time by their own method."""
+
+    def __init__(self):
+        self._signature = None
+        self._nodes = []
+        self._fallback_nodes = []
+        self._tracked = []
+        self._relation_nodes = numpy.zeros(0, dtype=numpy.intp)
+        self._relation_slots = numpy.zeros(0, dtype=numpy.intp)
+        self._other_slots = numpy.zeros(0, dtype=numpy.intp)
+        self._instance_nodes = numpy.zeros(0, dtype=numpy.intp)
+        self._instance_slots = numpy.zeros(0, dtype=numpy.intp)
+        self._instances = []
+        self._relatives_weights = numpy.zeros(0)
+        self._instances_weights = numpy.zeros(0)
+        self._links = {}
+
+    @staticmethod
+    def spreads_activation(structure: Structure) -> bool:
+        return (
+            getattr(type(structure), "recalculate_activation", None)
+            is Structure.recalculate_activation
+            and not structure.is_stable
+            and not structure.is_link
+            and (
+                structure.parent_space is None
+                or structure.parent_space.is_conceptual_space
+            )
+        )
+
+    def recalculate_activations(self, structures: Iterable[Structure]):
+        nodes = []
+        for structure in structures:
+            if self.spreads_activation(structure):
+                nodes.append(structure)
+            else:
+                structure.recalculate_activation()
+        signature = [self._link_versions(node) for node in nodes]
+        if signature != self._signature:
+            self._build(nodes, signature)
+            self._signature = signature
+        for node in self._fallback_nodes:
+            node.recalculate_activation()
+        if len(self._nodes) > 0:
+            self._recalculate_nodes()
+
+    @staticmethod
+    def _link_versions(node: Structure) -> tuple:
+        return (
+            node,
+            node.links_in.version,
+            node.links_out.version,
+            node.instances.version,
+        )
+
+    def _build(self, nodes: List[Structure], signature: list):
+        self._nodes = []
+        self._fallback_nodes = []
+        self._tracked = []
+        self._instances = []
+        slots = {}
+
+        def slot(structure: Structure) -> int:
+            if structure not in slots:
+                slots[structure] = len(self._tracked)
+                self._tracked.append(structure)
+            return slots[structure]
+
+        relation_edges = []
+        instance_edges = []
+        links = {}
+        for node, versions in zip(nodes, signature):
+            if node in self._links and self._links[node][0] == versions:
+                links[node] = self._links[node]
+            else:
+                links[node] = (versions, *self._links_of(node))
+            _, relatives, instances = links[node]
+            if relatives is None:
+                self._fallback_nodes.append(node)
+                continue
+            index = len(self._nodes)
+            self._nodes.append(node)
+            for relation, other in relatives:
+                relation_edges.append((index, slot(relation), slot(other)))
+            for instance in instances:
+                instance_edges.append((index, slot(instance)))
+                self._instances.append(instance)
+        self._links = links
+        relation_edges = numpy.array(relation_edges, dtype=numpy.intp).reshape(-1, 3)
+        instance_edges = numpy.array(instance_edges, dtype=numpy.intp).reshape(-1, 2)
+        self._relation_nodes = relation_edges[:, 0]
+        self._relation_slots = relation_edges[:, 1]
+        self._other_slots = relation_edges[:, 2]
+        self._instance_nodes = instance_edges[:, 0]
+        self._instance_slots = instance_edges[:, 1]
+        self._relatives_weights = numpy.array(
+            [node.RELATIVES_ACTIVATION_WEIGHT for node in self._nodes], dtype=float
+        )
+        self._instances_weights = numpy.array(
+            [node.INSTANCES_ACTIVATION_WEIGHT for node in self._nodes], dtype=float
+        )
+
+    @staticmethod
+    def _links_of(node: Structure) -> tuple:
+        relatives = []
+        for relation in node.relations:
+            arguments = relation.arguments.excluding(node)
+            if len(arguments) > 1:
+                # the scalar rule picks one of the arguments at random
+                return None, []
+            if arguments.not_empty:
+                relatives.append((relation, list(arguments)[0]))
+        return relatives, list(node.instances)
+
+    def _recalculate_nodes(self):
+        number_of_nodes = len(self._nodes)
+        activations = numpy.fromiter(
+            (structure.activation for structure in self._tracked),
+            dtype=float,
+            count=len(self._tracked),
+        )
+        qualities = numpy.fromiter(
+            (instance.quality for instance in self._instances),
+            dtype=float,
+            count=len(self._instances),
+        )
+        buffers = numpy.fromiter(
+            (node._activation_buffer for node in self._nodes),
+            dtype=float,
+            count=number_of_nodes,
+        )
+        # bincount adds weights in order, matching the scalar sum exactly
+        fully_active = activations[self._other_slots] == 1.0
+        relatives_totals = numpy.bincount(
+            self._relation_nodes[fully_active],
+            weights=activations[self._relation_slots][fully_active],
+            minlength=number_of_nodes,
+        )
+        instances_totals = numpy.zeros(number_of_nodes)
+        numpy.maximum.at(
+            instances_totals,
+            self._instance_nodes,
+            qualities * activations[self._instance_slots],
+        )
+        buffers = numpy.clip(
+            buffers
+            + numpy.clip(relatives_totals, 0.0, 1.0) * self._relatives_weights
+            + numpy.clip(instances_totals, 0.0, 1.0) * self._instances_weights,
+            0.0,
+            1.0,
+        )
+        for node, buffer in zip(self._nodes, buffers.tolist()):
+            node._activation_buffer = buffer
@@ -0,0 +1,260 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+import csv
+from dataclasses import dataclass
+import json
+import os
+import pickle
+import sys
+import time
+import traceback
+from typing import Iterable, Iterator
+
+from .hyper_parameters import HyperParameters
+from .id import ID
+from .linguoplotter import Linguoplotter
+from .loggers import (
+    ActivityLogger,
+    ErrorLogger,
+    MockLogger,
+    StructureLogger,
+    TextLogger,
+)
+from .revision import Revision
+
+# interpreted knowledge bases kept by this process, with their structure ids
+_SNAPSHOTS = {}
+
+
+@dataclass
+class BatchRun:
+    hyper_parameters_file: str
+    program_file: str
+    random_seed: int
+    working_directory: str
+    program_directory: str
+    builtin_file: str
+    knowledge_base_file: str = None
+    logs_directory: str = None
+    development: bool = False
+    log_intermediate_texts: bool = False
+
+
+def run_grid(
+    hyper_parameters_files: Iterable[str],
+    program_files: Iterable[str],
+    random_seeds: Iterable[int],
+    program_directory: str = ".",
+    builtin_file: str = "builtin.lisp",
+    knowledge_base_file: str = None,
+    logs_directory: str = None,
+    development: bool = False,
+    log_intermediate_texts: bool = False,
+    processes: int = None,
+) -> Iterator[dict]:
+    """Runs every program with every hyper parameters file and random seed in a
+    pool of processes, yielding each result as soon as its run finishes.
+
+    Program files are found in program_directory. Every run starts from fresh
+    global state and resolves its files against the current working directory
+    of the caller, so runs never depend on each other and never change
+    directory. The builtin file and the knowledge_base_file, if there is one, are
+    interpreted once per process and each run works on a forked copy of the
+    result, so programs that load the knowledge base only add their own
+    input. If logs_directory is given, each run writes its logs to a new
+    directory inside it, and the intermediate texts of every run are gathered
+    into its texts.csv by this process as runs finish. With processes=1 the
+    runs happen one after another without a pool."""
+    runs = [
+        BatchRun(
+            hyper_parameters_file=hyper_parameters_file,
+            program_file=program_file,
+            random_seed=random_seed,
+            working_directory=os.getcwd(),
+            program_directory=program_directory,
+            builtin_file=builtin_file,
+            knowledge_base_file=knowledge_base_file,
+            logs_directory=logs_directory,
+            development=development,
+            log_intermediate_texts=log_intermediate_texts,
+        )
+        for hyper_parameters_file in hyper_parameters_files
+        for random_seed in random_seeds
+        for program_file in program_files
+    ]
+    if processes == 1:
+        for run in runs:
+            yield _collect_texts(run_one(run))
+        return
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(run_one, run) for run in runs]
+        for future in as_completed(futures):
+            yield _collect_texts(future.result())
+
+
+def _collect_texts(result: dict) -> dict:
+    """Appends the texts a run logged in its own directory to the texts file
+    of the logs directory, which only the process running the grid writes."""
+    texts_file = result.pop("texts_file", None)
+    if texts_file is not None:
+        logs_directory = os.path.dirname(os.path.dirname(texts_file))
+        with open(texts_file, "r") as f, open(f"{logs_directory}/texts.csv", "a") as f2:
+            f2.write(f.read())
+    return result
+
+
+def run_one(run: BatchRun) -> dict:
+    """Runs in a fork of a process holding the interpreted knowledge base where
+    the platform allows it and from scratch otherwise."""
+    if hasattr(os, "fork"):
+        return _run_in_fork(run)
+    return _run(run, _prepare(run))
+
+
+def _prepare(run: BatchRun) -> Linguoplotter:
+    Revision.reset()
+    with open(_path(run, run.hyper_parameters_file), "r") as f:
+        hyper_parameters = HyperParameters.from_dict(json.loads(f.read()))
+    narrator = Linguoplotter.setup(hyper_parameters, _loggers(run, None, None))
+    narrator.interpreter.interpret_file(_path(run, run.builtin_file))
+    if run.knowledge_base_file is not None:
+        narrator.interpreter.interpret_file(_path(run, run.knowledge_base_file))
+    return narrator
+
+
+def _snapshot(run: BatchRun) -> tuple:
+    key = (
+        run.working_directory,
+        run.hyper_parameters_file,
+        run.builtin_file,
+        run.knowledge_base_file,
+    )
+    if key not in _SNAPSHOTS:
+        narrator = _prepare(run)
+        _SNAPSHOTS[key] = (narrator, dict(ID.COUNTS))
+    return _SNAPSHOTS[key]
+
+
+def _run_in_fork(run: BatchRun) -> dict:
+    narrator, id_counts = _snapshot(run)
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        try:
+            ID.reset()
+            ID.COUNTS.update(id_counts)
+            outcome = (True, _run(run, narrator))
+        except BaseException:
+            outcome = (False, traceback.format_exc())
+        with os.fdopen(write_end, "wb") as pipe:
+            pickle.dump(outcome, pipe)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as pipe:
+        data = pipe.read()
+    os.waitpid(pid, 0)
+    if len(data) == 0:
+        raise Exception(f"{run} ended without a result")
+    succeeded, value = pickle.loads(data)
+    if not succeeded:
+        raise Exception(f"{run} failed:\n{value}")
+    return value
+
+
+def _run(run: BatchRun, narrator: Linguoplotter) -> dict:
+    start_time = time.time()
+    run_details = {
+        "Program": run.program_file,
+        "random_seed": run.random_seed,
+        "hyper_parameters": run.hyper_parameters_file,
+    }
+    with ExitStack() as streams:
+        logs_dir_path = None
+        if run.logs_directory is not None:
+            logs_dir_path = (
+                f"{_path(run, run.logs_directory)}/{time.time()}-{os.getpid()}"
+            )
+            os.mkdir(logs_dir_path)
+            with open(f"{logs_dir_path}/details.txt", "w") as f:
+                f.write(json.dumps(run_details))
+            with open(_path(run, run.hyper_parameters_file), "r") as f, open(
+                f"{logs_dir_path}/hyper_parameters.json", "w"
+            ) as f2:
+                f2.write(f.read())
+        narrator.prepare_run(
+            _loggers(run, logs_dir_path, streams), random_seed=run.random_seed
+        )
+        narrator.interpreter.interpret_file(
+            _path(run, os.path.join(run.program_directory, run.program_file))
+        )
+        result = narrator.run()
+    result["Program"] = run.program_file
+    result["hyper_parameters"] = run.hyper_parameters_file
+    result["time_in_seconds"] = time.time() - start_time
+    if logs_dir_path is not None:
+        with open(f"{logs_dir_path}/details.txt", "w") as f:
+            f.write(json.dumps(dict(run_details, **result)))
+        with open(f"{logs_dir_path}/codelet_times.csv", "w", newline="") as csvfile:
+            fieldnames = list(narrator.coderack.codelet_times[0].keys())
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            for codelet_time in narrator.coderack.codelet_times:
+                writer.writerow(codelet_time)
+        if run.log_intermediate_texts:
+            result["texts_file"] = f"{logs_dir_path}/texts.csv"
+    if result["result"] is not None:
+        result["tree"] = narrator.bubble_chamber.worldview.view.to_zss_tree()
+    return result
+
+
+def _path(run: BatchRun, file_name: str) -> str:
+    return os.path.join(run.working_directory, file_name)
+
+
+def _loggers(run: BatchRun, logs_dir_path: str, streams: ExitStack) -> dict:
+    if logs_dir_path is None:
+        return {
+            "activity": MockLogger(),
+            "structure": MockLogger(),
+            "text": MockLogger(),
+            "error": MockLogger(),
+        }
+
+    def stream(file_name: str):
+        return streams.enter_context(open(file_name, "w"))
+
+    if run.development:
+        activity_logger = ActivityLogger(
+            stream(f"{logs_dir_path}/codelets.jsonl"),
+            codelets_index_stream=stream(f"{logs_dir_path}/codelets_index.csv"),
+            satisfaction_stream=stream(f"{logs_dir_path}/satisfaction.csv"),
+            determinism_stream=stream(f"{logs_dir_path}/determinism.csv"),
+            coderack_population_stream=stream(
+                f"{logs_dir_path}/coderack_population.csv"
+            ),
+            view_count_stream=stream(f"{logs_dir_path}/view_count.csv"),
+            codelet_spawned_stream=stream(f"{logs_dir_path}/codelets_spawned"),
+            codelet_run_stream=stream(f"{logs_dir_path}/codelets_run"),
+        )
+        structure_logger = StructureLogger(stream(f"{logs_dir_path}/structures.jsonl"))
+    else:
+        activity_logger = MockLogger()
+        structure_logger = MockLogger()
+    if run.log_intermediate_texts:
+        text_logger = TextLogger(
+            hyper_parameters=run.hyper_parameters_file,
+            seed=run.random_seed,
+            program=run.program_file,
+            stream=stream(f"{logs_dir_path}/texts.csv"),
+        )
+    else:
+        text_logger = MockLogger()
+    return {
+        "activity": activity_logger,
+        "structure": structure_logger,
+        "text": text_logger,
+        "error": ErrorLogger(stream(f"{logs_dir_path}/errors.log")),
+    }
@@ -1,17 +1,20 @@
 import math
 import statistics
-from typing import Callable, Dict, List, Union
+from typing import Callable, Dict, Iterable, List, Union
 
+from .activation_engine import ActivationEngine
 from .classifier import Classifier
 from .errors import MissingStructureError
 from .float_between_one_and_zero import FloatBetweenOneAndZero
 from .focus import Focus
+from .frame_instance_pool import FrameInstancePool
 from .hyper_parameters import HyperParameters
 from .id import ID
 from .location import Location
 from .logger import Logger
 from .random_machine import RandomMachine
 from .recycle_bin import RecycleBin
+from .revision import Revision
 from .structure import Structure
 from .structure_collections import StructureDict, StructureList, StructureSet
 from .structure_collection_keys import activation
@@ -98,21 +101,31 @@ class BubbleChamber:
         self.loggers = loggers
         self.focus = Focus()
         self.worldview = Worldview(None)
-        self.conceptual_spaces = self.new_set()
-        self.contextual_spaces = self.new_set()
-        self.frames = self.new_set()
-        self.merged_frames = self.new_set()
-        self.frame_instances = self.new_set()
-        self.concepts = self.new_set()
-        self.chunks = self.new_set()
-        self.letter_chunks = self.new_set()
-        self.concept_links = self.new_set()
-        self.correspondences = self.new_set()
-        self.labels = self.new_set()
-        self.cross_view_labels = self.new_set()
-        self.relations = self.new_set()
-        self.cross_view_relations = self.new_set()
-        self.views = self.new_set()
+        self.conceptual_spaces = self.new_set(indexed=True)
+        self.contextual_spaces = self.new_set(indexed=True)
+        self.frames = self.new_set(indexed=True)
+        self.merged_frames = self.new_set(indexed=True)
+        self.frame_instances = self.new_set(indexed=True)
+        self.concepts = self.new_set(indexed=True)
+        self.chunks = self.new_set(indexed=True)
+        self.letter_chunks = self.new_set(indexed=True)
+        self.concept_links = self.new_set(indexed=True)
+        self.correspondences = self.new_set(indexed=True)
+        self.labels = self.new_set(indexed=True)
+        self.cross_view_labels = self.new_set(indexed=True)
+        self.relations = self.new_set(indexed=True)
+        self.cross_view_relations = self.new_set(indexed=True)
+        self.views = self.new_set(indexed=True)
+        self._aggregates = {}
+        self._classifications = {}
+        self._classifications_revision = None
+        self.classification_hits = 0
+        self.classification_misses = 0
+        self.frame_instance_pool = FrameInstancePool(
+            self.hyper_parameters.FRAME_INSTANCE_POOL_SIZE
+        )
+        self.activation_engine = ActivationEngine()
+        self._satisfaction_revision = None
         self.satisfaction = 0
         self.general_satisfaction = 0
         self.previous_satisfaction = 0
@@ -124,25 +137,43 @@ class BubbleChamber:
 
     @property
     def spaces(self) -> StructureSet:
-        return StructureSet.union(
-            self.conceptual_spaces, self.contextual_spaces, self.frames
+        return self._aggregate(
+            "spaces",
+            [self.conceptual_spaces, self.contextual_spaces, self.frames],
+            lambda: StructureSet.union(
+                self.conceptual_spaces, self.contextual_spaces, self.frames
+            ),
         )
 
     @property
     def input_spaces(self) -> StructureSet:
-        return StructureSet.union(
-            *[view.input_spaces for view in self.views],
-            self.contextual_spaces.where(is_main_input=True),
+        return self._aggregate(
+            "input_spaces",
+            [self.views, self.contextual_spaces]
+            + [view.input_spaces for view in self.views],
+            lambda: StructureSet.union(
+                *[view.input_spaces for view in self.views],
+                self.contextual_spaces.where(is_main_input=True),
+            ),
         )
 
     @property
     def output_spaces(self) -> StructureSet:
-        return self.new_set(*[view.output_space for view in self.views])
+        return self._aggregate(
+            "output_spaces",
+            [self.views],
+            lambda: self.new_set(*[view.output_space for view in self.views]),
+        )
 
     @property
     def input_nodes(self) -> StructureSet:
-        return StructureSet.union(
-            *[space.contents.where(is_node=True) for space in self.input_spaces]
+        input_spaces = self.input_spaces
+        return self._aggregate(
+            "input_nodes",
+            [input_spaces] + [space.contents for space in input_spaces],
+            lambda: StructureSet.union(
+                *[space.contents.where(is_node=True) for space in input_spaces]
+            ),
         )
 
     @property
@@ -156,7 +187,7 @@ class BubbleChamber:
 
     @property
     def structures(self) -> StructureSet:
-        return StructureSet.union(
+        sources = [
             self.conceptual_spaces,
             self.contextual_spaces,
             self.frames,
@@ -169,8 +200,53 @@ class BubbleChamber:
             self.relations,
             self.views,
             self.concept_links,
+        ]
+        return self._aggregate(
+            "structures", sources, lambda: StructureSet.union(*sources)
         )
 
+    def _aggregate(
+        self, name: str, sources: List[StructureSet], build: Callable
+    ) -> StructureSet:
+        """Returns the cached view called name, rebuilding it only if one of
+        the sets it depends on has been replaced or changed since it was built."""
+        versions = [(source, source.version) for source in sources]
+        cached = self._aggregates.get(name)
+        if (
+            cached is None
+            or len(cached[0]) != len(versions)
+            or any(
+                old is not new or old_version != new_version
+                for (old, old_version), (new, new_version) in zip(cached[0], versions)
+            )
+        ):
+            cached = (versions, build())
+            self._aggregates[name] = cached
+        return cached[1]
+
+    def classify(self, classifier: "Classifier", **kwargs: dict) -> float:
+        """Returns classifier.classify(**kwargs), reusing the result of an
+        earlier call with the same arguments if no set, parent space, parent
+        concept or location has changed since. Classifications of a collection
+        are never reused since some classifiers pick an item from it at random."""
+        if "collection" in kwargs:
+            return classifier.classify(**kwargs)
+        if self._classifications_revision != Revision.STRUCTURE:
+            self._classifications = {}
+            self._classifications_revision = Revision.STRUCTURE
+        key = (classifier, tuple(sorted(kwargs.items())))
+        try:
+            classification = self._classifications[key]
+        except KeyError:
+            self.classification_misses += 1
+            classification = classifier.classify(**kwargs)
+            self._classifications[key] = classification
+            return classification
+        except TypeError:
+            return classifier.classify(**kwargs)
+        self.classification_hits += 1
+        return classification
+
     @property
     def collections(self) -> dict:
         return {
@@ -193,12 +269,25 @@ class BubbleChamber:
         }
 
     def recalculate_satisfaction(self):
-        self.focus.recalculate_satisfaction()
-        self.recalculate_general_satisfaction()
-        self.satisfaction = max(self.general_satisfaction, self.focus.satisfaction)
+        if self._satisfaction_revision != self._current_satisfaction_revision:
+            self.focus.recalculate_satisfaction()
+            self.recalculate_general_satisfaction()
+            self.satisfaction = max(self.general_satisfaction, self.focus.satisfaction)
+            self._satisfaction_revision = self._current_satisfaction_revision
         self.change_in_satisfaction = self.satisfaction - self.previous_satisfaction
         self.random_machine.recalculate_determinism()
 
+    @property
+    def _current_satisfaction_revision(self) -> tuple:
+        return (
+            Revision.COUNT,
+            self.focus,
+            self.focus.view,
+            self.worldview,
+            self.worldview.view,
+            self.worldview.satisfaction,
+        )
+
     def recalculate_general_satisfaction(self):
         main_input_space = self.contextual_spaces.where(is_main_input=True).get()
         average_view_quality = (
@@ -251,8 +340,7 @@ class BubbleChamber:
         self.change_in_satisfaction = self.satisfaction - self.previous_satisfaction
         self.previous_satisfaction = self.satisfaction
         self.worldview.activate()
-        for structure in self.structures:
-            structure.recalculate_activation()
+        self.activation_engine.recalculate_activations(self.structures)
         for structure in self.structures:
             structure.update_activation()
             if (
@@ -262,6 +350,7 @@ class BubbleChamber:
                 structure.activate()
             if self.log_count % self.ACTIVATION_LOGGING_FREQUENCY == 0:
                 self.loggers["structure"].log(structure)
+        Revision.bump()
         self.log_count += 1
 
     def new_dict(self, structures: dict = None, name: str = None) -> StructureDict:
@@ -271,23 +360,13 @@ class BubbleChamber:
     def new_list(self, *structures: list, name: str = None) -> StructureList:
         return StructureList(self, structures, name=name)
 
-    def new_set(self, *structures: list, name: str = None) -> StructureSet:
-        return StructureSet(self, structures, name=name)
+    def new_set(
+        self, *structures: list, name: str = None, indexed: bool = False
+    ) -> StructureSet:
+        return StructureSet(self, structures, name=name, indexed=indexed)
 
     def add(self, item):
         item.hyper_parameters = self.hyper_parameters
-        item.FLOATING_POINT_TOLERANCE = self.hyper_parameters.FLOATING_POINT_TOLERANCE
-        item.MINIMUM_ACTIVATION_UPDATE = self.hyper_parameters.MINIMUM_ACTIVATION_UPDATE
-        item.ACTIVATION_UPDATE_COEFFICIENT = (
-            self.hyper_parameters.ACTIVATION_UPDATE_COEFFICIENT
-        )
-        item.DECAY_RATE = self.hyper_parameters.DECAY_RATE
-        item.RELATIVES_ACTIVATION_WEIGHT = (
-            self.hyper_parameters.ACTIVATION_UPDATE_RELATIVES_WEIGHT
-        )
-        item.INSTANCES_ACTIVATION_WEIGHT = (
-            self.hyper_parameters.ACTIVATION_UPDATE_INSTANCES_WEIGHT
-        )
         self.loggers["structure"].log(item)
         for space in item.parent_spaces:
             space.add(item)
@@ -302,6 +381,7 @@ class BubbleChamber:
     def remove(self, item):
         if item.is_frame:
             self.frames.remove(item)
+            self.frame_instance_pool.discard(item)
         if item.is_view:
             correspondences = item.members.where(parent_view=item)
             for correspondence in correspondences:
@@ -376,6 +456,7 @@ class BubbleChamber:
                 item.abstract_chunk.instances.remove(item)
         collection_name = self.collections[type(item)]
         getattr(self, collection_name).remove(item)
+        self.loggers["structure"].forget(item)
 
     def new_conceptual_space(
         self,
@@ -401,7 +482,7 @@ class BubbleChamber:
             parent_id=parent_id,
             name=name,
             parent_concept=parent_concept,
-            contents=self.new_set(),
+            contents=self.new_set(indexed=True),
             breadth=breadth,
             no_of_dimensions=no_of_dimensions,
             dimensions=dimensions,
@@ -432,7 +513,7 @@ class BubbleChamber:
             parent_id=parent_id,
             name=name,
             parent_concept=parent_concept,
-            contents=self.new_set(),
+            contents=self.new_set(indexed=True),
             conceptual_spaces=conceptual_spaces,
             links_in=self.new_set(),
             links_out=self.new_set(),
@@ -570,7 +651,8 @@ class BubbleChamber:
             champion_labels=self.new_set(),
             champion_relations=self.new_set(),
         )
-        for existing_chunk in self.chunks:
+        # chunks without members, such as raw chunks, have no sub or super chunks
+        for existing_chunk in self.chunks if chunk.members.not_empty else []:
             if not chunk.members.is_empty and all(
                 member in existing_chunk.members for member in chunk.members
             ):
@@ -594,6 +676,36 @@ class BubbleChamber:
         self.add(chunk)
         return chunk
 
+    def load_raw_input(
+        self,
+        rows: Iterable[Iterable[float]],
+        input_space: ContextualSpace,
+        conceptual_spaces: List[ConceptualSpace],
+    ) -> List[Chunk]:
+        """Creates a raw chunk in input_space for each row. A row holds the
+        coordinates of the chunk in each of conceptual_spaces one after the
+        other, e.g. temperature, time, north and east for a weather input."""
+        chunks = []
+        for row in rows:
+            row = list(row)
+            locations = [Location([], input_space)]
+            start = 0
+            for space in conceptual_spaces:
+                end = start + space.no_of_dimensions
+                locations.append(Location([row[start:end]], space))
+                start = end
+            if start != len(row):
+                raise ValueError(
+                    f"Row {row} does not have {start} coordinates for "
+                    + f"{[space.name for space in conceptual_spaces]}"
+                )
+            chunks.append(
+                self.new_chunk(
+                    locations=locations, parent_space=input_space, is_raw=True
+                )
+            )
+        return chunks
+
     def new_letter_chunk(
         self,
         name: Union[str, None],
@@ -10,6 +10,8 @@ from .structure_collections import StructureSet
 class Codelet(ABC):
     """A unit of work to be carried out in the bubble chamber."""
 
+    _urgency_listener = None
+
     def __init__(
         self,
         codelet_id: str,
@@ -33,6 +35,16 @@ class Codelet(ABC):
             self.bubble_chamber.hyper_parameters.MINIMUM_CODELET_URGENCY
         )
 
+    @property
+    def urgency(self) -> FloatBetweenOneAndZero:
+        return self._urgency
+
+    @urgency.setter
+    def urgency(self, urgency: FloatBetweenOneAndZero):
+        self._urgency = urgency
+        if self._urgency_listener is not None:
+            self._urgency_listener(self)
+
     @classmethod
     def get_target_class(cls):
         raise NotImplementedError
@@ -43,7 +55,10 @@ class Codelet(ABC):
     def adjust_urgency(self, amount: FloatBetweenOneAndZero) -> None:
         new_urgency = FloatBetweenOneAndZero(self.urgency + amount)
         self.bubble_chamber.loggers["activity"].log(
-            f"Adjusting {self.codelet_id} urgency from {self.urgency} to {new_urgency}"
+            "Adjusting {} urgency from {} to {}",
+            self.codelet_id,
+            self.urgency,
+            new_urgency,
         )
         self.urgency = new_urgency
 
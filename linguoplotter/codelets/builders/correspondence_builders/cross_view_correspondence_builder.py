@@ -57,7 +57,7 @@ class CrossViewCorrespondenceBuilder(CorrespondenceBuilder):
                     correspondence.end,
                 ):
                     self.bubble_chamber.loggers["activity"].log(
-                        repr(self.targets["view"]) + f" cannot accept {correspondence}"
+                        "{!r} cannot accept {}", self.targets["view"], correspondence
                     )
                     return False
         if (
@@ -85,7 +85,7 @@ class CrossViewCorrespondenceBuilder(CorrespondenceBuilder):
                     correspondence.end,
                 ):
                     self.bubble_chamber.loggers["activity"].log(
-                        repr(self.targets["view"]) + f" cannot accept {correspondence}"
+                        "{!r} cannot accept {}", self.targets["view"], correspondence
                     )
                     return False
         return self.targets["view"].can_accept_member(
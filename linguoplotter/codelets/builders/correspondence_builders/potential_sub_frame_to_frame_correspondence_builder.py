@@ -37,7 +37,7 @@ class PotentialSubFrameToFrameCorrespondenceBuilder(CorrespondenceBuilder):
                 sub_view=self.targets["sub_view"],
             ):
                 self.bubble_chamber.loggers["activity"].log(
-                    repr(self.targets["view"]) + f" cannot accept {correspondence}"
+                    "{!r} cannot accept {}", self.targets["view"], correspondence
                 )
                 return False
         return self.targets["view"].can_accept_member(
@@ -47,7 +47,7 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
         else:
             abstract_chunk = self._get_abstract_chunk()
             self.bubble_chamber.loggers["activity"].log(
-                f"Found abstract chunk: {abstract_chunk}"
+                "Found abstract chunk: {}", abstract_chunk
             )
             if (
                 self.targets["projectee"].members.is_empty
@@ -98,13 +98,13 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
                     parent_id=self.codelet_id,
                 )
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Built Letter Chunk {word}"
+                    "Built Letter Chunk {}", word
                 )
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Left branch {word.left_branch}"
+                    "Left branch {}", word.left_branch
                 )
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Right branch {word.right_branch}"
+                    "Right branch {}", word.right_branch
                 )
         for member in self.targets["projectee"].left_branch:
             if member.has_correspondence_to_space(self.targets["view"].output_space):
@@ -113,7 +113,7 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
                 ).get()
                 correspondee = correspondence.end
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Adding {correspondee} to left branch of {word}"
+                    "Adding {} to left branch of {}", correspondee, word
                 )
                 word.left_branch.add(correspondee)
                 word.members.add(correspondee)
@@ -128,7 +128,7 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
                 ).get()
                 correspondee = correspondence.end
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Adding {correspondee} to right branch of {word}"
+                    "Adding {} to right branch of {}", correspondee, word
                 )
                 word.right_branch.add(correspondee)
                 word.members.add(correspondee)
@@ -146,12 +146,12 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
                 correspondee = correspondence.end
                 if self.targets["projectee"] in super_chunk.left_branch:
                     self.bubble_chamber.loggers["activity"].log(
-                        f"Adding {word} to left branch of {correspondee}"
+                        "Adding {} to left branch of {}", word, correspondee
                     )
                     correspondee.left_branch.add(word)
                 elif self.targets["projectee"] in super_chunk.right_branch:
                     self.bubble_chamber.loggers["activity"].log(
-                        f"Adding {word} to right branch of {correspondee}"
+                        "Adding {} to right branch of {}", word, correspondee
                     )
                     correspondee.right_branch.add(word)
                 correspondee.members.add(word)
@@ -288,13 +288,13 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
                     .end
                 )
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Root letter chunk: {root_letter_chunk}"
+                    "Root letter chunk: {}", root_letter_chunk
                 )
                 arg_letter_chunk = _abstract_chunk_from_concepts(
                     meaning_concept.args[0], grammar_concept
                 )
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Arg letter chunk: {arg_letter_chunk}"
+                    "Arg letter chunk: {}", arg_letter_chunk
                 )
                 return self.bubble_chamber.new_letter_chunk(
                     name=f"{root_letter_chunk.name} {arg_letter_chunk.name}",
@@ -319,7 +319,7 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
             )
             .get()
         )
-        self.bubble_chamber.loggers["activity"].log(f"Grammar label: {grammar_label}")
+        self.bubble_chamber.loggers["activity"].log("Grammar label: {}", grammar_label)
         grammar_concept = (
             grammar_label.parent_concept
             if not grammar_label.parent_concept.is_slot
@@ -333,7 +333,7 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
             )
             .get()
         )
-        self.bubble_chamber.loggers["activity"].log(f"Meaning label: {meaning_label}")
+        self.bubble_chamber.loggers["activity"].log("Meaning label: {}", meaning_label)
         meaning_concept = (
             meaning_label.parent_concept
             if not meaning_label.parent_concept.is_slot
@@ -364,6 +364,6 @@ class LetterChunkProjectionBuilder(ProjectionBuilder):
                 .get(key=activation)
             )
         self.bubble_chamber.loggers["activity"].log(
-            f"Meaning concept: {meaning_concept}"
+            "Meaning concept: {}", meaning_concept
         )
         return _abstract_chunk_from_concepts(meaning_concept, grammar_concept)
@@ -47,14 +47,15 @@ class ViewBuilder(Builder):
         space_map = (
             {} if self.targets["space_map"] is None else self.targets["space_map"]
         )
-        frame_instance = self.targets["frame"].instantiate(
+        frame_instance = self.bubble_chamber.frame_instance_pool.instantiate(
+            self.targets["frame"],
             input_space=frame_input_space,
             conceptual_spaces_map=space_map,
             parent_id=self.codelet_id,
             bubble_chamber=self.bubble_chamber,
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Created frame instance: {frame_instance}"
+            "Created frame instance: {}", frame_instance
         )
         view_output = self._create_view_output(
             view_id=view_id,
@@ -102,7 +103,7 @@ class ViewBuilder(Builder):
             conceptual_spaces=conceptual_spaces,
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Created output space: {view_output}"
+            "Created output space: {}", view_output
         )
         return view_output
 
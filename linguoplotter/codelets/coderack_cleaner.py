@@ -1,4 +1,3 @@
-import random
 import statistics
 
 from linguoplotter.bubble_chamber import BubbleChamber
@@ -54,7 +53,7 @@ class CoderackCleaner(Codelet):
 
     def run(self) -> CodeletResult:
         self.bubble_chamber.loggers["activity"].log(
-            f"Coderack population size: {self.coderack.population_size}"
+            "Coderack population size: {}", self.coderack.population_size
         )
         current_satisfaction_score = self.bubble_chamber.satisfaction
         change_in_satisfaction_score = (
@@ -67,7 +66,7 @@ class CoderackCleaner(Codelet):
             [current_satisfaction_score, transposed_change_in_satisfaction_score]
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Recently run: {self.coderack.recently_run}"
+            "Recently run: {}", self.coderack.recently_run
         )
         for codelet in list(self.coderack._codelets):
             if type(codelet) not in self.coderack.recently_run:
@@ -75,10 +74,12 @@ class CoderackCleaner(Codelet):
             probability_of_deleting_codelet = statistics.fmean(
                 [probability_of_codelet_deletion, 1 - codelet.urgency]
             )
-            if probability_of_deleting_codelet > random.random() and not isinstance(
-                codelet, self.coderack.PROTECTED_CODELET_TYPES
+            if (
+                probability_of_deleting_codelet
+                > self.bubble_chamber.random_machine.generate_number()
+                and not isinstance(codelet, self.coderack.PROTECTED_CODELET_TYPES)
             ):
-                self.bubble_chamber.loggers["activity"].log(f"Deleting {codelet}")
+                self.bubble_chamber.loggers["activity"].log("Deleting {}", codelet)
                 self.coderack.remove_codelet(codelet)
         self.coderack.recently_run = set()
         self.child_codelets.append(
@@ -91,7 +92,7 @@ class CoderackCleaner(Codelet):
             )
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Coderack population size: {self.coderack.population_size}"
+            "Coderack population size: {}", self.coderack.population_size
         )
         self.result = CodeletResult.FINISH
 
@@ -38,10 +38,14 @@ class Evaluator(Codelet):
         self.bubble_chamber.loggers["activity"].log_set(self.targets)
         self._calculate_confidence()
         self.bubble_chamber.loggers["activity"].log(
-            f"Original confidence: {self.original_confidence}\n"
-            + f"Confidence: {self.confidence}\n"
-            + f"Change in confidence: {self.change_in_confidence}\n"
-            + f"Activation difference: {self.activation_difference}"
+            "Original confidence: {}\n"
+            "Confidence: {}\n"
+            "Change in confidence: {}\n"
+            "Activation difference: {}",
+            self.original_confidence,
+            self.confidence,
+            self.change_in_confidence,
+            self.activation_difference,
         )
         for structure in self.targets:
             structure.quality = self.confidence
@@ -32,14 +32,13 @@ class CorrespondenceEvaluator(Evaluator):
         self.original_confidence = target_correspondence.quality
         start = target_correspondence.start
         end = target_correspondence.end
-        argument_compatibility = (
-            target_correspondence.parent_concept.classifier.classify(
-                space=target_correspondence.conceptual_space,
-                concept=target_correspondence.parent_concept,
-                start=start,
-                end=end,
-                view=target_correspondence.parent_view,
-            )
+        argument_compatibility = self.bubble_chamber.classify(
+            target_correspondence.parent_concept.classifier,
+            space=target_correspondence.conceptual_space,
+            concept=target_correspondence.parent_concept,
+            start=start,
+            end=end,
+            view=target_correspondence.parent_view,
         )
         min_argument_quality = min(
             start.quality
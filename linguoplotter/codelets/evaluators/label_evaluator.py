@@ -32,8 +32,8 @@ class LabelEvaluator(Evaluator):
         target_label = self.targets.get()
         target_node = target_label.start
         parent_concept = target_label.parent_concept
-        classification = parent_concept.classifier.classify(
-            concept=parent_concept, start=target_node
+        classification = self.bubble_chamber.classify(
+            parent_concept.classifier, concept=parent_concept, start=target_node
         )
         self.confidence = (
             classification * target_node.quality / parent_concept.number_of_components
@@ -39,12 +39,15 @@ class CrossViewLabelEvaluator(LabelEvaluator):
         conceptual_space = target_label.parent_spaces.filter(
             lambda x: x.is_conceptual_space and target_label.has_location_in_space(x)
         ).get()
-        classification = target_label.parent_concept.classifier.classify(
+        classification = self.bubble_chamber.classify(
+            target_label.parent_concept.classifier,
             start=target_label.start,
             concept=target_label.parent_concept,
             space=conceptual_space,
         )
-        self.bubble_chamber.loggers["activity"].log(f"Classification: {classification}")
+        self.bubble_chamber.loggers["activity"].log(
+            "Classification: {}", classification
+        )
         self.confidence = (
             classification / target_label.parent_concept.number_of_components
         )
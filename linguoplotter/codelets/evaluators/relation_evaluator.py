@@ -51,7 +51,8 @@ class RelationEvaluator(Evaluator):
             parallel_relations, "Parallel relations"
         )
         classifications = {
-            relation: relation.parent_concept.classifier.classify(
+            relation: self.bubble_chamber.classify(
+                relation.parent_concept.classifier,
                 space=relation.conceptual_space,
                 concept=relation.parent_concept,
                 start=relation.start
@@ -42,7 +42,8 @@ class CrossViewRelationEvaluator(RelationEvaluator):
             target_relation.start.parent_space.quality,
             target_relation.end.parent_space.quality,
         )
-        classification = target_relation.parent_concept.classifier.classify(
+        classification = self.bubble_chamber.classify(
+            target_relation.parent_concept.classifier,
             space=target_relation.conceptual_space,
             concept=target_relation.parent_concept,
             start=target_relation.start
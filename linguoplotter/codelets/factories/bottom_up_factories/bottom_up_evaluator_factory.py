@@ -31,17 +31,15 @@ class BottomUpEvaluatorFactory(BottomUpFactory):
         cross_view_relation_competition = self._cross_view_relation_competition()
         cross_view_label_competition = self._cross_view_label_competition()
         self.bubble_chamber.loggers["activity"].log(
-            f"Chunk competition: {chunk_competition}",
+            "Chunk competition: {}", chunk_competition
+        ).log("Label competition: {}", label_competition).log(
+            "Relation competition: {}", relation_competition
         ).log(
-            f"Label competition: {label_competition}",
+            "View competition: {}", view_competition
         ).log(
-            f"Relation competition: {relation_competition}",
+            "Cross relation competition: {}", cross_view_relation_competition
         ).log(
-            f"View competition: {view_competition}",
-        ).log(
-            f"Cross relation competition: {cross_view_relation_competition}",
-        ).log(
-            f"Cross label competition: {cross_view_label_competition}",
+            "Cross label competition: {}", cross_view_label_competition
         )
         class_urgencies = [
             (codelet_type, urgency)
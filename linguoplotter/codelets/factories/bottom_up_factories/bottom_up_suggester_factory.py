@@ -35,23 +35,21 @@ class BottomUpSuggesterFactory(BottomUpFactory):
         view_unmergedness = self._unmergedness_of_views()
 
         self.bubble_chamber.loggers["activity"].log(
-            f"Unchunkedness of raw chunks: {input_unchunkedness}",
+            "Unchunkedness of raw chunks: {}", input_unchunkedness
+        ).log("Unlabeledness of chunks: {}", input_unlabeledness).log(
+            "Unrelatedness of chunks: {}", input_unrelatedness
         ).log(
-            f"Unlabeledness of chunks: {input_unlabeledness}",
+            "Unfilledness of slots: {}", frames_unfilledness
         ).log(
-            f"Unrelatedness of chunks: {input_unrelatedness}",
+            "Uncorrespondedness of links: {}", input_uncorrespondedness
         ).log(
-            f"Unfilledness of slots: {frames_unfilledness}",
+            "Uncorrespondedness of cross view links: {}", cross_view_uncorrespondedness
         ).log(
-            f"Uncorrespondedness of links: {input_uncorrespondedness}",
+            "Unlabeledness of letter chunks: {}", text_unlabeledness
         ).log(
-            f"Uncorrespondedness of cross view links: {cross_view_uncorrespondedness}",
+            "Unrelatedness of letter chunks: {}", text_unrelatedness
         ).log(
-            f"Unlabeledness of letter chunks: {text_unlabeledness}",
-        ).log(
-            f"Unrelatedness of letter chunks: {text_unrelatedness}",
-        ).log(
-            f"Unmergedness of views: {view_unmergedness}",
+            "Unmergedness of views: {}", view_unmergedness
         )
 
         class_urgencies = [
@@ -46,10 +46,10 @@ class ConceptDrivenFactory(Factory):
             follow_up_class
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Proportion of codelets of that type: {proportion_of_codelets}"
+            "Proportion of codelets of that type: {}", proportion_of_codelets
         )
         rand = self.bubble_chamber.random_machine.generate_number()
-        self.bubble_chamber.loggers["activity"].log(f"Random number: {rand}")
+        self.bubble_chamber.loggers["activity"].log("Random number: {}", rand)
         if proportion_of_codelets < rand:
             follow_up = follow_up_class.make_top_down(
                 self.codelet_id, self.bubble_chamber, self.targets["concept"]
@@ -62,12 +62,14 @@ class ConceptDrivenFactory(Factory):
                 self._get_label_concepts(),
                 self._get_relational_concepts(),
             ).filter(lambda x: x.is_fully_active())
-            self.bubble_chamber.loggers["activity"].log(
-                "Active concepts: " + ", ".join([c.name for c in fully_active_concepts])
-            )
+            if self.bubble_chamber.loggers["activity"].is_enabled:
+                self.bubble_chamber.loggers["activity"].log(
+                    "Active concepts: {}",
+                    ", ".join([c.name for c in fully_active_concepts]),
+                )
             self.targets["concept"] = fully_active_concepts.get()
             self.bubble_chamber.loggers["activity"].log(
-                "Found parent concept: " + str(self.targets["concept"])
+                "Found parent concept: {}", self.targets["concept"]
             )
         except MissingStructureError:
             self.bubble_chamber.loggers["activity"].log("No fully active concepts")
@@ -105,7 +107,7 @@ class ConceptDrivenFactory(Factory):
             structure=structure_concept,
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Found follow up class: {follow_up_class}"
+            "Found follow up class: {}", follow_up_class
         )
         return follow_up_class
 
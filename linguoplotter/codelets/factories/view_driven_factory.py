@@ -234,8 +234,8 @@ class ViewDrivenFactory(Factory):
             ]
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
-                    start=x["start"], concept=x["concept"]
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier, start=x["start"], concept=x["concept"]
                 ),
             )
             self.bubble_chamber.loggers["activity"].log_dict(targets)
@@ -325,7 +325,8 @@ class ViewDrivenFactory(Factory):
             ]
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier,
                     start=x["start"],
                     end=x["end"],
                     concept=x["concept"],
@@ -337,7 +338,8 @@ class ViewDrivenFactory(Factory):
                 self.codelet_id,
                 self.bubble_chamber,
                 targets,
-                targets["concept"].classifier.classify(
+                self.bubble_chamber.classify(
+                    targets["concept"].classifier,
                     start=targets["start"],
                     end=targets["end"],
                     concept=targets["concept"],
@@ -424,7 +426,7 @@ class ViewDrivenFactory(Factory):
                     try:
                         structure_one_start = start_node_group[target_start_space]
                         self.bubble_chamber.loggers["activity"].log(
-                            f"Found structure one start: {structure_one_start}"
+                            "Found structure one start: {}", structure_one_start
                         )
                     except KeyError:
                         self.bubble_chamber.loggers["activity"].log(
@@ -490,7 +492,7 @@ class ViewDrivenFactory(Factory):
                     try:
                         structure_one_end = end_node_group[target_end_space]
                         self.bubble_chamber.loggers["activity"].log(
-                            f"Found structure one end: {structure_one_end}"
+                            "Found structure one end: {}", structure_one_end
                         )
                     except KeyError:
                         self.bubble_chamber.loggers["activity"].log(
@@ -567,7 +569,8 @@ class ViewDrivenFactory(Factory):
             ]
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier,
                     start=x["start"].non_slot_value
                     if x["start"].is_slot
                     else x["start"],
@@ -589,7 +592,8 @@ class ViewDrivenFactory(Factory):
                 self.codelet_id,
                 self.bubble_chamber,
                 targets,
-                targets["concept"].classifier.classify(
+                self.bubble_chamber.classify(
+                    targets["concept"].classifier,
                     start=targets["start"].non_slot_value
                     if targets["start"].is_slot
                     else targets["start"],
@@ -722,7 +726,8 @@ class ViewDrivenFactory(Factory):
             ]
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier,
                     start=x["start"],
                     view=x["view"],
                     concept=x["concept"],
@@ -734,7 +739,8 @@ class ViewDrivenFactory(Factory):
                 self.codelet_id,
                 self.bubble_chamber,
                 targets,
-                targets["concept"].classifier.classify(
+                self.bubble_chamber.classify(
+                    targets["concept"].classifier,
                     start=targets["start"].non_slot_value
                     if targets["start"].is_slot
                     else targets["start"],
@@ -918,13 +924,13 @@ class ViewDrivenFactory(Factory):
             )
             .get()
         )
-        self.bubble_chamber.loggers["activity"].log(f"Found sub frame: {sub_frame}")
+        self.bubble_chamber.loggers["activity"].log("Found sub frame: {}", sub_frame)
         frame = self.bubble_chamber.frames.where(
             is_sub_frame=False,
             parent_concept=sub_frame.parent_concept,
             # or parent_concept in sub_frame.parent_concept.possible_instances
         ).get(key=activation)
-        self.bubble_chamber.loggers["activity"].log(f"Found target frame: {frame}")
+        self.bubble_chamber.loggers["activity"].log("Found target frame: {}", frame)
         urgency = self.targets["view"].unhappiness
         return ViewSuggester.make(
             self.codelet_id, self.bubble_chamber, frame=frame, urgency=urgency
@@ -44,14 +44,15 @@ class FocusSetter(Codelet):
             self.bubble_chamber.focus.frame = target_view.parent_frame
             self.bubble_chamber.focus.view = target_view
             self.bubble_chamber.loggers["activity"].log(
-                "Set focus\n"
-                + f"View: {target_view}\n"
-                + f"Frame: {self.bubble_chamber.focus.frame}"
+                "Set focus\nView: {}\nFrame: {}",
+                target_view,
+                self.bubble_chamber.focus.frame,
             )
             self.bubble_chamber.focus.recalculate_satisfaction()
             self.bubble_chamber.loggers["activity"].log(
-                f"Salience: {target_view.salience}\n"
-                + f"Satisfaction: {self.bubble_chamber.focus.satisfaction}"
+                "Salience: {}\nSatisfaction: {}",
+                target_view.salience,
+                self.bubble_chamber.focus.satisfaction,
             )
             self._update_codelet_urgencies(target_view.salience)
             self._engender_follow_up()
@@ -64,11 +65,10 @@ class FocusSetter(Codelet):
         return self.result
 
     def _update_codelet_urgencies(self, amount: FloatBetweenOneAndZero):
-        for codelet in self.coderack._codelets:
-            if "ViewDrivenFactory" in codelet.codelet_id:
-                codelet.adjust_urgency(amount)
-                return
-        raise Exception
+        view_driven_factory = self.coderack.meta_codelet("ViewDrivenFactory")
+        if view_driven_factory is None:
+            raise Exception
+        view_driven_factory.adjust_urgency(amount)
 
     def _fizzle(self):
         self.child_codelets.append(
@@ -51,7 +51,7 @@ class FocusUnsetter(Codelet):
         focus_length = self.coderack.codelets_run - self.time_focus_set
         self.bubble_chamber.focus.recalculate_satisfaction()
         self.bubble_chamber.loggers["activity"].log(
-            f"Focus satisfaction: {self.bubble_chamber.focus.satisfaction}"
+            "Focus satisfaction: {}", self.bubble_chamber.focus.satisfaction
         )
         current_satisfaction_score = self.bubble_chamber.focus.satisfaction
         self.bubble_chamber.focus.view.quality = current_satisfaction_score
@@ -67,13 +67,14 @@ class FocusUnsetter(Codelet):
             change_in_satisfaction_score * 0.5
         ) + 0.5
         self.bubble_chamber.loggers["activity"].log(
-            f"Current focus satisfaction: {self.bubble_chamber.focus.satisfaction}",
+            "Current focus satisfaction: {}", self.bubble_chamber.focus.satisfaction
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Change in satisfaction: {change_in_satisfaction_score}",
+            "Change in satisfaction: {}", change_in_satisfaction_score
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Transposed change in satisfaction: {transposed_change_in_satisfaction_score}",
+            "Transposed change in satisfaction: {}",
+            transposed_change_in_satisfaction_score,
         )
         if (
             self.bubble_chamber.focus.view.unhappiness < self.FLOATING_POINT_TOLERANCE
@@ -92,10 +93,10 @@ class FocusUnsetter(Codelet):
                 1 - transposed_change_in_satisfaction_score - 1 / focus_length
             )
         self.bubble_chamber.loggers["activity"].log(
-            f"Probability of unsetting focus: {probability_of_unsetting_focus}"
+            "Probability of unsetting focus: {}", probability_of_unsetting_focus
         )
         random_number = self.bubble_chamber.random_machine.generate_number()
-        self.bubble_chamber.loggers["activity"].log(f"Random number: {random_number}")
+        self.bubble_chamber.loggers["activity"].log("Random number: {}", random_number)
         if random_number > probability_of_unsetting_focus:
             self._update_view_driven_factory_urgency()
             self.bubble_chamber.loggers["activity"].log("Focus left set.")
@@ -122,33 +123,28 @@ class FocusUnsetter(Codelet):
         return self.result
 
     def _update_worldview_setter_urgency(self):
-        for codelet in self.coderack._codelets:
-            if "WorldviewSetter" in codelet.codelet_id:
-                codelet.urgency = self.bubble_chamber.focus.satisfaction
-                return
-        raise Exception
+        worldview_setter = self.coderack.meta_codelet("WorldviewSetter")
+        if worldview_setter is None:
+            raise Exception
+        worldview_setter.urgency = self.bubble_chamber.focus.satisfaction
 
     def _update_recycler_urgency(self):
-        for codelet in self.coderack._codelets:
-            if "Recycler" in codelet.codelet_id:
-                codelet.urgency = 1.0
-                return
-        raise Exception
+        recycler = self.coderack.meta_codelet("Recycler")
+        if recycler is None:
+            raise Exception
+        recycler.urgency = 1.0
 
     def _update_view_driven_factory_urgency(self):
-        for codelet in self.coderack._codelets:
-            if "ViewDrivenFactory" in codelet.codelet_id:
-                codelet.urgency = 1.0
-                return
-        raise Exception
+        view_driven_factory = self.coderack.meta_codelet("ViewDrivenFactory")
+        if view_driven_factory is None:
+            raise Exception
+        view_driven_factory.urgency = 1.0
 
     def _update_bottom_up_factories_urgencies(self):
-        for codelet in self.coderack._codelets:
-            if (
-                "BottomUpSuggesterFactory" in codelet.codelet_id
-                or "BottomUpEvaluatorFactory" in codelet.codelet_id
-            ):
-                codelet.adjust_urgency(1.0 - self.bubble_chamber.worldview.satisfaction)
+        for codelet in self.coderack.meta_codelets(
+            "BottomUpSuggesterFactory", "BottomUpEvaluatorFactory"
+        ):
+            codelet.adjust_urgency(1.0 - self.bubble_chamber.worldview.satisfaction)
 
     def _check_for_and_merge_with_equivalent_views(self):
         # if not self.target_view.super_views.is_empty: return ?
@@ -161,7 +157,7 @@ class FocusUnsetter(Codelet):
                 view.deactivate()
                 self.bubble_chamber.remove(view)
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Found and removed equivalent view: {view}"
+                    "Found and removed equivalent view: {}", view
                 )
 
     def _fizzle(self):
@@ -46,9 +46,9 @@ class GarbageCollector(Codelet):
         worldview = self.bubble_chamber.worldview.view
         focus = self.bubble_chamber.focus.view
         for structure in self.bubble_chamber.recycle_bin:
-            self.bubble_chamber.loggers["activity"].log(f"{structure}").log(
-                f"Quality: {structure.quality}"
-            ).log(f"Activation: {structure.activation}")
+            self.bubble_chamber.loggers["activity"].log("{}", structure).log(
+                "Quality: {}", structure.quality
+            ).log("Activation: {}", structure.activation)
             if not structure.is_recyclable:
                 self.bubble_chamber.loggers["activity"].log("NOT RECYCLABLE")
                 self.bubble_chamber.recycle_bin.remove(structure)
@@ -130,12 +130,15 @@ class GarbageCollector(Codelet):
                 structure.quality * self.bubble_chamber.random_machine.generate_number()
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Probability of removal: {probability_of_removal}"
+                "Probability of removal: {}", probability_of_removal
             )
             # higher quality structures are more likely to be deleted as randomness increases
             if probability_of_removal > self.bubble_chamber.random_machine.randomness:
                 self.bubble_chamber.loggers["activity"].log("REMOVING")
                 self.bubble_chamber.recycle_bin.remove(structure)
+                # pooled frame instances keep their records when removed
+                if structure.is_view:
+                    self.bubble_chamber.frame_instance_pool.add(structure.parent_frame)
                 self.bubble_chamber.remove(structure)
                 # for codelet in relevant_codelets:
                 #    self.bubble_chamber.loggers["activity"].log(f"Removing {codelet}")
@@ -77,7 +77,7 @@ class Publisher(Codelet):
         time_difference = self.coderack.codelets_run - self.last_time
         satisfaction_gradient = satisfaction_difference / time_difference
         self.bubble_chamber.loggers["activity"].log(
-            f"Satisfaction gradient: {satisfaction_gradient}"
+            "Satisfaction gradient: {}", satisfaction_gradient
         )
         if satisfaction_gradient > 0 and self.bubble_chamber.random_machine.coin_flip():
             self.bubble_chamber.loggers["activity"].log(
@@ -91,12 +91,12 @@ class Publisher(Codelet):
             return
         publish_concept = self.bubble_chamber.concepts["publish"]
         self.bubble_chamber.loggers["activity"].log(
-            f"Publish concept activation: {publish_concept.activation}"
+            "Publish concept activation: {}", publish_concept.activation
         )
         if not publish_concept.is_fully_active():
             self.bubble_chamber.loggers["activity"].log("Boosting publish concept")
             self.bubble_chamber.loggers["activity"].log(
-                f"Worldview Satisfaction: {self.bubble_chamber.worldview.satisfaction}"
+                "Worldview Satisfaction: {}", self.bubble_chamber.worldview.satisfaction
             )
             publish_concept.boost_activation(
                 publish_concept.activation
@@ -136,14 +136,11 @@ class Publisher(Codelet):
         )
 
     def _update_bottom_up_factories_urgencies(self):
-        for codelet in self.coderack._codelets:
-            if (
-                "BottomUpSuggesterFactory" in codelet.codelet_id
-                or "BottomUpEvaluatorFactory" in codelet.codelet_id
-            ):
-                codelet.adjust_urgency(1.0 - self.bubble_chamber.worldview.satisfaction)
+        for codelet in self.coderack.meta_codelets(
+            "BottomUpSuggesterFactory", "BottomUpEvaluatorFactory"
+        ):
+            codelet.adjust_urgency(1.0 - self.bubble_chamber.worldview.satisfaction)
 
     def _update_focus_codelet_urgencies(self):
-        for codelet in self.coderack._codelets:
-            if "Focus" in codelet.codelet_id:
-                codelet.adjust_urgency(1.0 - self.bubble_chamber.worldview.satisfaction)
+        for codelet in self.coderack.meta_codelets("FocusSetter", "FocusUnsetter"):
+            codelet.adjust_urgency(1.0 - self.bubble_chamber.worldview.satisfaction)
@@ -48,30 +48,31 @@ class Recycler(Codelet):
                         self.bubble_chamber.random_machine.generate_number()
                     )
                     self.bubble_chamber.loggers["activity"].log(
-                        f"{item.structure_id}, quality: {item.quality}; "
-                        + f"prob: {probability_of_recycling}",
+                        "{}, quality: {}; prob: {}",
+                        item.structure_id,
+                        item.quality,
+                        probability_of_recycling,
                     )
                     if probability_of_recycling > item.quality:
                         self.bubble_chamber.loggers["activity"].log(
-                            f"Adding to recycle bin: {item}"
+                            "Adding to recycle bin: {}", item
                         )
                         self.bubble_chamber.recycle_bin.add(item)
             self.result = CodeletResult.FINISH
         except MissingStructureError:
             self.result = CodeletResult.FIZZLE
         self.bubble_chamber.loggers["activity"].log(
-            f"Recycle Bin Population: {len(self.bubble_chamber.recycle_bin)}"
+            "Recycle Bin Population: {}", len(self.bubble_chamber.recycle_bin)
         )
         self._update_garbage_collector_urgency()
         self._engender_follow_up()
         return self.result
 
     def _update_garbage_collector_urgency(self):
-        for codelet in self.coderack._codelets:
-            if "GarbageCollector" in codelet.codelet_id:
-                codelet.urgency = self.bubble_chamber.satisfaction
-                return
-        raise Exception
+        garbage_collector = self.coderack.meta_codelet("GarbageCollector")
+        if garbage_collector is None:
+            raise Exception
+        garbage_collector.urgency = self.bubble_chamber.satisfaction
 
     def _engender_follow_up(self):
         try:
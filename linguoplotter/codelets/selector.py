@@ -1,5 +1,3 @@
-import random
-
 from linguoplotter.bubble_chamber import BubbleChamber
 from linguoplotter.codelet import Codelet
 from linguoplotter.codelet_result import CodeletResult
@@ -115,12 +113,18 @@ class Selector(Codelet):
         except ZeroDivisionError:
             chall_normalized_quality = 0.0
         self.bubble_chamber.loggers["activity"].log(
-            f"Champion quality: {champions_quality}\n"
-            f"Challenger quality: {challengers_quality}\n"
-            f"Champion size adjusted quality: {champ_size_adjusted_quality}\n"
-            f"Challenger size adjusted quality: {chall_size_adjusted_quality}\n"
-            f"Champion normalized quality: {champ_normalized_quality}"
-            f"Challenger normalized quality: {chall_normalized_quality}"
+            "Champion quality: {}\n"
+            "Challenger quality: {}\n"
+            "Champion size adjusted quality: {}\n"
+            "Challenger size adjusted quality: {}\n"
+            "Champion normalized quality: {}"
+            "Challenger normalized quality: {}",
+            champions_quality,
+            challengers_quality,
+            champ_size_adjusted_quality,
+            chall_size_adjusted_quality,
+            champ_normalized_quality,
+            chall_normalized_quality,
         )
         choices = [
             (self.champions, champ_normalized_quality),
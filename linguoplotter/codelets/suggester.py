@@ -55,7 +55,7 @@ class Suggester(Codelet):
             self.bubble_chamber.loggers["activity"].log("Preliminary checks passed")
             self._calculate_confidence()
             self.bubble_chamber.loggers["activity"].log(
-                f"Confidence: {self.confidence}"
+                "Confidence: {}", self.confidence
             )
             self._boost_activations()
             self._engender_follow_up()
@@ -150,7 +150,8 @@ class CorrespondenceSuggester(Suggester):
                 )
         else:
             classification_space = None
-        self.confidence = self.targets["concept"].classifier.classify(
+        self.confidence = self.bubble_chamber.classify(
+            self.targets["concept"].classifier,
             concept=self.targets["concept"],
             space=classification_space,
             start=self.targets["start"],
@@ -192,7 +193,7 @@ class CorrespondenceSuggester(Suggester):
                         child_codelet.targets["start_space"]
                     ]
                     bubble_chamber.loggers["activity"].log(
-                        f"Found structure one start: {structure_one_start}"
+                        "Found structure one start: {}", structure_one_start
                     )
                 except KeyError:
                     bubble_chamber.loggers["activity"].log(
@@ -270,7 +271,7 @@ class CorrespondenceSuggester(Suggester):
                         child_codelet.targets["start_space"]
                     ]
                     bubble_chamber.loggers["activity"].log(
-                        f"Found structure one end: {structure_one_end}"
+                        "Found structure one end: {}", structure_one_end
                     )
                 except KeyError:
                     bubble_chamber.loggers["activity"].log(
@@ -325,12 +326,13 @@ class CorrespondenceSuggester(Suggester):
                 bubble_chamber.loggers["activity"].log(
                     "Target structure two node group"
                 )
-                bubble_chamber.loggers["activity"].log(
-                    {
-                        space.structure_id: node.structure_id
-                        for space, node in node_group.items()
-                    }
-                )
+                if bubble_chamber.loggers["activity"].is_enabled:
+                    bubble_chamber.loggers["activity"].log(
+                        {
+                            space.structure_id: node.structure_id
+                            for space, node in node_group.items()
+                        }
+                    )
                 if child_codelet.targets["start_space"] in node_group:
                     child_codelet.targets["start"] = node_group[
                         child_codelet.targets["start_space"]
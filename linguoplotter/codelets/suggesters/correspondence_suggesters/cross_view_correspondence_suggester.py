@@ -83,7 +83,8 @@ class CrossViewCorrespondenceSuggester(CorrespondenceSuggester):
                     classification_space = self.targets["start"].conceptual_space
             else:
                 classification_space = self.targets["space"]
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=classification_space,
                 start=self.targets["start"],
@@ -91,7 +92,7 @@ class CrossViewCorrespondenceSuggester(CorrespondenceSuggester):
                 view=self.targets["view"],
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < 0.5:
                 self.targets["concept"] = self.bubble_chamber.new_compound_concept(
@@ -208,7 +209,7 @@ class CrossViewCorrespondenceSuggester(CorrespondenceSuggester):
                     try:
                         structure_one_start = start_node_group[target_start_space]
                         bubble_chamber.loggers["activity"].log(
-                            f"Found structure one start: {structure_one_start}"
+                            "Found structure one start: {}", structure_one_start
                         )
                     except KeyError:
                         bubble_chamber.loggers["activity"].log(
@@ -266,7 +267,7 @@ class CrossViewCorrespondenceSuggester(CorrespondenceSuggester):
                     try:
                         structure_one_end = end_node_group[target_end_space]
                         bubble_chamber.loggers["activity"].log(
-                            f"Found structure one end: {structure_one_end}"
+                            "Found structure one end: {}", structure_one_end
                         )
                     except KeyError:
                         bubble_chamber.loggers["activity"].log(
@@ -430,7 +431,7 @@ class CrossViewCorrespondenceSuggester(CorrespondenceSuggester):
                     try:
                         structure_one_start = start_node_group[target_start_space]
                         bubble_chamber.loggers["activity"].log(
-                            f"Found structure one start: {structure_one_start}"
+                            "Found structure one start: {}", structure_one_start
                         )
                     except KeyError:
                         bubble_chamber.loggers["activity"].log(
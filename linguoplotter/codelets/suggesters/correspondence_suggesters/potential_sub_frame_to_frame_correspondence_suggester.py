@@ -91,7 +91,8 @@ class PotentialSubFrameToFrameCorrespondenceSuggester(CorrespondenceSuggester):
                     )
             else:
                 classification_space = self.targets["space"]
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=classification_space,
                 start=self.targets["start"],
@@ -99,7 +100,7 @@ class PotentialSubFrameToFrameCorrespondenceSuggester(CorrespondenceSuggester):
                 view=self.targets["view"],
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < 0.5:
                 self.targets["concept"] = self.bubble_chamber.new_compound_concept(
@@ -122,7 +123,7 @@ class PotentialSubFrameToFrameCorrespondenceSuggester(CorrespondenceSuggester):
                 sub_view=self.targets["sub_view"],
             ):
                 self.bubble_chamber.loggers["activity"].log(
-                    f"Target view cannot accept {correspondence}"
+                    "Target view cannot accept {}", correspondence
                 )
                 return False
         if not self.targets["view"].can_accept_member(
@@ -86,7 +86,8 @@ class SpaceToFrameCorrespondenceSuggester(CorrespondenceSuggester):
                 )
             else:
                 classification_space = self.targets["space"]
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=classification_space,
                 start=self.targets["start"],
@@ -94,7 +95,7 @@ class SpaceToFrameCorrespondenceSuggester(CorrespondenceSuggester):
                 view=self.targets["view"],
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < 0.5:
                 self.targets["concept"] = self.bubble_chamber.new_compound_concept(
@@ -164,7 +165,8 @@ class SpaceToFrameCorrespondenceSuggester(CorrespondenceSuggester):
         else:
             classification_space = None
         self.confidence = (
-            self.targets["concept"].classifier.classify(
+            self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=classification_space,
                 start=self.targets["start"],
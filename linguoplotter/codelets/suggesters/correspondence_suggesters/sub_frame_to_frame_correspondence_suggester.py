@@ -64,7 +64,8 @@ class SubFrameToFrameCorrespondenceSuggester(CorrespondenceSuggester):
                 )
             else:
                 classification_space = self.targets["space"]
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=classification_space,
                 start=self.targets["start"],
@@ -118,7 +119,7 @@ class SubFrameToFrameCorrespondenceSuggester(CorrespondenceSuggester):
             self.targets["end"],
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"View can accept member?: {can_accept}"
+            "View can accept member?: {}", can_accept
         )
         return can_accept
 
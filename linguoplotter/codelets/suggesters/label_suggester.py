@@ -70,11 +70,13 @@ class LabelSuggester(Suggester):
 
     def _passes_preliminary_checks(self):
         if self.targets["concept"] is not None:
-            classification = self.targets["concept"].classifier.classify(
-                concept=self.targets["concept"], start=self.targets["start"]
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
+                concept=self.targets["concept"],
+                start=self.targets["start"],
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < self.bubble_chamber.random_machine.generate_number():
                 return False
@@ -90,18 +92,22 @@ class LabelSuggester(Suggester):
                 ]
             )
             self.targets["concept"] = possible_concepts.get(
-                key=lambda x: x.classifier.classify(
-                    concept=x, start=self.targets["start"]
+                key=lambda x: self.bubble_chamber.classify(
+                    x.classifier, concept=x, start=self.targets["start"]
                 )
                 / x.number_of_components
             )
         return True
 
     def _calculate_confidence(self):
-        classification = self.targets["concept"].classifier.classify(
-            concept=self.targets["concept"], start=self.targets["start"]
+        classification = self.bubble_chamber.classify(
+            self.targets["concept"].classifier,
+            concept=self.targets["concept"],
+            start=self.targets["start"],
+        )
+        self.bubble_chamber.loggers["activity"].log(
+            "Classification: {}", classification
         )
-        self.bubble_chamber.loggers["activity"].log(f"Classification: {classification}")
         self.confidence = (
             classification
             * self.targets["start"].quality
@@ -125,7 +131,9 @@ class LabelSuggester(Suggester):
         targets["start"] = self.targets["start"]
         targets["concept"] = self.bubble_chamber.random_machine.select(
             possible_concepts,
-            key=lambda x: x.classifier.classify(start=targets["start"], concept=x),
+            key=lambda x: self.bubble_chamber.classify(
+                x.classifier, start=targets["start"], concept=x
+            ),
         )
         self.child_codelets.append(
             type(self).spawn(
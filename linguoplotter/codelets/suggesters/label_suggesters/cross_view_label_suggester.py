@@ -104,13 +104,14 @@ class CrossViewLabelSuggester(LabelSuggester):
 
     def _passes_preliminary_checks(self):
         if not None in [self.targets["concept"], self.targets["space"]]:
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=self.targets["space"],
                 start=self.targets["start"],
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < self.bubble_chamber.random_machine.generate_number():
                 return False
@@ -161,7 +162,8 @@ class CrossViewLabelSuggester(LabelSuggester):
                 return False
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier,
                     start=x["start"],
                     concept=x["concept"],
                     space=x["space"],
@@ -181,12 +183,15 @@ class CrossViewLabelSuggester(LabelSuggester):
         return True
 
     def _calculate_confidence(self):
-        classification = self.targets["concept"].classifier.classify(
+        classification = self.bubble_chamber.classify(
+            self.targets["concept"].classifier,
             concept=self.targets["concept"],
             space=self.targets["space"],
             start=self.targets["start"],
         )
-        self.bubble_chamber.loggers["activity"].log(f"Classification: {classification}")
+        self.bubble_chamber.loggers["activity"].log(
+            "Classification: {}", classification
+        )
         self.confidence = classification / self.targets["concept"].number_of_components
 
     def _fizzle(self):
@@ -68,13 +68,13 @@ class RelationSuggester(Suggester):
             lambda x: x.is_node and not x.is_slot and x.quality > 0
         )
         try:
-            possible_pairs = [
-                (a, b) for a in potential_targets for b in potential_targets if a != b
-            ]
-            start, end = bubble_chamber.random_machine.select(
-                possible_pairs,
-                key=lambda x: parent_concept.classifier.classify(
-                    start=x[0], end=x[1], space=conceptual_space
+            start, end = bubble_chamber.random_machine.select_pair(
+                potential_targets,
+                key=lambda x: bubble_chamber.classify(
+                    parent_concept.classifier,
+                    start=x[0],
+                    end=x[1],
+                    space=conceptual_space,
                 ),
             )
 
@@ -106,14 +106,15 @@ class RelationSuggester(Suggester):
             self.targets["space"],
             self.targets["end"],
         ]:
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=self.targets["space"],
                 start=self.targets["start"],
                 end=self.targets["end"],
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < self.bubble_chamber.random_machine.generate_number():
                 return False
@@ -166,7 +167,8 @@ class RelationSuggester(Suggester):
         try:
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier,
                     start=x["start"],
                     end=x["end"],
                     concept=x["concept"],
@@ -211,13 +213,16 @@ class RelationSuggester(Suggester):
             if sameness_relations.is_empty
             else max([relation.quality for relation in sameness_relations])
         )
-        classification = self.targets["concept"].classifier.classify(
+        classification = self.bubble_chamber.classify(
+            self.targets["concept"].classifier,
             concept=self.targets["concept"],
             space=self.targets["space"],
             start=start,
             end=end,
         )
-        self.bubble_chamber.loggers["activity"].log(f"Classification: {classification}")
+        self.bubble_chamber.loggers["activity"].log(
+            "Classification: {}", classification
+        )
         self.confidence = (
             classification
             * min(start.quality, end.quality)
@@ -281,7 +286,8 @@ class RelationSuggester(Suggester):
         try:
             targets = self.bubble_chamber.random_machine.select(
                 possible_target_combos,
-                key=lambda x: x["concept"].classifier.classify(
+                key=lambda x: self.bubble_chamber.classify(
+                    x["concept"].classifier,
                     start=x["start"],
                     end=x["end"],
                     concept=x["concept"],
@@ -298,7 +304,8 @@ class RelationSuggester(Suggester):
                     self.codelet_id,
                     self.bubble_chamber,
                     targets,
-                    targets["concept"].classifier.classify(
+                    self.bubble_chamber.classify(
+                        targets["concept"].classifier,
                         start=targets["start"],
                         end=targets["end"],
                         concept=targets["concept"],
@@ -58,14 +58,15 @@ class CrossViewRelationSuggester(RelationSuggester):
                 if not self.targets["end"].is_slot
                 else self.targets["end"].non_slot_value
             )
-            classification = self.targets["concept"].classifier.classify(
+            classification = self.bubble_chamber.classify(
+                self.targets["concept"].classifier,
                 concept=self.targets["concept"],
                 space=self.targets["space"],
                 start=start,
                 end=end,
             )
             self.bubble_chamber.loggers["activity"].log(
-                f"Preliminary classification: {classification}"
+                "Preliminary classification: {}", classification
             )
             if classification < self.bubble_chamber.random_machine.generate_number():
                 return False
@@ -173,7 +174,8 @@ class CrossViewRelationSuggester(RelationSuggester):
             return False
         targets = self.bubble_chamber.random_machine.select(
             possible_target_combos,
-            key=lambda x: x["concept"].classifier.classify(
+            key=lambda x: self.bubble_chamber.classify(
+                x["concept"].classifier,
                 start=x["start"],
                 end=x["end"],
                 concept=x["concept"],
@@ -205,13 +207,16 @@ class CrossViewRelationSuggester(RelationSuggester):
             if not self.targets["end"].is_slot
             else self.targets["end"].non_slot_value
         )
-        classification = self.targets["concept"].classifier.classify(
+        classification = self.bubble_chamber.classify(
+            self.targets["concept"].classifier,
             concept=self.targets["concept"],
             space=self.targets["space"],
             start=start,
             end=end,
         )
-        self.bubble_chamber.loggers["activity"].log(f"Classification: {classification}")
+        self.bubble_chamber.loggers["activity"].log(
+            "Classification: {}", classification
+        )
         self.confidence = classification / (
             1
             if not self.targets["concept"].is_compound_concept
@@ -90,10 +90,10 @@ class BottomUpViewSuggester(ViewSuggester):
             )
         )  # these views should be completed or deleted before more are built
         self.bubble_chamber.loggers["activity"].log(
-            "Frame activation: " + str(self.targets["frame"].activation)
+            "Frame activation: {}", self.targets["frame"].activation
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Number of equivalent views: {number_of_equivalent_views}"
+            "Number of equivalent views: {}", number_of_equivalent_views
         )
         self.confidence = (
             self.targets["frame"].activation * 0.5**number_of_equivalent_views
@@ -143,10 +143,10 @@ class TopDownViewSuggester(ViewSuggester):
             )
         )  # these views should be completed or deleted before more are built
         self.bubble_chamber.loggers["activity"].log(
-            "Frame activation: " + str(self.targets["frame"].activation)
+            "Frame activation: {}", self.targets["frame"].activation
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Number of equivalent views: {number_of_equivalent_views}"
+            "Number of equivalent views: {}", number_of_equivalent_views
         )
         self.confidence = (
             self.targets["frame"].activation * 0.5**number_of_equivalent_views
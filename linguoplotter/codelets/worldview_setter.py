@@ -111,11 +111,10 @@ class WorldviewSetter(Codelet):
         )
 
     def _update_publisher_urgency(self):
-        for codelet in self.coderack._codelets:
-            if "Publisher" in codelet.codelet_id:
-                codelet.urgency = self.bubble_chamber.worldview.satisfaction
-                return
-        raise Exception
+        publisher = self.coderack.meta_codelet("Publisher")
+        if publisher is None:
+            raise Exception
+        publisher.urgency = self.bubble_chamber.worldview.satisfaction
 
     def _calculate_satisfaction(self, view: View) -> FloatBetweenOneAndZero:
         if view is None:
@@ -136,17 +135,13 @@ class WorldviewSetter(Codelet):
             tolerance=self.FLOATING_POINT_TOLERANCE,
         )
         self.bubble_chamber.loggers["activity"].log(
-            f"Calculating satisfaction for {view}",
+            "Calculating satisfaction for {}", view
+        ).log("Correctness: {}", correctness).log("Completeness: {}", completeness).log(
+            "Conciseness: {}", conciseness
         ).log(
-            f"Correctness: {correctness}",
+            "Cohesiveness: {}", cohesiveness
         ).log(
-            f"Completeness: {completeness}",
-        ).log(
-            f"Conciseness: {conciseness}",
-        ).log(
-            f"Cohesiveness: {cohesiveness}",
-        ).log(
-            f"Overall satisfaction: {satisfaction}",
+            "Overall satisfaction: {}", satisfaction
         )
         self.bubble_chamber.loggers["text"].log_text(
             time=self.coderack.codelets_run, text=view.output, quality=satisfaction
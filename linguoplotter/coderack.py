@@ -1,5 +1,7 @@
+from collections import defaultdict
+from collections.abc import Mapping
 import time
-from typing import Dict
+from typing import Any, Dict, Hashable, List
 
 from .bubble_chamber import BubbleChamber
 from .codelet import Codelet
@@ -29,6 +31,28 @@ from .errors import MissingStructureError, NoMoreCodelets
 from .float_between_one_and_zero import FloatBetweenOneAndZero
 from .hyper_parameters import HyperParameters
 from .logger import Logger
+from .structure_collection import StructureCollection
+from .sum_tree import SumTree
+
+
+def _frozen(value: Any) -> Hashable:
+    """Hashable form of a codelet target with the same notion of equality
+    as comparing the targets themselves."""
+    if isinstance(value, StructureCollection):
+        # empty structure sets hold a read-only mapping until written to
+        if isinstance(value.structures, Mapping):
+            return (
+                StructureCollection,
+                frozenset(
+                    (_frozen(k), _frozen(v)) for k, v in value.structures.items()
+                ),
+            )
+        return (list, tuple(_frozen(v) for v in value.structures))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_frozen(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((_frozen(k), _frozen(v)) for k, v in value.items()))
+    return value
 
 
 class Coderack:
@@ -53,7 +77,15 @@ class Coderack:
         self.hyper_parameters = hyper_parameters
         self.MAXIMUM_POPULATION = hyper_parameters.MAXIMUM_CODERACK_POPULATION
         self.MINIMUM_CODELET_URGENCY = hyper_parameters.MINIMUM_CODELET_URGENCY
-        self._codelets = []
+        self.SUM_TREE_SELECTION = hyper_parameters.SUM_TREE_CODELET_SELECTION
+        self._codelets = {}
+        self._codelets_by_targets = {}
+        self._meta_codelets = defaultdict(dict)
+        self._slots = []
+        self._slots_by_codelet = {}
+        self._free_slots = []
+        self._urgencies = SumTree()
+        self._occupancy = SumTree()
         self.recently_run = set()
         self.codelets_run = 0
         self.loggers = loggers
@@ -104,44 +136,131 @@ class Coderack:
     def population_size(self) -> int:
         return len(self._codelets)
 
+    def meta_codelet(self, name: str) -> Codelet:
+        """Returns the protected codelet of the named type currently on the
+        coderack or None if there isn't one."""
+        return next(iter(self._meta_codelets[name]), None)
+
+    def meta_codelets(self, *names: str) -> List[Codelet]:
+        return [codelet for name in names for codelet in self._meta_codelets[name]]
+
     def add_codelet(self, codelet: Codelet):
         if codelet.urgency < self.MINIMUM_CODELET_URGENCY:
             return
-        if not isinstance(codelet, self.PROTECTED_CODELET_TYPES):
-            for existing_codelet in self._codelets:
-                if isinstance(codelet, (Builder, Evaluator, Suggester)):
-                    if (
-                        type(codelet) == type(existing_codelet)
-                        and codelet.targets == existing_codelet.targets
-                    ):
-                        existing_codelet.urgency = FloatBetweenOneAndZero(
-                            existing_codelet.urgency + codelet.urgency
-                        )
-                        return
+        key = None
+        if isinstance(codelet, (Builder, Evaluator, Selector, Suggester)):
+            key = self._targets_key(codelet)
+            existing_codelet = self._find_duplicate(codelet, key)
+            if existing_codelet is not None:
                 if isinstance(codelet, Selector):
-                    if (
-                        type(codelet) == type(existing_codelet)
-                        and codelet.champions == existing_codelet.champions
-                        and codelet.challengers == existing_codelet.challengers
-                    ):
-                        existing_codelet.urgency = (
-                            existing_codelet.urgency + codelet.urgency
-                        )
-                        return
-        try:
-            coderack_cleaner = [
-                c for c in self._codelets if isinstance(c, CoderackCleaner)
-            ][0]
+                    existing_codelet.urgency = (
+                        existing_codelet.urgency + codelet.urgency
+                    )
+                else:
+                    existing_codelet.urgency = FloatBetweenOneAndZero(
+                        existing_codelet.urgency + codelet.urgency
+                    )
+                return
+        coderack_cleaner = self.meta_codelet("CoderackCleaner")
+        if coderack_cleaner is not None:
             coderack_cleaner.urgency = FloatBetweenOneAndZero(
                 self.population_size / self.MAXIMUM_POPULATION
             )
-        except IndexError:
-            pass
-        self._codelets.append(codelet)
+        self._codelets[codelet] = key
+        if key is not None:
+            self._codelets_by_targets[key] = codelet
+        if isinstance(codelet, self.PROTECTED_CODELET_TYPES):
+            self._meta_codelets[type(codelet).__name__][codelet] = True
+        if self.SUM_TREE_SELECTION:
+            self._add_to_slot(codelet)
 
     def remove_codelet(self, codelet: Codelet):
         if not isinstance(codelet, self.PROTECTED_CODELET_TYPES):
-            self._codelets.remove(codelet)
+            self._discard_codelet(codelet)
+
+    def _discard_codelet(self, codelet: Codelet):
+        key = self._codelets.pop(codelet)
+        if key is not None and self._codelets_by_targets.get(key) is codelet:
+            del self._codelets_by_targets[key]
+        if isinstance(codelet, self.PROTECTED_CODELET_TYPES):
+            self._meta_codelets[type(codelet).__name__].pop(codelet, None)
+        if self.SUM_TREE_SELECTION:
+            self._remove_from_slot(codelet)
+
+    def _add_to_slot(self, codelet: Codelet):
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slots[slot] = codelet
+            self._urgencies.update(slot, codelet.urgency)
+            self._occupancy.update(slot, 1)
+        else:
+            slot = self._urgencies.append(codelet.urgency)
+            self._occupancy.append(1)
+            self._slots.append(codelet)
+        self._slots_by_codelet[codelet] = slot
+        codelet._urgency_listener = self._update_urgency
+
+    def _remove_from_slot(self, codelet: Codelet):
+        codelet._urgency_listener = None
+        slot = self._slots_by_codelet.pop(codelet)
+        self._slots[slot] = None
+        self._urgencies.update(slot, 0.0)
+        self._occupancy.update(slot, 0)
+        self._free_slots.append(slot)
+        if len(self._free_slots) > max(len(self._codelets), 64):
+            self._compact_slots()
+
+    def _compact_slots(self):
+        self._slots = list(self._codelets)
+        self._slots_by_codelet = {
+            codelet: slot for slot, codelet in enumerate(self._slots)
+        }
+        self._free_slots = []
+        self._urgencies.rebuild(codelet.urgency for codelet in self._slots)
+        self._occupancy.rebuild(1 for _ in self._slots)
+
+    def _update_urgency(self, codelet: Codelet):
+        self._urgencies.update(self._slots_by_codelet[codelet], codelet.urgency)
+
+    @staticmethod
+    def _targets_key(codelet: Codelet) -> Hashable:
+        try:
+            if isinstance(codelet, Selector):
+                key = (
+                    type(codelet),
+                    _frozen(codelet.champions),
+                    _frozen(codelet.challengers),
+                )
+            else:
+                key = (type(codelet), _frozen(codelet.targets))
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
+    def _find_duplicate(self, codelet: Codelet, key: Hashable) -> Codelet:
+        if key is None:
+            for existing_codelet in self._codelets:
+                if self._is_duplicate(codelet, existing_codelet):
+                    return existing_codelet
+            return None
+        existing_codelet = self._codelets_by_targets.get(key)
+        if existing_codelet is not None and self._is_duplicate(
+            codelet, existing_codelet
+        ):
+            return existing_codelet
+        return None
+
+    @staticmethod
+    def _is_duplicate(codelet: Codelet, existing_codelet: Codelet) -> bool:
+        if type(codelet) != type(existing_codelet):
+            return False
+        if isinstance(codelet, Selector):
+            return (
+                codelet.champions == existing_codelet.champions
+                and codelet.challengers == existing_codelet.challengers
+            )
+        return codelet.targets == existing_codelet.targets
 
     def select_and_run_codelet(self):
         self.bubble_chamber.random_machine.codelets_run = self.codelets_run
@@ -178,12 +297,19 @@ class Coderack:
 
     def _select_a_codelet(self) -> Codelet:
         try:
-            codelet_choice = self.bubble_chamber.random_machine.select(
-                self._codelets, key=lambda x: x.urgency
-            )
+            if self.SUM_TREE_SELECTION:
+                codelet_choice = self._slots[
+                    self.bubble_chamber.random_machine.select_index(
+                        self._urgencies, self._occupancy
+                    )
+                ]
+            else:
+                codelet_choice = self.bubble_chamber.random_machine.select(
+                    self._codelets, key=lambda x: x.urgency
+                )
         except MissingStructureError:
             raise NoMoreCodelets
-        self._codelets.remove(codelet_choice)
+        self._discard_codelet(codelet_choice)
         return codelet_choice
 
     def _remove_a_codelet(self):
@@ -0,0 +1,261 @@
+from __future__ import annotations
+from typing import Dict
+
+from .id import ID
+from .structure_collections import StructureSet
+from .structures import Frame
+from .structures.nodes import Concept
+
+
+class FrameInstancePool:
+    """Keeps the frame instances of views removed by the garbage collector so
+    that view builders can reuse them instead of instantiating the same frame
+    again. At most size instances are kept for each frame and input space.
+
+    The state of every structure in an instance is recorded when the instance
+    is made and restored when it is taken from the pool. An instance is
+    dropped instead if any of its structures has since left the bubble
+    chamber, been linked to a structure outside the instance or been matched
+    by a view which is still in the bubble chamber.
+
+    Restored structures are given new ids, and restored frames new names, as
+    though they had just been instantiated, so that logs do not run the life
+    of the removed view's frame instance into that of the new one. Restored
+    frames are put back into the instances of the frames they came from."""
+
+    # attributes which are set back to their recorded values
+    RECORDED_ATTRIBUTES = (
+        "parent_concept",
+        "parent_space",
+        "conceptual_space",
+        "_non_slot_value",
+        "parent_view",
+        "is_stable",
+        "_activation",
+        "_activation_buffer",
+        "_quality",
+        "unchunkedness",
+        "unlabeledness",
+        "unrelatedness",
+        "uncorrespondedness",
+        "unhappiness",
+        "chunking_salience",
+        "labeling_salience",
+        "relating_salience",
+        "corresponding_salience",
+        "salience",
+    )
+    # structure sets which are given back their recorded members
+    RECORDED_SETS = (
+        "links_in",
+        "links_out",
+        "parent_spaces",
+        "champion_labels",
+        "champion_relations",
+        "instances",
+        "members",
+        "sub_chunks",
+        "super_chunks",
+        "left_branch",
+        "right_branch",
+        "possible_instances",
+        "contents",
+        "conceptual_spaces",
+        "sub_frames",
+        "concepts",
+        "cross_view_links",
+    )
+
+    def __init__(self, size: int):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._records = {}
+        self._instances = {}
+
+    def __len__(self):
+        return sum(len(instances) for instances in self._instances.values())
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests > 0 else 0.0
+
+    def instantiate(
+        self,
+        frame: Frame,
+        input_space: "ContextualSpace",
+        conceptual_spaces_map: dict,
+        parent_id: str,
+        bubble_chamber: "BubbleChamber",
+    ) -> Frame:
+        """Returns a pooled instance of frame if there is one which can be
+        reused, otherwise the result of frame.instantiate."""
+        if self.size == 0:
+            return frame.instantiate(
+                input_space=input_space,
+                conceptual_spaces_map=conceptual_spaces_map,
+                parent_id=parent_id,
+                bubble_chamber=bubble_chamber,
+            )
+        key = (frame, input_space, tuple(conceptual_spaces_map))
+        instances = self._instances.get(key, [])
+        while len(instances) > 0:
+            instance = instances.pop(0)
+            if self._restore(instance, parent_id, bubble_chamber):
+                self.hits += 1
+                return instance
+            self._records.pop(instance)
+        self.misses += 1
+        instance = frame.instantiate(
+            input_space=input_space,
+            conceptual_spaces_map=conceptual_spaces_map,
+            parent_id=parent_id,
+            bubble_chamber=bubble_chamber,
+        )
+        self._records[instance] = (key, self._record(instance))
+        return instance
+
+    def add(self, instance: Frame):
+        """Keeps the instance of a removed view if it was made by this pool and
+        there is room for it."""
+        if instance not in self._records:
+            return
+        key, _ = self._records[instance]
+        instances = self._instances.setdefault(key, [])
+        if len(instances) < self.size:
+            instances.append(instance)
+        else:
+            self._records.pop(instance)
+
+    def discard(self, instance: Frame):
+        """Forgets the record of an instance which will not be reused, unless it
+        is already waiting in the pool."""
+        if instance not in self._records:
+            return
+        key, _ = self._records[instance]
+        if instance not in self._instances.get(key, []):
+            self._records.pop(instance)
+
+    @staticmethod
+    def _structures(instance: Frame) -> Dict["Structure", bool]:
+        structures = {}
+        frames = [instance]
+        while len(frames) > 0:
+            frame = frames.pop(0)
+            structures[frame] = True
+            for space in (frame.input_space, frame.output_space):
+                structures[space] = True
+                for structure in space.contents:
+                    structures[structure] = True
+            for concept in frame.concepts:
+                structures[concept] = True
+                for relation in concept.links_out.where(is_relation=True):
+                    if relation.end in frame.concepts:
+                        structures[relation] = True
+            for link in frame.cross_view_links:
+                structures[link] = True
+            frames += list(frame.sub_frames)
+        return structures
+
+    def _record(self, instance: Frame) -> dict:
+        record = {}
+        for structure in self._structures(instance):
+            locations = []
+            for location in structure.locations:
+                try:
+                    coordinates = location.coordinates
+                except NotImplementedError:
+                    coordinates = (location.start_coordinates, location.end_coordinates)
+                locations.append((location, location.space, coordinates))
+            record[structure] = {
+                "locations": locations,
+                "attributes": {
+                    name: getattr(structure, name)
+                    for name in self.RECORDED_ATTRIBUTES
+                    if hasattr(structure, name)
+                },
+                "sets": {
+                    name: list(getattr(structure, name))
+                    for name in self.RECORDED_SETS
+                    if isinstance(getattr(structure, name, None), StructureSet)
+                },
+                "slot_values": dict(structure.slot_values)
+                if structure.is_frame
+                else None,
+            }
+        return record
+
+    def _can_restore(self, instance: Frame, bubble_chamber: "BubbleChamber") -> bool:
+        _, record = self._records[instance]
+        collections = bubble_chamber.collections
+        for structure, state in record.items():
+            # the instance itself was removed along with its view
+            if structure != instance and structure not in getattr(
+                bubble_chamber, collections[type(structure)]
+            ):
+                return False
+            for name in ("links_in", "links_out"):
+                if any(
+                    link not in state["sets"][name] for link in getattr(structure, name)
+                ):
+                    return False
+        for view in bubble_chamber.views:
+            for sub_frame, matched_frame in view.matched_sub_frames.items():
+                if sub_frame in record or matched_frame in record:
+                    return False
+        return True
+
+    def _restore(
+        self, instance: Frame, parent_id: str, bubble_chamber: "BubbleChamber"
+    ) -> bool:
+        if not self._can_restore(instance, bubble_chamber):
+            return False
+        _, record = self._records[instance]
+        collections = bubble_chamber.collections
+        # frames are taken out of every set which indexes them by name
+        # before they are renamed and given back afterwards
+        for structure, state in record.items():
+            getattr(bubble_chamber, collections[type(structure)]).remove(structure)
+            for space in structure.parent_spaces:
+                if space not in state["sets"]["parent_spaces"]:
+                    space.remove(structure)
+            if structure.is_frame:
+                structure.parent_frame.instances.remove(structure)
+                for sub_frame in list(structure.sub_frames):
+                    structure.sub_frames.remove(sub_frame)
+        previous_parent_id = instance.parent_id
+        for structure in record:
+            structure.structure_id = ID.new(
+                Concept if structure.is_concept else type(structure)
+            )
+            if structure.parent_id == previous_parent_id:
+                structure.parent_id = parent_id
+            if structure.is_frame:
+                structure.name = ID.new_frame_instance(structure.parent_frame.name)
+        for structure, state in record.items():
+            for location, space, coordinates in state["locations"]:
+                location.space = space
+                try:
+                    if location.coordinates is not coordinates:
+                        location.coordinates = coordinates
+                except NotImplementedError:
+                    location.start_coordinates, location.end_coordinates = coordinates
+            structure.locations = [location for location, _, _ in state["locations"]]
+            for name, value in state["attributes"].items():
+                if getattr(structure, name) is not value:
+                    setattr(structure, name, value)
+            for name, structures in state["sets"].items():
+                structure_set = getattr(structure, name)
+                if list(structure_set) != structures:
+                    for item in list(structure_set):
+                        structure_set.remove(item)
+                    for item in structures:
+                        structure_set.add(item)
+            if structure.is_frame:
+                structure.slot_values = dict(state["slot_values"])
+        for structure in record:
+            if structure.is_frame:
+                structure.parent_frame.instances.add(structure)
+            bubble_chamber.add(structure)
+        return True
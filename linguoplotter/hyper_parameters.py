@@ -17,9 +17,19 @@ class HyperParameters:
     MAXIMUM_CODERACK_POPULATION: int = 100
     MINIMUM_CODELET_URGENCY: float = 0.01
     NUMBER_OF_START_CHUNK_SUGGESTERS: int = 7
+    # select codelets with O(log n) weighted draws instead of sampling. This
+    # changes how codelets are chosen, not only how fast: a draw is in
+    # proportion to urgency with probability equal to determinism and uniform
+    # otherwise, whereas sampling picks the best of a sample whose size grows
+    # with determinism and is close to always picking the most urgent codelet
+    # when determinism is high
+    SUM_TREE_CODELET_SELECTION: bool = False
 
     DEFAULT_DISTANCE_TO_PROXIMITY_WEIGHT: int = 1
 
+    # frame instances of removed views kept for reuse per frame and input space
+    FRAME_INSTANCE_POOL_SIZE: int = 0
+
     ACTIVATION_UPDATE_FREQUENCY: int = 10
     ACTIVATION_UPDATE_COEFFICIENT: float = 0.5
     MINIMUM_ACTIVATION_UPDATE: float = 0.2
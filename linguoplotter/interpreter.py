@@ -1,9 +1,13 @@
 import math
+import os
+import pickle
+import re
 
 from . import classifiers
 from . import structures
 from .location import Location
 from .locations import TwoPointLocation
+from .raw_input import read_rows
 from .tools import (
     average_euclidean_distance,
     boolean_distance,
@@ -15,10 +19,23 @@ from .tools import (
 
 # strings can't contain spaces. '~' is used to represent a space
 
+# a token is a triple quoted string, which may contain anything, or else a
+# bracket or a run of characters which are neither whitespace nor brackets.
+# the last group only matches a triple quoted string which is never closed
+_TOKEN = re.compile(r'("{3}.*?"{3})|([()]|(?:[^\s()"]|"(?!""))+)|("{3})', re.S)
+
+# parse trees of files interpreted by this process, keyed by absolute path
+_PARSE_TREES = {}
+
 
 class Interpreter:
+    CACHE_DIRECTORY = "__lispcache__"
+    CACHE_FORMAT = 2
+
     def __init__(self, bubble_chamber):
         self.bubble_chamber = bubble_chamber
+        self.directories = []
+        self.loaded_files = set()
         self.names = {
             # Structure Types
             "Link": structures.Link,
@@ -60,8 +77,10 @@ class Interpreter:
             "def-correspondence": bubble_chamber.new_correspondence,
             "def-label": bubble_chamber.new_label,
             "def-relation": bubble_chamber.new_relation,
+            "load-raw-input": bubble_chamber.load_raw_input,
+            "load-raw-input-file": self.load_raw_input_file,
             # Other inbuilt classes and functions
-            "load": self.interpret_file,
+            "load": self.load_file,
             "eval": lambda *x: x[-1],
             "list": lambda *x: list(x),
             "tuple": lambda *x: tuple(x),
@@ -80,53 +99,38 @@ class Interpreter:
             "False": False,
         }
 
-    def parse(self, program: str) -> list:
+    def parse(self, program: str) -> tuple:
+        """Parse trees are nested tuples, so they can be cached and evaluated
+        any number of times."""
         program = f"(eval {program})"
         return self.read_from_tokens(self.tokenize(program))
 
     def tokenize(self, program: str) -> list:
-        tokens = [""]
-        in_big_string = False
-        i = 0
-        while i < len(program):
-            if (
-                i < len(program) - 2
-                and program[i] == program[i + 1] == program[i + 2] == '"'
-            ):
-                tokens[-1] += '"'
-                in_big_string = not in_big_string
-                i += 3
-            if in_big_string:
-                tokens[-1] += program[i]
-            elif program[i] == "(" or program[i] == ")":
-                if tokens[-1] == "":
-                    tokens[-1] += program[i]
-                else:
-                    tokens.append(program[i])
-                tokens.append("")
-            elif program[i].isspace():
-                if tokens[-1] != "":
-                    tokens.append("")
-            else:
-                tokens[-1] += program[i]
-            i += 1
-        if in_big_string:
-            raise SyntaxError("Unexpected EOF")
+        tokens = []
+        for big_string, token, unterminated_string in _TOKEN.findall(program):
+            if unterminated_string:
+                raise SyntaxError("Unexpected EOF")
+            tokens.append(big_string[2:-2] if big_string else token)
         return tokens
 
-    def read_from_tokens(self, tokens: list):
-        if len(tokens) == 0:
+    def read_from_tokens(self, tokens: list) -> tuple:
+        atoms = {}
+        expressions = [[]]
+        for token in tokens:
+            if token == "(":
+                expressions.append([])
+            elif token == ")":
+                if len(expressions) == 1:
+                    raise SyntaxError("Unexpected )")
+                expression = tuple(expressions.pop())
+                expressions[-1].append(expression)
+            else:
+                if token not in atoms:
+                    atoms[token] = self.atom(token)
+                expressions[-1].append(atoms[token])
+        if len(expressions) > 1 or len(expressions[0]) == 0:
             raise SyntaxError("Unexpected EOF")
-        token = tokens.pop(0)
-        if token == "(":
-            l = []
-            while tokens[0] != ")":
-                l.append(self.read_from_tokens(tokens))
-            tokens.pop(0)
-            return l
-        if token == ")":
-            raise SyntaxError("Unexpected )")
-        return self.atom(token)
+        return expressions[0][0]
 
     def atom(self, token: str):
         try:
@@ -145,19 +149,20 @@ class Interpreter:
         if isinstance(x, (float, int)):
             return x
         if x[0] == "define":
-            (_, symbol, exp) = x
+            _, symbol, exp = x
             self.names[symbol] = self.evaluate(exp)
         else:
-            procedure = self.evaluate(x.pop(0))
+            procedure = self.evaluate(x[0])
+            i = 1
             args = []
-            while len(x) > 0 and (isinstance(x[0], (float, int)) or x[0][0] != ":"):
-                args.append(self.evaluate(x.pop(0)))
+            while i < len(x) and (isinstance(x[i], (float, int)) or x[i][0] != ":"):
+                args.append(self.evaluate(x[i]))
+                i += 1
             kwargs = {}
-            while len(x) > 1:
-                key = x.pop(0)[1:]
-                value = x.pop(0)
-                kwargs[key] = self.evaluate(value)
-            if len(x) > 0:
+            while i < len(x) - 1:
+                kwargs[x[i][1:]] = self.evaluate(x[i + 1])
+                i += 2
+            if i < len(x):
                 raise SyntaxError("Positional argument after keyword argument.")
             return procedure(*args, **kwargs)
 
@@ -165,5 +170,70 @@ class Interpreter:
         return self.evaluate(self.parse(string))
 
     def interpret_file(self, file_name: str):
-        with open(file_name, "r") as f:
-            self.interpret_string(f.read())
+        """Files loaded from within a file are found relative to that file."""
+        file_name = self._resolve(file_name)
+        self.loaded_files.add(os.path.abspath(file_name))
+        self.directories.append(os.path.dirname(file_name))
+        try:
+            self.evaluate(self.parse_file(file_name))
+        finally:
+            self.directories.pop()
+
+    def parse_file(self, file_name: str) -> list:
+        """Parse trees are cached in memory and in a directory next to the file
+        and are reused for as long as the file's size and modification time are
+        unchanged."""
+        stat = os.stat(file_name)
+        key = (self.CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+        path = os.path.abspath(file_name)
+        if path in _PARSE_TREES and _PARSE_TREES[path][0] == key:
+            return _PARSE_TREES[path][1]
+        cache_file_name = os.path.join(
+            os.path.dirname(path),
+            self.CACHE_DIRECTORY,
+            os.path.basename(path) + ".pickle",
+        )
+        try:
+            with open(cache_file_name, "rb") as f:
+                cached_key, parse_tree = pickle.load(f)
+        except Exception:
+            cached_key, parse_tree = None, None
+        if cached_key != key:
+            with open(file_name, "r") as f:
+                parse_tree = self.parse(f.read())
+            self._write_cache(cache_file_name, key, parse_tree)
+        _PARSE_TREES[path] = (key, parse_tree)
+        return parse_tree
+
+    @staticmethod
+    def _write_cache(cache_file_name: str, key: tuple, parse_tree: list):
+        temporary_file_name = f"{cache_file_name}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(cache_file_name), exist_ok=True)
+            with open(temporary_file_name, "wb") as f:
+                pickle.dump((key, parse_tree), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_file_name, cache_file_name)
+        except OSError:
+            # the cache is an optimisation, so unwritable directories are ignored
+            pass
+
+    def load_file(self, file_name: str):
+        """Interprets a file unless it has already been interpreted, so that a
+        program can load a knowledge base which is already in place."""
+        file_name = os.path.abspath(self._resolve(file_name))
+        if file_name not in self.loaded_files:
+            self.interpret_file(file_name)
+
+    def load_raw_input_file(
+        self, file_name: str, input_space, conceptual_spaces: list
+    ) -> list:
+        """Adds a raw chunk to input_space for each row of a CSV or .npy file
+        found relative to the program."""
+        return self.bubble_chamber.load_raw_input(
+            read_rows(self._resolve(file_name)), input_space, conceptual_spaces
+        )
+
+    def _resolve(self, file_name: str) -> str:
+        if len(self.directories) > 0 and not os.path.isabs(file_name):
+            return os.path.join(self.directories[-1], file_name)
+        return file_name
@@ -47,6 +47,20 @@ class Linguoplotter:
         interpreter = Interpreter(bubble_chamber)
         return cls(bubble_chamber, coderack, interpreter, hyper_parameters, loggers)
 
+    def prepare_run(self, loggers: Dict[str, Logger], random_seed: int = None):
+        """Attaches new loggers and a new random seed to a narrator which has
+        interpreted its knowledge base but has not yet run. The structures
+        already in the bubble chamber are logged to the new structure logger."""
+        self.loggers = loggers
+        self.bubble_chamber.loggers = loggers
+        self.coderack.loggers = loggers
+        loggers["structure"].coderack = self.coderack
+        # the knowledge base was interpreted while other loggers were attached
+        if loggers["structure"].is_enabled:
+            for structure in self.bubble_chamber.structures:
+                loggers["structure"].log(structure)
+        self.bubble_chamber.random_machine.reseed(random_seed)
+
     def run_program(self, program: str):
         self.interpreter.interpret_string(program)
         return self.run()
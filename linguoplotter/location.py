@@ -1,14 +1,21 @@
 from __future__ import annotations
 import functools
 from typing import List
+import weakref
 
+from .revision import Revision
 from .tools import average_vector
 
 
 class Location:
+    MAXIMUM_REMEMBERED_DISTANCES = 256
+
     def __init__(self, coordinates: List[List[float]], space: "Space"):
         self._coordinates = coordinates
         self.space = space
+        self.version = 0
+        self.spatial_indexes = {}
+        self._distances = {}
 
     def __repr__(self):
         return f"({self.coordinates}, {self.space})"
@@ -20,6 +27,11 @@ class Location:
     @coordinates.setter
     def coordinates(self, c):
         self._coordinates = c
+        self.version += 1
+        Revision.bump_structure()
+        self._distances = {}
+        for spatial_index in list(self.spatial_indexes.values()):
+            spatial_index.relocate(self)
 
     @classmethod
     def average(cls, locations: List[Location]) -> Location:
@@ -46,11 +58,29 @@ class Location:
     def is_near(self, other: Location) -> bool:
         if self.space != other.space:
             return False
-        distance = self.space.parent_concept.distance_function(
-            self.coordinates, other.coordinates
-        )
+        distance = self.distance_to(other, self.space.parent_concept.distance_function)
         return distance <= 2 * self.space.parent_concept.distance_to_proximity_weight
 
+    def distance_to(
+        self, other: Location, distance_function: callable, return_nan: bool = False
+    ) -> float:
+        """Distances are remembered until the coordinates of either location are
+        set again. Other locations are only referred to weakly and the memo is
+        emptied when it is full, so it does not keep removed structures'
+        locations alive."""
+        key = (id(other), distance_function, return_nan)
+        if key in self._distances:
+            other_reference, version, distance = self._distances[key]
+            if other_reference() is other and version == other.version:
+                return distance
+        distance = distance_function(
+            self.coordinates, other.coordinates, return_nan=return_nan
+        )
+        if len(self._distances) >= self.MAXIMUM_REMEMBERED_DISTANCES:
+            self._distances = {}
+        self._distances[key] = (weakref.ref(other), other.version, distance)
+        return distance
+
     def copy(self) -> Location:
         return Location(
             [[c for c in coordinates_list] for coordinates_list in self.coordinates],
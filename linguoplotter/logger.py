@@ -2,5 +2,8 @@ from typing import Any
 
 
 class Logger:
+    # callers can skip building anything which is only needed for the log
+    is_enabled = True
+
     def log(self, item: Any):
         raise NotImplementedError
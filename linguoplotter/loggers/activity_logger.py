@@ -1,13 +1,18 @@
 import json
-import pathlib
 
 from linguoplotter.logger import Logger
 
 
 class ActivityLogger(Logger):
+    """Appends a JSON line for each codelet run to codelets_stream and a line of
+    time,id,offset,length to codelets_index_stream, giving the position in
+    bytes of the codelet's record so that it can be read on its own. Both
+    streams are flushed every FLUSH_FREQUENCY codelets."""
+
     def __init__(
         self,
-        codelets_directory: str,
+        codelets_stream,
+        codelets_index_stream=None,
         satisfaction_stream=None,
         determinism_stream=None,
         coderack_population_stream=None,
@@ -15,7 +20,8 @@ class ActivityLogger(Logger):
         codelet_spawned_stream=None,
         codelet_run_stream=None,
     ):
-        self.codelets_directory = codelets_directory
+        self.codelets_stream = codelets_stream
+        self.codelets_index_stream = codelets_index_stream
         self.satisfaction_stream = satisfaction_stream
         self.determinism_stream = determinism_stream
         self.coderack_population_stream = coderack_population_stream
@@ -25,11 +31,14 @@ class ActivityLogger(Logger):
         self.codelet = None
         self.codelet_json = None
         self.codelets_run = 0
-        self.log_files_count = 0
-        self.LOG_LENGTH = 1000
-        self.LINE_WIDTH = 120
+        self.codelets_offset = 0
+        self.FLUSH_FREQUENCY = 100
 
-    def log(self, message: str):
+    def log(self, message: str, *args):
+        """Any args are formatted into message here rather than by the caller so
+        that nothing is formatted when logging is disabled."""
+        if len(args) > 0:
+            message = message.format(*args)
         self.codelet_json["activity"].append(message)
         return self
 
@@ -55,9 +64,6 @@ class ActivityLogger(Logger):
         self.codelet = codelet
         self.codelets_run += 1
         self.codelet_json = {}
-        self.codelet_log_file = (
-            f"{self.codelets_directory}/times/{self.codelets_run}.json"
-        )
         self.codelet_json["id"] = self.codelet.codelet_id
         self.codelet_json["parent_id"] = self.codelet.parent_id
         self.codelet_json["targets"] = self.codelet.targets.__dict__()
@@ -67,10 +73,6 @@ class ActivityLogger(Logger):
         return self
 
     def log_codelet_end(self, coderack_population: int):
-        codelet_log_file = f"{self.codelets_directory}/times/{self.codelets_run}.json"
-        pathlib.Path(
-            f"{self.codelets_directory}/ids/{self.codelet.codelet_id}.json"
-        ).symlink_to(self.codelet_log_file)
         self.codelet_json["satisfaction"] = self.codelet.bubble_chamber.satisfaction
         self.codelet_json["coderack_population"] = coderack_population
         self.codelet_json["view_count"] = len(self.codelet.bubble_chamber.views)
@@ -93,13 +95,27 @@ class ActivityLogger(Logger):
             c.codelet_id for c in self.codelet.child_codelets
         ]
         self.codelet_json["result"] = self.codelet.result.name
-        with open(codelet_log_file, "w") as f:
-            json.dump(self.codelet_json, f, sort_keys=False, indent=4)
+        self._write_codelet_json()
         self._log_satisfaction()
         self._log_coderack_population(coderack_population)
         self._log_view_count(len(self.codelet.bubble_chamber.views))
         return self
 
+    def _write_codelet_json(self):
+        # ascii only, so that the length of the line is its length in bytes
+        line = json.dumps(self.codelet_json, ensure_ascii=True) + "\n"
+        self.codelets_stream.write(line)
+        if self.codelets_index_stream is not None:
+            self.codelets_index_stream.write(
+                f"{self.codelets_run},{self.codelet.codelet_id},"
+                + f"{self.codelets_offset},{len(line)}\n"
+            )
+        self.codelets_offset += len(line)
+        if self.codelets_run % self.FLUSH_FREQUENCY == 0:
+            self.codelets_stream.flush()
+            if self.codelets_index_stream is not None:
+                self.codelets_index_stream.flush()
+
     def _log_satisfaction(self):
         if self.satisfaction_stream is not None:
             self.satisfaction_stream.write(
@@ -3,7 +3,18 @@ from linguoplotter.logger import Logger
 
 
 class MockLogger(Logger):
-    def log(self, item: Any):
+    is_enabled = False
+
+    def log(self, item: Any, *args: Any):
+        return self
+
+    def log_dict(self, dictionary, name: str = None):
+        return self
+
+    def log_set(self, structure_set, name: str = None):
+        return self
+
+    def log_list(self, structure_list, name: str = None):
         return self
 
     def __getattr__(self, name: str):
@@ -1,27 +1,53 @@
 import json
-import os
 
 from linguoplotter.logger import Logger
 
 
 class StructureLogger(Logger):
-    def __init__(self, directory: str, coderack: "Coderack" = None):
-        self.directory = directory if directory[-1] != "/" else directory[:-1]
+    """Appends a JSON line to stream each time a structure changes, holding its
+    id, the number of codelets run and only the fields of its __dict__ which
+    changed since it was last logged, or all of them the first time.
+
+    A structure at time t is rebuilt by applying its lines up to t in order.
+    Fields a structure no longer has are listed under "removed". The fields
+    of a structure are only kept until it leaves the bubble chamber, so if it
+    is logged after that all of its fields are written again."""
+
+    def __init__(self, stream, coderack: "Coderack" = None):
+        self.stream = stream
         self.coderack = coderack
+        self.fields = {}
 
     def log(self, structure):
-        codelets_run = self.coderack.codelets_run
-        structures_directory = f"{self.directory}/structures"
-        directory = f"{structures_directory}/{structure.structure_id}"
-        try:
-            os.mkdir(structures_directory)
-        except FileExistsError:
-            pass
-        try:
-            os.mkdir(directory)
-        except FileExistsError:
-            pass
-        output_file_path = f"{directory}/{codelets_run}.json"
-        with open(output_file_path, "w") as f:
-            json.dump(structure.__dict__(), f, sort_keys=False, indent=4)
+        fields = {
+            name: json.dumps(value) for name, value in structure.__dict__().items()
+        }
+        previous_fields = self.fields.get(structure.structure_id)
+        self.fields[structure.structure_id] = fields
+        if previous_fields is None:
+            changes = fields
+            removed = []
+        else:
+            changes = {
+                name: value
+                for name, value in fields.items()
+                if previous_fields.get(name) != value
+            }
+            removed = [name for name in previous_fields if name not in fields]
+            if len(changes) == 0 and len(removed) == 0:
+                return self
+        line = (
+            f'{{"id": {json.dumps(structure.structure_id)}, '
+            + f'"time": {self.coderack.codelets_run}, "changes": {{'
+            + ", ".join(
+                f"{json.dumps(name)}: {value}" for name, value in changes.items()
+            )
+            + "}"
+        )
+        if len(removed) > 0:
+            line += f', "removed": {json.dumps(removed)}'
+        self.stream.write(line + "}\n")
         return self
+
+    def forget(self, structure):
+        self.fields.pop(structure.structure_id, None)
@@ -1,12 +1,37 @@
+from collections.abc import Sequence
 import math
 import random
+from typing import Iterable
 
 from .errors import MissingStructureError
 from .float_between_one_and_zero import FloatBetweenOneAndZero
 from .hyper_parameters import HyperParameters
+from .sum_tree import SumTree
 from .tools import generalized_mean
 
 
+class DistinctPairs(Sequence):
+    """The ordered pairs of distinct items in the order of
+    [(a, b) for a in items for b in items if a != b], worked out from their
+    index when looked up instead of being stored."""
+
+    def __init__(self, items: Iterable):
+        self.items = list(items)
+
+    def __len__(self) -> int:
+        return len(self.items) * (len(self.items) - 1)
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start, end = divmod(index, len(self.items) - 1)
+        if end >= start:
+            end += 1
+        return (self.items[start], self.items[end])
+
+
 class RandomMachine:
     def __init__(
         self,
@@ -17,8 +42,7 @@ class RandomMachine:
         self.bubble_chamber = bubble_chamber
         self.hyper_parameters = hyper_parameters
         self.seed = seed
-        if seed is not None:
-            random.seed(seed)
+        self.generator = random.Random(seed)
         self.codelets_run = 0
         self.determinism = 0
         self.randomness = 1
@@ -35,6 +59,10 @@ class RandomMachine:
         self.MINIMUM_DETERMINISM = hyper_parameters.MINIMUM_DETERMINISM
         self.MAXIMUM_DETERMINISM = hyper_parameters.MAXIMUM_DETERMINISM
 
+    def reseed(self, seed: int = None):
+        self.seed = seed
+        self.generator = random.Random(seed)
+
     def recalculate_determinism(self) -> FloatBetweenOneAndZero:
         codelets_since_successful_focus_unset = (
             self.codelets_run - self.bubble_chamber.time_of_last_successful_focus_unset
@@ -56,41 +84,59 @@ class RandomMachine:
         if minimum > 1:
             raise Exception("Minimum should be lower than 1")
         if minimum == 0.0:
-            return random.random()
-        return (minimum / 1) * random.random() + minimum
+            return self.generator.random()
+        return (minimum / 1) * self.generator.random() + minimum
+
+    def generate_numbers(self, n: int, minimum: float = 0.0) -> list:
+        """Returns the same numbers as n calls to generate_number."""
+        if minimum > 1:
+            raise Exception("Minimum should be lower than 1")
+        random_number = self.generator.random
+        if minimum == 0.0:
+            return [random_number() for _ in range(n)]
+        return [(minimum / 1) * random_number() + minimum for _ in range(n)]
 
     def coin_flip(self) -> bool:
         return self.generate_number() > 0.5
 
     def randomize_number(self, number: FloatBetweenOneAndZero):
-        return number * self.determinism + random.random() * self.randomness
+        return number * self.determinism + self.generator.random() * self.randomness
 
     def select(
         self,
-        collection: dict,
+        collection: Iterable,
         key: callable = lambda x: 0,
         exclude: list = None,
         verbose: bool = False,
     ):
-        exclude = [] if exclude is None else exclude
-        for element in exclude:
-            if element in collection:
-                collection.pop(element)
-        if len(collection) < 1:
+        """Selects an item from a sample of the collection by its key weighted by
+        determinism and a random number weighted by randomness. Neither the
+        collection nor exclude is changed. Keys are only worked out when
+        determinism is above zero, so they should not have side effects."""
+        population = (
+            collection if isinstance(collection, Sequence) else list(collection)
+        )
+        if exclude:
+            population = [item for item in population if item not in exclude]
+        if len(population) < 1:
             raise MissingStructureError
-        if len(collection) == 1:
-            for item in collection:
-                return item
+        if len(population) == 1:
+            return population[0]
         sample_size = min(
-            math.ceil(len(collection) * self.determinism) + 1,
-            len(collection),
+            math.ceil(len(population) * self.determinism) + 1,
+            len(population),
         )
-        sample = random.sample(list(collection), sample_size)
-        key_weights = [key(item) for item in sample]
-        random_weights = [self.generate_number() for item in sample]
+        # sampling a sequence only looks up the items it picks when the sample
+        # is small compared to the collection
+        sample = self.generator.sample(population, sample_size)
+        if self.determinism == 0:
+            key_weights = [0] * sample_size
+        else:
+            key_weights = [key(item) for item in sample]
+        random_weights = self.generate_numbers(sample_size)
         highest_weight = 0
         index_of_highest_weight = 0
-        for i in range(len(sample)):
+        for i in range(sample_size):
             weight = (
                 key_weights[i] * self.determinism + random_weights[i] * self.randomness
             )
@@ -101,3 +147,21 @@ class RandomMachine:
                 index_of_highest_weight = i
 
         return sample[index_of_highest_weight]
+
+    def select_pair(self, items: Iterable, key: callable = lambda x: 0) -> tuple:
+        """Selects an ordered pair of distinct items exactly as select would
+        from the list of every such pair, without building that list."""
+        return self.select(DistinctPairs(items), key=key)
+
+    def select_index(self, weights: SumTree, occupancy: SumTree) -> int:
+        """Draws an occupied index in proportion to its weight with probability
+        equal to determinism and uniformly with probability equal to randomness.
+        Unlike select, which takes the best of a sample, this does not come
+        close to always choosing the heaviest index as determinism rises."""
+        if occupancy.total < 1:
+            raise MissingStructureError
+        if weights.total > 0 and self.generator.random() >= self.randomness:
+            index = weights.find(self.generator.random() * weights.total)
+            if occupancy[index] > 0:
+                return index
+        return occupancy.find(self.generator.random() * occupancy.total)
@@ -0,0 +1,21 @@
+import os
+from typing import List
+
+import numpy
+
+
+def read_rows(file_name: str) -> List[List[float]]:
+    """Reads the rows of coordinates of a raw input from a .npy file, which is
+    memory mapped, or from a CSV file with a header row. Columns which only
+    hold whole numbers are read as integers, as they would be in a program."""
+    if os.path.splitext(file_name)[1] == ".npy":
+        array = numpy.load(file_name, mmap_mode="r")
+    else:
+        array = numpy.loadtxt(file_name, delimiter=",", skiprows=1, ndmin=2)
+    if array.ndim != 2:
+        raise ValueError(f"{file_name} does not hold a table of coordinates")
+    columns = [
+        column.astype(int) if numpy.all(numpy.mod(column, 1) == 0) else column
+        for column in array.T
+    ]
+    return [list(row) for row in zip(*[column.tolist() for column in columns])]
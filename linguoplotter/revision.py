@@ -0,0 +1,23 @@
+class Revision:
+    """Counts changes to structures and the sets that hold them, so that values
+    derived from the workspace can be reused until something changes.
+
+    STRUCTURE only counts changes to sets, parent spaces and concepts and the
+    coordinates of locations, which are all that classifications depend on."""
+
+    COUNT = 0
+    STRUCTURE = 0
+
+    @classmethod
+    def reset(cls):
+        cls.COUNT = 0
+        cls.STRUCTURE = 0
+
+    @classmethod
+    def bump(cls):
+        cls.COUNT += 1
+
+    @classmethod
+    def bump_structure(cls):
+        cls.COUNT += 1
+        cls.STRUCTURE += 1
@@ -0,0 +1,136 @@
+import itertools
+import math
+from typing import Iterable, List, Union
+
+from .errors import NoLocationError
+from .location import Location
+from .tools import (
+    area_euclidean_distance,
+    average_euclidean_distance,
+    boolean_distance,
+    centroid_euclidean_distance,
+    shortest_distance,
+)
+
+
+class SpatialIndex:
+    """A grid over the locations in one conceptual space of the structures in a
+    set, used to find the structures which might be near a location without
+    measuring the distance to every one of them.
+
+    Each location is placed on the grid by its points and its centroid. For the
+    distance functions below two locations can only be near if one of those
+    keys of each is within the proximity radius of the other, so a query only
+    looks at the cells around its own keys. Structures with any other kind of
+    location are candidates for every query."""
+
+    # distance functions which are never less than the shortest distance
+    # between the keys of two locations
+    DISTANCE_FUNCTIONS = (
+        area_euclidean_distance,
+        average_euclidean_distance,
+        boolean_distance,
+        centroid_euclidean_distance,
+        shortest_distance,
+    )
+
+    def __init__(self, space: "ConceptualSpace", structures: Iterable = ()):
+        self.space = space
+        self.radius = self._radius()
+        self.dimensions = space.no_of_dimensions
+        # cells are slightly larger than the radius so that rounding can never
+        # put near points more than one cell apart
+        self.cell_size = self.radius * (1 + 1e-6)
+        self._cells = {}
+        self._cells_of = {}
+        self._unplaced = {}
+        self._location_of = {}
+        self._structures_at = {}
+        for structure in structures:
+            self.add(structure)
+
+    @property
+    def is_usable(self) -> bool:
+        return (
+            self.space.parent_concept.distance_function in self.DISTANCE_FUNCTIONS
+            and self.dimensions in (1, 2, 3)
+            and 0 < self.radius < math.inf
+            and self._radius() == self.radius
+        )
+
+    def _radius(self) -> float:
+        return 2 * self.space.parent_concept.distance_to_proximity_weight
+
+    def add(self, structure: "Structure"):
+        try:
+            location = structure.location_in_space(self.space)
+        except NoLocationError:
+            self._unplaced[structure] = True
+            return
+        keys = self._keys(location)
+        if keys is None:
+            self._unplaced[structure] = True
+        else:
+            cells = {self._cell(key) for key in keys}
+            for cell in cells:
+                self._cells.setdefault(cell, {})[structure] = True
+            self._cells_of[structure] = cells
+        self._location_of[structure] = location
+        self._structures_at.setdefault(id(location), {})[structure] = True
+        location.spatial_indexes[id(self)] = self
+
+    def remove(self, structure: "Structure"):
+        self._unplaced.pop(structure, None)
+        for cell in self._cells_of.pop(structure, ()):
+            self._cells[cell].pop(structure)
+            if len(self._cells[cell]) == 0:
+                self._cells.pop(cell)
+        location = self._location_of.pop(structure, None)
+        if location is None:
+            return
+        structures = self._structures_at[id(location)]
+        structures.pop(structure)
+        if len(structures) == 0:
+            self._structures_at.pop(id(location))
+            location.spatial_indexes.pop(id(self), None)
+
+    def relocate(self, location: Location):
+        """Called when the coordinates of a location on the grid change."""
+        for structure in list(self._structures_at.get(id(location), {})):
+            self.remove(structure)
+            self.add(structure)
+
+    def candidates(self, location: Location) -> Union[set, None]:
+        """Returns the structures which might be near location or None if the
+        grid cannot tell."""
+        keys = self._keys(location)
+        if keys is None:
+            return None
+        candidates = set(self._unplaced)
+        offsets = list(itertools.product((-1, 0, 1), repeat=self.dimensions))
+        for key in keys:
+            cell = self._cell(key)
+            for offset in offsets:
+                neighbour = tuple(c + o for c, o in zip(cell, offset))
+                candidates.update(self._cells.get(neighbour, ()))
+        return candidates
+
+    def _cell(self, key: List[float]) -> tuple:
+        return tuple(math.floor(coordinate / self.cell_size) for coordinate in key)
+
+    def _keys(self, location: Location) -> Union[List[List[float]], None]:
+        if type(location) is not Location or location.space != self.space:
+            return None
+        points = location.coordinates
+        if len(points) == 0:
+            return None
+        for point in points:
+            if len(point) != self.dimensions:
+                return None
+            for coordinate in point:
+                if not isinstance(coordinate, (int, float)) or not math.isfinite(
+                    coordinate
+                ):
+                    return None
+        centroid = [sum(values) / len(points) for values in zip(*points)]
+        return points + [centroid]
@@ -7,10 +7,66 @@ from .errors import MissingStructureError, NoLocationError
 from .float_between_one_and_zero import FloatBetweenOneAndZero
 from .hyper_parameters import HyperParameters
 from .location import Location
+from .revision import Revision
 from .structure_collections import StructureSet
 
 
 class Structure(ABC):
+    """Subclasses other than frames declare their attributes in __slots__ so
+    that structures have no instance dictionary. Flags saying what kind of
+    structure something is are class attributes which subclasses override, and
+    hyper-parameters are read from the bubble chamber's HyperParameters."""
+
+    is_node = False
+    is_concept = False
+    is_compound_concept = False
+    is_chunk = False
+    is_letter_chunk = False
+    is_link = False
+    is_correspondence = False
+    is_label = False
+    is_cross_view = False
+    is_relation = False
+    is_view = False
+    is_space = False
+    is_conceptual_space = False
+    is_contextual_space = False
+    is_frame = False
+    is_merged_frame = False
+    is_sub_frame = False
+    is_template = False
+
+    __slots__ = (
+        "structure_id",
+        "parent_id",
+        "_locations",
+        "_quality",
+        "links_in",
+        "links_out",
+        "parent_spaces",
+        "champion_labels",
+        "champion_relations",
+        "instances",
+        "_activation",
+        "is_stable",
+        "_depth",
+        "_activation_buffer",
+        "_parent_space",
+        "_parent_concept",
+        "indexing_sets",
+        "unchunkedness",
+        "unlabeledness",
+        "unrelatedness",
+        "uncorrespondedness",
+        "unhappiness",
+        "chunking_salience",
+        "labeling_salience",
+        "relating_salience",
+        "corresponding_salience",
+        "salience",
+        "hyper_parameters",
+    )
+
     def __init__(
         self,
         structure_id: str,
@@ -38,6 +94,7 @@ class Structure(ABC):
         self._activation_buffer = 0.0
         self._parent_space = None
         self._parent_concept = None
+        self.indexing_sets = {}
 
         self.unchunkedness = 1.0
         self.unlabeledness = 1.0
@@ -51,32 +108,7 @@ class Structure(ABC):
         self.corresponding_salience = 0.5
         self.salience = 0.5
 
-        self.is_node = False
-        self.is_concept = False
-        self.is_compound_concept = False
-        self.is_chunk = False
-        self.is_letter_chunk = False
-        self.is_link = False
-        self.is_correspondence = False
-        self.is_label = False
-        self.is_cross_view = False
-        self.is_relation = False
-        self.is_view = False
-        self.is_space = False
-        self.is_conceptual_space = False
-        self.is_contextual_space = False
-        self.is_frame = False
-        self.is_merged_frame = False
-        self.is_sub_frame = False
-        self.is_template = False
-
         self.hyper_parameters = None
-        self.FLOATING_POINT_TOLERANCE = None
-        self.MINIMUM_ACTIVATION_UPDATE = None
-        self.ACTIVATION_UPDATE_COEFFICIENT = None
-        self.DECAY_RATE = None
-        self.RELATIVES_ACTIVATION_WEIGHT = None
-        self.INSTANCES_ACTIVATION_WEIGHT = None
 
     @classmethod
     def get_builder_class(cls):
@@ -90,10 +122,41 @@ class Structure(ABC):
     def get_selector_class(cls):
         raise NotImplementedError
 
+    @property
+    def FLOATING_POINT_TOLERANCE(self) -> float:
+        return self.hyper_parameters.FLOATING_POINT_TOLERANCE
+
+    @property
+    def MINIMUM_ACTIVATION_UPDATE(self) -> float:
+        return self.hyper_parameters.MINIMUM_ACTIVATION_UPDATE
+
+    @property
+    def ACTIVATION_UPDATE_COEFFICIENT(self) -> float:
+        return self.hyper_parameters.ACTIVATION_UPDATE_COEFFICIENT
+
+    @property
+    def DECAY_RATE(self) -> float:
+        return self.hyper_parameters.DECAY_RATE
+
+    @property
+    def RELATIVES_ACTIVATION_WEIGHT(self) -> float:
+        return self.hyper_parameters.ACTIVATION_UPDATE_RELATIVES_WEIGHT
+
+    @property
+    def INSTANCES_ACTIVATION_WEIGHT(self) -> float:
+        return self.hyper_parameters.ACTIVATION_UPDATE_INSTANCES_WEIGHT
+
     @property
     def parent_space(self) -> Structure:
         return self._parent_space
 
+    @parent_space.setter
+    def parent_space(self, space: Structure):
+        self._parent_space = space
+        Revision.bump_structure()
+        for structure_set in list(self.indexing_sets.values()):
+            structure_set.reindex(self, "parent_space")
+
     @property
     def parent_space_location(self) -> Location:
         return self.location_in_space(self.parent_space)
@@ -102,6 +165,13 @@ class Structure(ABC):
     def parent_concept(self) -> Structure:
         return self._parent_concept
 
+    @parent_concept.setter
+    def parent_concept(self, concept: Structure):
+        self._parent_concept = concept
+        Revision.bump_structure()
+        for structure_set in list(self.indexing_sets.values()):
+            structure_set.reindex(self, "parent_concept")
+
     @property
     def location(self) -> Location:
         if len(self._locations) == 0:
@@ -195,6 +265,8 @@ class Structure(ABC):
 
     @quality.setter
     def quality(self, q: FloatBetweenOneAndZero):
+        if q != self._quality:
+            Revision.bump()
         self._quality = q
 
     @property
@@ -203,6 +275,8 @@ class Structure(ABC):
 
     @activation.setter
     def activation(self, a: FloatBetweenOneAndZero):
+        if a != self._activation:
+            Revision.bump()
         self._activation = a
 
     def recalculate_unhappiness(self):
@@ -434,11 +508,15 @@ class Structure(ABC):
     def activate(self):
         if self.is_stable:
             return
+        if self._activation != 1.0:
+            Revision.bump()
         self._activation = 1.0
 
     def deactivate(self):
         if self.is_stable:
             return
+        if self._activation != 0.0:
+            Revision.bump()
         self._activation = 0.0
 
     def spread_activation(self):
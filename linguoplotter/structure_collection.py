@@ -6,6 +6,8 @@ from .location import Location
 
 
 class StructureCollection:
+    __slots__ = ("bubble_chamber", "structures", "name")
+
     def __init__(
         self, bubble_chamber: "BubbleChamber", structures: Collection, name: str = None
     ):
@@ -29,6 +31,13 @@ class StructureCollection:
     def __ne__(self, other: StructureCollection) -> bool:
         return not self == other
 
+    def __contains__(self, structure) -> bool:
+        try:
+            return structure in self.structures
+        except TypeError:
+            # unhashable objects cannot be in a collection held in a dict
+            return False
+
     def __iter__(self):
         return (structure for structure in self.structures)
 
@@ -98,6 +107,4 @@ class StructureCollection:
         )
 
     def get(self, key: callable = lambda x: 0, exclude: list = None):
-        return self.bubble_chamber.random_machine.select(
-            {structure: True for structure in self.structures}, key, exclude
-        )
+        return self.bubble_chamber.random_machine.select(self.structures, key, exclude)
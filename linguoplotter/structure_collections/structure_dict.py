@@ -32,7 +32,7 @@ class StructureDict(StructureCollection):
         self.structures[name] = structure
         if self.name != None:
             self.bubble_chamber.loggers["activity"].log(
-                f"{self.name} {name} set to {structure}"
+                "{} {} set to {}", self.name, name, structure
             )
 
     def items(self):
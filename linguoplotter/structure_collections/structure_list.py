@@ -30,7 +30,7 @@ class StructureList(StructureCollection):
         self.structures[index] = structure
         if self.name != None:
             self.bubble_chamber.loggers["activity"].log(
-                f"Index {index} of {self.name} set to {structure}"
+                "Index {} of {} set to {}", index, self.name, structure
             )
 
     def values(self):
@@ -1,19 +1,84 @@
 from __future__ import annotations
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Union
 
+from linguoplotter.location import Location
+from linguoplotter.revision import Revision
+from linguoplotter.spatial_index import SpatialIndex
 from linguoplotter.structure_collection import StructureCollection
 
 
+# most sets a structure owns stay empty for its whole life, so empty sets share
+# one read-only mapping until something is added to them
+NO_STRUCTURES = MappingProxyType({})
+# only indexed sets have indexes
+NO_INDEXES = MappingProxyType({})
+
+
 class StructureSet(StructureCollection):
+    __slots__ = (
+        "structures_by_name",
+        "version",
+        "is_indexed",
+        "_indexes",
+        "_indexed_values",
+        "_unordered_buckets",
+        "_positions",
+        "_next_position",
+        "_spatial_indexes",
+    )
+    # attributes that never change after a structure is created
+    INDEXABLE_FLAGS = (
+        "is_node",
+        "is_concept",
+        "is_compound_concept",
+        "is_chunk",
+        "is_letter_chunk",
+        "is_raw",
+        "is_link",
+        "is_correspondence",
+        "is_label",
+        "is_cross_view",
+        "is_relation",
+        "is_view",
+        "is_space",
+        "is_conceptual_space",
+        "is_contextual_space",
+        "is_main_input",
+        "is_frame",
+    )
+    # attributes whose setters call StructureSet.reindex
+    INDEXABLE_LINKS = ("parent_concept", "parent_space")
+
     def __init__(
         self,
         bubble_chamber: "BubbleChamber",
         structures: Dict["Structure", bool],
         name: str = None,
+        indexed: bool = False,
     ):
         structures = {structure: True for structure in structures}
+        if len(structures) == 0:
+            structures = NO_STRUCTURES
         StructureCollection.__init__(self, bubble_chamber, structures, name=name)
         self.structures_by_name = None
+        self.version = 0
+        self.is_indexed = indexed
+        self._next_position = 0
+        if not indexed:
+            self._indexes = NO_INDEXES
+            self._indexed_values = NO_INDEXES
+            self._unordered_buckets = frozenset()
+            self._positions = NO_INDEXES
+            self._spatial_indexes = NO_INDEXES
+        else:
+            self._indexes = {}
+            self._indexed_values = {}
+            self._unordered_buckets = set()
+            self._positions = {}
+            self._spatial_indexes = {}
+            for structure in self.structures:
+                self._register(structure)
 
     @staticmethod
     def union(*structure_sets: List[StructureSet]) -> StructureSet:
@@ -67,30 +132,185 @@ class StructureSet(StructureCollection):
     def sample(
         self, size: int, key: callable = lambda x: 0, exclude: list = None
     ) -> StructureSet:
-        exclude = [] if exclude is None else exclude
-        sample_set = StructureSet(self.bubble_chamber, [])
+        exclude = [] if exclude is None else list(exclude)
+        sample = []
         for _ in range(size):
             item = self.get(key, exclude)
             exclude.append(item)
-            sample_set.add(item)
-        return sample_set
+            sample.append(item)
+        return StructureSet(self.bubble_chamber, sample)
+
+    def where(self, **kwargs) -> StructureSet:
+        if not self.is_indexed:
+            return StructureCollection.where(self, **kwargs)
+        candidates = None
+        try:
+            for key, value in kwargs.items():
+                if key in self.INDEXABLE_FLAGS or key in self.INDEXABLE_LINKS:
+                    bucket = self._bucket(key, value)
+                    if candidates is None or len(bucket) < len(candidates):
+                        candidates = bucket
+        except TypeError:
+            candidates = None
+        if candidates is None:
+            return StructureCollection.where(self, **kwargs)
+        return StructureSet(
+            self.bubble_chamber,
+            [
+                structure
+                for structure in candidates
+                if all(
+                    hasattr(structure, key) and getattr(structure, key) == value
+                    for key, value in kwargs.items()
+                )
+            ],
+        )
+
+    def near(self, location: Location, **kwargs) -> StructureSet:
+        """Returns the structures near location which have the attribute values
+        given in kwargs."""
+        return StructureSet.intersection_near((self, location), **kwargs)
+
+    @staticmethod
+    def intersection_near(
+        *queries: Tuple[StructureSet, Location], **kwargs
+    ) -> StructureSet:
+        """Equivalent to the intersection of structure_set.near(location, **kwargs)
+        for each query. If every set is indexed, distances are only measured for
+        the structures which the spatial indexes find near every location."""
+        candidates = [
+            structure_set._near_candidates(location)
+            for structure_set, location in queries
+        ]
+        if any(query_candidates is None for query_candidates in candidates):
+            return StructureSet.intersection(
+                *[
+                    StructureCollection.near(structure_set.where(**kwargs), location)
+                    for structure_set, location in queries
+                ]
+            )
+        first_set = queries[0][0]
+        return StructureSet(
+            first_set.bubble_chamber,
+            sorted(
+                [
+                    structure
+                    for structure in min(candidates, key=len)
+                    if all(
+                        hasattr(structure, key) and getattr(structure, key) == value
+                        for key, value in kwargs.items()
+                    )
+                    and all(
+                        structure in query_candidates
+                        and structure.location_in_space(location.space).is_near(
+                            location
+                        )
+                        for (_, location), query_candidates in zip(queries, candidates)
+                    )
+                ],
+                key=first_set._positions.__getitem__,
+            ),
+        )
+
+    def _near_candidates(self, location: Location) -> Union[set, None]:
+        if not self.is_indexed or not location.space.is_conceptual_space:
+            return None
+        if location.space not in self._spatial_indexes:
+            self._spatial_indexes[location.space] = SpatialIndex(
+                location.space, self.structures
+            )
+        spatial_index = self._spatial_indexes[location.space]
+        if not spatial_index.is_usable:
+            return None
+        return spatial_index.candidates(location)
+
+    def reindex(self, structure, attribute: str):
+        """Moves structure to the right bucket of an index after a change to
+        one of its indexed attributes."""
+        if attribute not in self._indexes or structure not in self.structures:
+            return
+        self._unindex(structure, attribute)
+        self._index(structure, attribute)
+        self._unordered_buckets.add(
+            (attribute, self._indexed_values[attribute][structure])
+        )
+
+    def _bucket(self, attribute: str, value) -> dict:
+        if attribute not in self._indexes:
+            self._indexes[attribute] = {}
+            self._indexed_values[attribute] = {}
+            for structure in self.structures:
+                self._index(structure, attribute)
+        bucket = self._indexes[attribute].get(value, {})
+        if (attribute, value) in self._unordered_buckets:
+            bucket = {
+                structure: True
+                for structure in sorted(bucket, key=self._positions.__getitem__)
+            }
+            self._indexes[attribute][value] = bucket
+            self._unordered_buckets.discard((attribute, value))
+        return bucket
+
+    def _index(self, structure, attribute: str):
+        if not hasattr(structure, attribute):
+            return
+        value = getattr(structure, attribute)
+        self._indexes[attribute].setdefault(value, {})[structure] = True
+        self._indexed_values[attribute][structure] = value
+
+    def _unindex(self, structure, attribute: str):
+        if structure not in self._indexed_values[attribute]:
+            return
+        value = self._indexed_values[attribute].pop(structure)
+        self._indexes[attribute][value].pop(structure)
+
+    def _register(self, structure):
+        self._positions[structure] = self._next_position
+        self._next_position += 1
+        for attribute in self._indexes:
+            self._index(structure, attribute)
+        for spatial_index in self._spatial_indexes.values():
+            spatial_index.add(structure)
+        if hasattr(structure, "indexing_sets"):
+            structure.indexing_sets[id(self)] = self
+
+    def _deregister(self, structure):
+        self._positions.pop(structure)
+        for attribute in self._indexes:
+            self._unindex(structure, attribute)
+        for spatial_index in self._spatial_indexes.values():
+            spatial_index.remove(structure)
+        if hasattr(structure, "indexing_sets"):
+            structure.indexing_sets.pop(id(self), None)
 
     def add(self, structure):
-        self.structures[structure] = True
+        if structure not in self.structures:
+            self.version += 1
+            Revision.bump_structure()
+            if self.is_indexed:
+                self._register(structure)
+            if self.structures is NO_STRUCTURES:
+                self.structures = {}
+            self.structures[structure] = True
         if self.structures_by_name is not None and hasattr(structure, "name"):
             self.structures_by_name[structure.name] = structure
         if self.name != None:
             self.bubble_chamber.loggers["activity"].log(
-                f"{structure} added to {self.name}"
+                "{} added to {}", structure, self.name
             )
 
     def remove(self, structure):
-        self.structures.pop(structure, None)
+        if structure in self.structures:
+            self.version += 1
+            Revision.bump_structure()
+            if self.is_indexed:
+                self._deregister(structure)
+            self.structures.pop(structure)
         if self.structures_by_name is not None and hasattr(structure, "name"):
             self.structures_by_name.pop(structure.name, None)
         if self.name != None:
             self.bubble_chamber.loggers["activity"].log(
-                f"{structure} removed from {self.name}"
+                "{} removed from {}", structure, self.name
             )
 
     def pop(self):
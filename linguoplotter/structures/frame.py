@@ -10,6 +10,9 @@ from linguoplotter.structure_collections import StructureSet
 
 
 class Frame(Structure):
+    is_frame = True
+    # frames have no __slots__ so that programs can set their own attributes
+
     def __init__(
         self,
         structure_id: str,
@@ -57,7 +60,6 @@ class Frame(Structure):
         self.instances = instances
         self._depth = depth
         self.is_sub_frame = is_sub_frame
-        self.is_frame = True
         self.parent_view = None
 
     def __dict__(self) -> dict:
@@ -311,7 +313,7 @@ class Frame(Structure):
                         end=concept_copies[relation.end],
                     )
                     if relation.parent_concept.is_slot:
-                        new_relation._parent_concept = concept_copies[
+                        new_relation.parent_concept = concept_copies[
                             relation.parent_concept
                         ]
                     concept_copies[relation.start].links_out.add(new_relation)
@@ -325,13 +327,13 @@ class Frame(Structure):
         )
         for structure in input_space_copy.contents.where(is_link=True):
             if structure.parent_concept in concept_copies:
-                structure._parent_concept = concept_copies[structure.parent_concept]
+                structure.parent_concept = concept_copies[structure.parent_concept]
         output_space_copy, output_copies = output_space.copy(
             bubble_chamber=bubble_chamber, parent_id=parent_id, copies=output_copies
         )
         for structure in output_space_copy.contents.where(is_link=True):
             if structure.parent_concept in concept_copies:
-                structure._parent_concept = concept_copies[structure.parent_concept]
+                structure.parent_concept = concept_copies[structure.parent_concept]
         sub_frames = bubble_chamber.new_set()
         space_copies = {input_space: input_space_copy, output_space: output_space_copy}
         copies_map = {}
@@ -358,13 +360,13 @@ class Frame(Structure):
                 if original.is_node:
                     copy.parent_space = space_copies[original.parent_space]
                 elif original.is_label or original.is_relation:
-                    copy._parent_space = space_copies[original.parent_space]
+                    copy.parent_space = space_copies[original.parent_space]
         for original, copy in output_copies.items():
             if original.parent_space in space_copies:
                 if original.is_node:
                     copy.parent_space = space_copies[original.parent_space]
                 elif original.is_label or original.is_relation:
-                    copy._parent_space = space_copies[original.parent_space]
+                    copy.parent_space = space_copies[original.parent_space]
         cross_view_links = bubble_chamber.new_set()
         cross_view_link_copies = {}
         for relation in self.cross_view_links.where(is_relation=True):
@@ -378,7 +380,7 @@ class Frame(Structure):
                 else output_copies[relation.end],
             )
             if relation.parent_concept in concept_copies:
-                relation_copy._parent_concept = concept_copies[relation.parent_concept]
+                relation_copy.parent_concept = concept_copies[relation.parent_concept]
             cross_view_links.add(relation_copy)
             cross_view_link_copies[relation] = relation_copy
             for location in relation_copy.locations:
@@ -395,7 +397,7 @@ class Frame(Structure):
                 parent_space=space_copies[label.parent_space],
             )
             if label.parent_concept in concept_copies:
-                label_copy._parent_concept = concept_copies[label.parent_concept]
+                label_copy.parent_concept = concept_copies[label.parent_concept]
             cross_view_links.add(label_copy)
             cross_view_link_copies[label] = label_copy
             for location in label_copy.locations:
@@ -4,10 +4,11 @@ from linguoplotter.location import Location
 from linguoplotter.structure import Structure
 from linguoplotter.structure_collections import StructureSet
 
-from .space import Space
-
 
 class Link(Structure):
+    is_link = True
+    __slots__ = ("start", "end", "arguments", "value", "is_excitatory")
+
     def __init__(
         self,
         structure_id: str,
@@ -42,11 +43,6 @@ class Link(Structure):
         self._parent_concept = parent_concept
         self.value = parent_concept.name if hasattr(parent_concept, "name") else None
         self.is_excitatory = True
-        self.is_link = True
-
-    @property
-    def parent_space(self) -> Space:
-        return self._parent_space
 
     @property
     def is_slot(self) -> bool:
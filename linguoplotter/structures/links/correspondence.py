@@ -12,6 +12,15 @@ from linguoplotter.structures.spaces import ConceptualSpace
 
 
 class Correspondence(Link):
+    is_correspondence = True
+    __slots__ = (
+        "conceptual_space",
+        "parent_view",
+        "is_privileged",
+        "is_bidirectional",
+        "is_projection",
+    )
+
     def __init__(
         self,
         structure_id: str,
@@ -56,7 +65,6 @@ class Correspondence(Link):
         self.is_bidirectional = is_bidirectional
         self.is_excitatory = is_excitatory
         self.is_projection = is_projection
-        self.is_correspondence = True
 
     def __dict__(self) -> dict:
         return {
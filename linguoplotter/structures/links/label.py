@@ -11,6 +11,9 @@ from linguoplotter.structures.nodes import Concept
 
 
 class Label(Link):
+    is_label = True
+    __slots__ = ("is_cross_view",)
+
     def __init__(
         self,
         structure_id: str,
@@ -45,7 +48,6 @@ class Label(Link):
             champion_relations=champion_relations,
         )
         self._parent_space = parent_space
-        self.is_label = True
         self.is_cross_view = is_cross_view
 
     def __dict__(self) -> dict:
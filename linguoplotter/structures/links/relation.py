@@ -12,6 +12,15 @@ from linguoplotter.structures.spaces import ConceptualSpace
 
 
 class Relation(Link):
+    is_relation = True
+    __slots__ = (
+        "conceptual_space",
+        "is_cross_view",
+        "is_bidirectional",
+        "start_view",
+        "end_view",
+    )
+
     def __init__(
         self,
         structure_id: str,
@@ -54,7 +63,6 @@ class Relation(Link):
         )
         self._parent_space = parent_space
         self.conceptual_space = conceptual_space
-        self.is_relation = True
         self.is_cross_view = is_cross_view
         self.is_bidirectional = is_bidirectional
         self.is_excitatory = is_excitatory
@@ -11,6 +11,9 @@ from .space import Space
 
 
 class Node(Structure):
+    is_node = True
+    __slots__ = ("_non_slot_value",)
+
     def __init__(
         self,
         structure_id: str,
@@ -39,17 +42,8 @@ class Node(Structure):
         )
         self.instances = instances
         self._parent_space = parent_space
-        self.is_node = True
         self._non_slot_value = None
 
-    @property
-    def parent_space(self) -> Space:
-        return self._parent_space
-
-    @parent_space.setter
-    def parent_space(self, space: Space):
-        self._parent_space = space
-
     @property
     def is_slot(self):
         return any(
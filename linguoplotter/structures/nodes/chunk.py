@@ -13,6 +13,9 @@ from .concept import Concept
 
 
 class Chunk(Node):
+    is_chunk = True
+    __slots__ = ("abstract_chunk", "members", "super_chunks", "sub_chunks", "is_raw")
+
     def __init__(
         self,
         structure_id: str,
@@ -52,7 +55,6 @@ class Chunk(Node):
         self.sub_chunks = sub_chunks
         self._parent_space = parent_space
         self.is_raw = is_raw
-        self.is_chunk = True
 
     def __dict__(self) -> dict:
         return {
@@ -99,9 +101,7 @@ class Chunk(Node):
     @property
     def raw_members(self) -> StructureSet:
         if self.is_raw:
-            raw_members = self.members.copy()
-            raw_members.add(self)
-            return raw_members
+            return StructureSet(self.members.bubble_chamber, [*self.members, self])
         return StructureSet.union(
             *[chunk.raw_members for chunk in self.members.where(is_slot=False)]
         )
@@ -160,20 +160,20 @@ class Chunk(Node):
         if self.is_raw:
             if space is not None:
                 return (
-                    space.contents.where(is_chunk=True)
-                    .near(self.location_in_space(space))
-                    .excluding(self),
+                    space.contents.near(
+                        self.location_in_space(space), is_chunk=True
+                    ).excluding(self),
                 )
-            return StructureSet.intersection(
+            return StructureSet.intersection_near(
                 *[
-                    location.space.contents.where(
-                        is_chunk=True, parent_space=self.parent_space
-                    ).near(location)
+                    (location.space.contents, location)
                     for location in self.locations
                     if location.space.is_conceptual_space
                     and location.space.is_basic_level
                     and location.space.name != "size"
-                ]
+                ],
+                is_chunk=True,
+                parent_space=self.parent_space,
             ).excluding(self)
         return (
             StructureSet.union(*[member.nearby(space=space) for member in self.members])
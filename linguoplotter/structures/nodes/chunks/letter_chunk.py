@@ -12,6 +12,9 @@ from linguoplotter.structures.nodes import Chunk
 
 
 class LetterChunk(Chunk):
+    is_letter_chunk = True
+    __slots__ = ("left_branch", "right_branch", "_name")
+
     def __init__(
         self,
         structure_id: str,
@@ -54,7 +57,6 @@ class LetterChunk(Chunk):
         self.left_branch = left_branch
         self.right_branch = right_branch
         self._name = name
-        self.is_letter_chunk = True
 
     def __dict__(self) -> dict:
         return {
@@ -203,15 +205,13 @@ class LetterChunk(Chunk):
     def nearby(self, space: Space = None) -> StructureSet:
         if space is not None:
             return (
-                space.contents.where(is_chunk=True)
-                .near(self.location_in_space(space))
-                .excluding(self),
+                space.contents.near(
+                    self.location_in_space(space), is_chunk=True
+                ).excluding(self),
             )
-        return (
-            self.parent_space.contents.where(is_chunk=True)
-            .near(self.location_in_space(self.parent_space))
-            .excluding(self)
-        )
+        return self.parent_space.contents.near(
+            self.location_in_space(self.parent_space), is_chunk=True
+        ).excluding(self)
 
     def copy_with_contents(
         self,
@@ -12,6 +12,22 @@ from linguoplotter.structures import Node, Space
 
 
 class Concept(Node):
+    is_concept = True
+    __slots__ = (
+        "name",
+        "classifier",
+        "instance_type",
+        "structure_type",
+        "child_spaces",
+        "distance_function",
+        "chunking_distance_function",
+        "possible_instances",
+        "_subsumes",
+        "distance_to_proximity_weight",
+        "_is_slot",
+        "reverse",
+    )
+
     def __init__(
         self,
         structure_id: str,
@@ -64,7 +80,6 @@ class Concept(Node):
         self._subsumes = subsumes
         self._depth = depth
         self.distance_to_proximity_weight = distance_to_proximity_weight
-        self.is_concept = True
         self._is_slot = is_slot
         self._non_slot_value = None
         self.reverse = reverse
@@ -154,9 +169,9 @@ class Concept(Node):
 
     def distance_from(self, other: Node, return_nan: bool = False):
         try:
-            return self.distance_function(
-                self.location_in_space(self.parent_space).coordinates,
-                other.location_in_space(self.parent_space).coordinates,
+            return self.location_in_space(self.parent_space).distance_to(
+                other.location_in_space(self.parent_space),
+                self.distance_function,
                 return_nan=return_nan,
             )
         except NotImplementedError:
@@ -216,10 +231,8 @@ class Concept(Node):
             self.distance_function if distance_function is None else distance_function
         )
         try:
-            return distance_function(
-                a.location_in_space(space).coordinates,
-                b.location_in_space(space).coordinates,
-                return_nan,
+            return a.location_in_space(space).distance_to(
+                b.location_in_space(space), distance_function, return_nan
             )
         except NotImplementedError:
             try:
@@ -4,6 +4,9 @@ from linguoplotter.structures.nodes import Concept
 
 
 class CompoundConcept(Concept):
+    is_compound_concept = True
+    __slots__ = ("root", "args")
+
     def __init__(
         self,
         structure_id: str,
@@ -50,7 +53,6 @@ class CompoundConcept(Concept):
         )
         self.root = root
         self.args = args
-        self.is_compound_concept = True
 
     @property
     def number_of_components(self):
@@ -7,6 +7,9 @@ from linguoplotter.structure_collections import StructureSet
 
 
 class Space(Structure):
+    is_space = True
+    __slots__ = ("name", "value", "contents", "is_main_input")
+
     def __init__(
         self,
         structure_id: str,
@@ -37,7 +40,6 @@ class Space(Structure):
         self.value = name
         self._parent_concept = parent_concept
         self.contents = contents
-        self.is_space = True
         self.is_main_input = False
 
     def distance_between(self, a: Structure, b: Structure, return_nan: bool = False):
@@ -54,12 +56,9 @@ class Space(Structure):
         return self.parent_concept.adjacency_of(a, b, space=self, return_nan=return_nan)
 
     def recalculate_activation(self):
+        activations = [item.activation for item in self.contents.where(is_slot=False)]
         self._activation_buffer = (
-            statistics.median(
-                [item.activation for item in self.contents.where(is_slot=False)]
-            )
-            if len(self.contents.where(is_slot=False)) != 0
-            else 0.0
+            statistics.median(activations) if len(activations) != 0 else 0.0
         )
 
     def __repr__(self) -> str:
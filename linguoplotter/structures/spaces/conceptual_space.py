@@ -13,6 +13,18 @@ from linguoplotter.structures.nodes import Concept
 
 
 class ConceptualSpace(Space):
+    is_conceptual_space = True
+    __slots__ = (
+        "breadth",
+        "possible_instances",
+        "no_of_dimensions",
+        "_dimensions",
+        "sub_spaces",
+        "is_basic_level",
+        "is_symbolic",
+        "super_space_to_coordinate_function_map",
+    )
+
     def __init__(
         self,
         structure_id: str,
@@ -60,7 +72,6 @@ class ConceptualSpace(Space):
             if super_space_to_coordinate_function_map is not None
             else {}
         )
-        self.is_conceptual_space = True
 
     def __dict__(self) -> dict:
         return {
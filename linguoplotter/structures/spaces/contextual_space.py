@@ -12,6 +12,9 @@ from linguoplotter.structures.nodes import Concept
 
 
 class ContextualSpace(Space):
+    is_contextual_space = True
+    __slots__ = ("parent_frame", "conceptual_spaces")
+
     def __init__(
         self,
         structure_id: str,
@@ -44,7 +47,6 @@ class ContextualSpace(Space):
         self.parent_frame = None
         self.conceptual_spaces = conceptual_spaces
         self.is_main_input = is_main_input
-        self.is_contextual_space = True
 
     def __dict__(self) -> dict:
         return {
@@ -21,6 +21,27 @@ from linguoplotter.tools import generalized_mean
 class View(Structure):
     """A collection of spaces and self-consistent correspondences between them."""
 
+    is_view = True
+    __slots__ = (
+        "parent_frame",
+        "value",
+        "frames",
+        "input_spaces",
+        "output_space",
+        "members",
+        "sub_views",
+        "super_views",
+        "cohesion_views",
+        "_node_groups",
+        "_grouped_nodes",
+        "matched_sub_frames",
+        "slot_values",
+        "conceptual_spaces_map",
+        "cross_view_links",
+        "cross_view_relations",
+        "_cohesiveness_with",
+    )
+
     def __init__(
         self,
         structure_id: str,
@@ -69,7 +90,6 @@ class View(Structure):
         self.matched_sub_frames = {}
         self.slot_values = {}
         self.conceptual_spaces_map = {}
-        self.is_view = True
         self.cross_view_links = cross_view_links
         self.cross_view_relations = cross_view_relations
         self._cohesiveness_with = {}
@@ -437,7 +457,7 @@ class View(Structure):
                 link.arguments.add(correspondence.end.start)
                 correspondence.end.start.links_out.add(link)
                 if link.is_relation and link.parent_concept.is_slot:
-                    link._parent_concept = (
+                    link.parent_concept = (
                         link.parent_concept.possible_instances.where(name="same")
                     ).get()
             for link in old_end.links_in:
@@ -445,7 +465,7 @@ class View(Structure):
                 link.arguments.remove(old_end)
                 correspondence.end.start.links_in.add(link)
                 if link.is_relation and link.parent_concept.is_slot:
-                    link._parent_concept = (
+                    link.parent_concept = (
                         link.parent_concept.possible_instances.where(name="same")
                     ).get()
             old_end.parent_space.contents.remove(old_end)
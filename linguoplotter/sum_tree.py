@@ -0,0 +1,94 @@
+from typing import Iterable
+
+
+class SumTree:
+    """A Fenwick tree of non-negative weights.
+
+    Updating a weight, taking the total and finding the index at which the
+    cumulative weight passes a value are all O(log n). The total is set back
+    to exactly 0 whenever every weight is 0 so that rounding errors left by
+    updates cannot make an empty tree look as though it has weight."""
+
+    def __init__(self, weights: Iterable[float] = None):
+        self._weights = []
+        self._tree = [0.0]
+        self._nonzero_weights = 0
+        self.total = 0.0
+        if weights is not None:
+            self.rebuild(weights)
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __getitem__(self, index: int) -> float:
+        return self._weights[index]
+
+    def rebuild(self, weights: Iterable[float]):
+        self._weights = list(weights)
+        self._tree = [0.0] + self._weights
+        for i in range(1, len(self._tree)):
+            parent = i + (i & -i)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[i]
+        self._nonzero_weights = sum(1 for weight in self._weights if weight != 0)
+        self.total = sum(self._weights)
+
+    def append(self, weight: float) -> int:
+        index = len(self._weights)
+        i = index + 1
+        self._weights.append(weight)
+        self._tree.append(
+            weight + self._prefix_sum(i - 1) - self._prefix_sum(i - (i & -i))
+        )
+        if weight != 0:
+            self._nonzero_weights += 1
+        self.total += weight
+        return index
+
+    def update(self, index: int, weight: float):
+        delta = weight - self._weights[index]
+        if delta == 0:
+            return
+        if self._weights[index] == 0:
+            self._nonzero_weights += 1
+        elif weight == 0:
+            self._nonzero_weights -= 1
+        self._weights[index] = weight
+        if self._nonzero_weights == 0:
+            self._tree = [0.0] * len(self._tree)
+            self.total = 0.0
+            return
+        self.total += delta
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index: int) -> float:
+        """Sum of the weights before index."""
+        return self._prefix_sum(index)
+
+    def find(self, value: float) -> int:
+        """Returns the first index at which the cumulative weight exceeds value,
+        skipping over indices with no weight."""
+        position = 0
+        step = 1 << (len(self._tree).bit_length() - 1)
+        while step > 0:
+            next_position = position + step
+            if next_position < len(self._tree) and self._tree[next_position] <= value:
+                position = next_position
+                value -= self._tree[next_position]
+            step >>= 1
+        position = min(position, len(self._weights) - 1)
+        while position > 0 and self._weights[position] == 0:
+            position -= 1
+        while position < len(self._weights) - 1 and self._weights[position] == 0:
+            position += 1
+        return position
+
+    def _prefix_sum(self, i: int) -> float:
+        total = 0.0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
@@ -5,27 +5,48 @@ import re
 from matplotlib import pyplot
 
 
+def load_structure_histories(log_directory):
+    """Returns the fields of each structure after each of its logged changes as
+    {structure_id: [(time, fields), ...]}, rebuilt from structures.jsonl or read
+    from the older layout of one file per structure and time."""
+    histories = {}
+    log_file = f"{log_directory}/structures.jsonl"
+    if os.path.exists(log_file):
+        with open(log_file, "r") as f:
+            for line in f:
+                record = json.loads(line)
+                history = histories.setdefault(record["id"], [])
+                fields = dict(history[-1][1]) if len(history) > 0 else {}
+                fields.update(record["changes"])
+                for name in record.get("removed", []):
+                    fields.pop(name)
+                history.append((record["time"], fields))
+        return histories
+    structures_directory = f"{log_directory}/structures/structures"
+    for structure in os.listdir(structures_directory):
+        structure_directory = f"{structures_directory}/{structure}"
+        log_files = os.listdir(structure_directory)
+        log_files.sort(key=lambda x: int(x.split(".")[0]))
+        histories[structure] = []
+        for log_file in log_files:
+            with open(f"{structure_directory}/{log_file}", "r") as f:
+                histories[structure].append((int(log_file.split(".")[0]), json.load(f)))
+    return histories
+
+
 def generate_plot(log_directory, structures, field, title):
     figure = pyplot.figure()
     ax = figure.add_axes([0.1, 0.1, 0.8, 0.8])
     ax.set_title(title)
 
     for structure in structures:
-        structure_directory = f"{log_directory}/structures/structures/{structure}"
-        log_files = os.listdir(structure_directory)
-        log_files.sort(key=lambda x: int(x.split(".")[0]))
-
         field_history_x = []
         field_history_y = []
 
-        for log_file in log_files:
-            time = int(log_file.split(".")[0])
+        for time, fields in structure_histories[structure]:
             field_history_x.append(time)
-            file_name = f"{structure_directory}/{log_file}"
-            with open(file_name, "r") as f:
-                file_data = json.load(f)
-                field_history_y.append(file_data[field])
-                label = file_data["name"] if "name" in file_data else structure
+            field_history_y.append(fields[field])
+            label = fields["name"] if "name" in fields else structure
 
         print(field_history_x)
         print()
@@ -115,38 +136,20 @@ log_directories = os.listdir("logs/")
 log_directories.sort()
 log_directory = "logs/" + log_directories[-1]
 
-structures_directory = f"{log_directory}/structures/structures/"
-log_files = os.listdir(structures_directory)
-for log_file in log_files:
-    if re.match(r"Concept[1-9]", log_file):
-        file_name = f"{structures_directory}/{log_file}/0.json"
-        try:
-            with open(file_name, "r") as f:
-                file_data = json.load(f)
-                if file_data["name"] in concept_file_map:
-                    concept_file_map[file_data["name"]] = log_file
-        except FileNotFoundError:
-            pass
-for log_file in log_files:
-    if re.match(r"ConceptualSpace[1-9]", log_file):
-        file_name = f"{structures_directory}/{log_file}/0.json"
-        try:
-            with open(file_name, "r") as f:
-                file_data = json.load(f)
-                if file_data["name"] in conceptual_space_file_map:
-                    conceptual_space_file_map[file_data["name"]] = log_file
-        except FileNotFoundError:
-            pass
-for log_file in log_files:
-    if re.match(r"Frame[1-9]", log_file):
-        file_name = f"{structures_directory}/{log_file}/0.json"
-        try:
-            with open(file_name, "r") as f:
-                file_data = json.load(f)
-                if file_data["name"] in frame_file_map:
-                    frame_file_map[file_data["name"]] = log_file
-        except FileNotFoundError:
-            pass
+structure_histories = load_structure_histories(log_directory)
+for structure, history in structure_histories.items():
+    time, fields = history[0]
+    if time != 0:
+        continue
+    if re.match(r"Concept[1-9]", structure):
+        if fields["name"] in concept_file_map:
+            concept_file_map[fields["name"]] = structure
+    if re.match(r"ConceptualSpace[1-9]", structure):
+        if fields["name"] in conceptual_space_file_map:
+            conceptual_space_file_map[fields["name"]] = structure
+    if re.match(r"Frame[1-9]", structure):
+        if fields["name"] in frame_file_map:
+            frame_file_map[fields["name"]] = structure
 
 generate_plot(
     log_directory,
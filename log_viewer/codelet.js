@@ -1,15 +1,11 @@
 var fs = require('fs');
 var tools = require('./tools');
+var codelet_log = require('./codelet_log');
 
 exports.run = function(query) {
     run_id = query.run_id;
     codelet_number = query.codelet_number;
     codelet_id = query.codelet_id;
-    if (codelet_number !== undefined) {
-	log_file = 'logs/' + run_id + '/' + 'codelets/times/' + codelet_number + '.json';
-    } else {
-	log_file = 'logs/' + run_id + '/' + 'codelets/ids/' + codelet_id + '.json';
-    }
 
     doc = '<html><body>';
     doc += '<p><a href="../">&lt;&lt;All runs</a></p>';
@@ -17,7 +13,11 @@ exports.run = function(query) {
     doc += '<p><a href="codelets?run_id=' + run_id + '">Codelets</a></p>';
     doc += '<p><a href="structures?run_id=' + run_id + '">Structures</a></p>';
 
-    codelet_json = JSON.parse(fs.readFileSync(log_file));
+    if (codelet_number !== undefined) {
+	codelet_json = codelet_log.by_time(run_id, codelet_number);
+    } else {
+	codelet_json = codelet_log.by_id(run_id, codelet_id);
+    }
     query.time = codelet_json.time;
 
     doc += '<h2>' + codelet_json.id + '</h2>';
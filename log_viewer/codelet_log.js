@@ -0,0 +1,71 @@
+const fs = require('fs');
+
+// Codelets are logged as one JSON line each in codelets.jsonl with
+// codelets_index.csv giving the time, id, offset and length of each line.
+// Logs written before that have a file per codelet in codelets/times with
+// links to them in codelets/ids.
+
+exports.index = function(run_id) {
+    const index_file = `logs/${run_id}/codelets_index.csv`;
+    if (!fs.existsSync(index_file)) {
+	const codelets_directory = `logs/${run_id}/codelets/ids`;
+	// each link points at the file named after the codelet's time
+	return fs.readdirSync(codelets_directory).map(file => {
+	    const target = fs.readlinkSync(`${codelets_directory}/${file}`);
+	    return {
+		"time": Number(target.split("/").pop().split(".")[0]),
+		"id": file.slice(0, -".json".length)
+	    };
+	}).sort(function(a, b) {return a.time - b.time});
+    }
+    return String(fs.readFileSync(index_file))
+	.split("\n")
+	.filter(line => line !== "")
+	.map(line => {
+	    const [time, id, offset, length] = line.split(",");
+	    return {
+		"time": Number(time),
+		"id": id,
+		"offset": Number(offset),
+		"length": Number(length)
+	    };
+	});
+}
+
+exports.by_time = function(run_id, time) {
+    if (!fs.existsSync(`logs/${run_id}/codelets.jsonl`)) {
+	return read_file(`logs/${run_id}/codelets/times/${time}.json`);
+    }
+    const entry = exports.index(run_id).find(entry => entry.time === Number(time));
+    return read_entry(run_id, entry);
+}
+
+exports.by_id = function(run_id, codelet_id) {
+    if (!fs.existsSync(`logs/${run_id}/codelets.jsonl`)) {
+	return read_file(`logs/${run_id}/codelets/ids/${codelet_id}.json`);
+    }
+    const entry = exports.index(run_id).find(entry => entry.id === codelet_id);
+    return read_entry(run_id, entry);
+}
+
+exports.entry = function(run_id, entry) {
+    if (entry.offset === undefined) {
+	return exports.by_time(run_id, entry.time);
+    }
+    return read_entry(run_id, entry);
+}
+
+function read_file(file_name) {
+    return JSON.parse(fs.readFileSync(file_name));
+}
+
+function read_entry(run_id, entry) {
+    const buffer = Buffer.alloc(entry.length);
+    const file = fs.openSync(`logs/${run_id}/codelets.jsonl`, 'r');
+    try {
+	fs.readSync(file, buffer, 0, entry.length, entry.offset);
+    } finally {
+	fs.closeSync(file);
+    }
+    return JSON.parse(buffer.toString());
+}
@@ -1,5 +1,6 @@
 var fs = require('fs');
 var tools = require('./tools');
+var codelet_log = require('./codelet_log');
 
 exports.run = function(query) {
     run_id = query.run_id;
@@ -15,16 +16,10 @@ exports.run = function(query) {
     <p><a href="codelets?run_id=${run_id}">Codelets</a></p>
     <p><a href="structures?run_id=${run_id}">Structures</a></p>
 `
-    codelets_directory = log_directory + 'codelets/times';
-    codelet_files = fs.readdirSync(codelets_directory);
-    codelet_files.sort(
-	function(a, b) {return Number(a.split(".")[0]) - Number(b.split(".")[0])}
-    );
+    codelet_entries = codelet_log.index(run_id);
     slice_start = (page - 1) * items_per_page;
     slice_end = slice_start + items_per_page;
 
-    console.log(codelet_files);
-
     doc += '<p>';
     if (page > 1) {
 	doc += '<a href="codelets?run_id=' + run_id
@@ -36,7 +31,7 @@ exports.run = function(query) {
 	    + '">Previous Page</a> ';
     }
     doc += page + ' ';
-    last_page = Math.ceil(codelet_files.length / items_per_page);
+    last_page = Math.ceil(codelet_entries.length / items_per_page);
     if (page < last_page) {
 	doc += '<a href="codelets?run_id=' + run_id
 	    + '&page=' + (page + 1)
@@ -50,10 +45,9 @@ exports.run = function(query) {
     doc += '</p>';
 
     doc += '<ul>';
-    codelet_files.slice(slice_start, slice_end).forEach(file => {
-	codelet_number = file.split(".")[0];
-	codelet_file = 'logs/' + run_id + '/' + 'codelets/times/' + codelet_number + '.json';
-	codelet_json = JSON.parse(fs.readFileSync(codelet_file));
+    codelet_entries.slice(slice_start, slice_end).forEach(entry => {
+	codelet_number = entry.time;
+	codelet_json = codelet_log.entry(run_id, entry);
 	query.time = Number(codelet_number);
 	
 	url = 'codelet?run_id=' + run_id + '&codelet_number=' + codelet_number;
@@ -87,7 +81,7 @@ exports.run = function(query) {
 	    + '">Previous Page</a> ';
     }
     doc += page + ' ';
-    last_page = Math.ceil(codelet_files.length / items_per_page);
+    last_page = Math.ceil(codelet_entries.length / items_per_page);
     if (page < last_page) {
 	doc += '<a href="codelets?run_id=' + run_id
 	    + '&page=' + (page + 1)
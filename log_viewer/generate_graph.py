@@ -6,6 +6,7 @@ import graphviz
 
 open_curly = "{"
 close_curly = "}"
+structure_histories = {}
 
 
 def main(run_id, structure_id, time):
@@ -108,9 +109,7 @@ def generate_concept_graph(run_id, concept_id, time):
     for relation in relations:
         concept_graph.edge(relation["structure_id"], relation["start"], label="start")
         concept_graph.edge(relation["structure_id"], relation["end"], label="end")
-    concept_graph.render(
-        f"logs/{run_id}/structures/structures/{concept_id}/{time}", format="svg"
-    )
+    concept_graph.render(f"logs/{run_id}/graphs/{concept_id}/{time}", format="svg")
     return concept_graph
 
 
@@ -202,7 +201,7 @@ def generate_correspondence_graph(run_id, correspondence_id, time):
         color=color,
     )
     correspondence_graph.render(
-        f"logs/{run_id}/structures/structures/{correspondence_id}/{time}", format="svg"
+        f"logs/{run_id}/graphs/{correspondence_id}/{time}", format="svg"
     )
     return correspondence_graph
 
@@ -281,9 +280,7 @@ def generate_chunk_graph(run_id, chunk_id, time):
         chunk_graph.edge(relation["structure_id"], relation["end"], label="end")
     for member in chunk["members"]:
         chunk_graph.edge(chunk["structure_id"], member, label="member")
-    chunk_graph.render(
-        f"logs/{run_id}/structures/structures/{chunk_id}/{time}", format="svg"
-    )
+    chunk_graph.render(f"logs/{run_id}/graphs/{chunk_id}/{time}", format="svg")
     return chunk_graph
 
 
@@ -396,9 +393,7 @@ def generate_frame_graph(run_id, frame_id, time):
                     c.edge(letter_chunk["structure_id"], child, label="left")
             c.attr(label=space["name"])
     frame_graph.attr(label=frame["name"])
-    frame_graph.render(
-        f"logs/{run_id}/structures/structures/{frame_id}/{time}", format="svg"
-    )
+    frame_graph.render(f"logs/{run_id}/graphs/{frame_id}/{time}", format="svg")
     return frame_graph
 
 
@@ -420,9 +415,7 @@ def generate_label_graph(run_id, label_id, time):
     )
     label_graph.node(label["start"], shape="rectangle", URL=url(label["start"]))
     label_graph.edge(label["structure_id"], label["start"], label="start")
-    label_graph.render(
-        f"logs/{run_id}/structures/structures/{label_id}/{time}", format="svg"
-    )
+    label_graph.render(f"logs/{run_id}/graphs/{label_id}/{time}", format="svg")
     return label_graph
 
 
@@ -515,7 +508,7 @@ def generate_letter_chunk_graph(run_id, letter_chunk_id, time):
         )
         letter_chunk_graph.edge(relation["structure_id"], relation["end"], label="end")
     letter_chunk_graph.render(
-        f"logs/{run_id}/structures/structures/{letter_chunk_id}/{time}", format="svg"
+        f"logs/{run_id}/graphs/{letter_chunk_id}/{time}", format="svg"
     )
     return letter_chunk_graph
 
@@ -547,9 +540,7 @@ def generate_conceptual_space_graph(run_id, space_id, time):
             shape="circle",
             URL=url(concept["structure_id"]),
         )
-    space_graph.render(
-        f"logs/{run_id}/structures/structures/{space_id}/{time}", format="svg"
-    )
+    space_graph.render(f"logs/{run_id}/graphs/{space_id}/{time}", format="svg")
     return space_graph
 
 
@@ -662,9 +653,7 @@ def generate_contextual_space_graph(run_id, space_id, time):
     for chunk in chunks:
         for member in chunk["members"]:
             space_graph.edge(chunk["structure_id"], member, label="member")
-    space_graph.render(
-        f"logs/{run_id}/structures/structures/{space_id}/{time}", format="svg"
-    )
+    space_graph.render(f"logs/{run_id}/graphs/{space_id}/{time}", format="svg")
     return space_graph
 
 
@@ -693,9 +682,7 @@ def generate_relation_graph(run_id, relation_id, time):
     relation_graph.node(relation["end"], shape="rectangle", URL=url(relation["end"]))
     relation_graph.edge(relation["structure_id"], relation["start"], label="start")
     relation_graph.edge(relation["structure_id"], relation["end"], label="end")
-    relation_graph.render(
-        f"logs/{run_id}/structures/structures/{relation_id}/{time}", format="svg"
-    )
+    relation_graph.render(f"logs/{run_id}/graphs/{relation_id}/{time}", format="svg")
     return relation_graph
 
 
@@ -1001,14 +988,33 @@ def generate_view_graph(run_id, view_id, time):
                 color="blue",
             )
 
-    view_graph.render(
-        f"logs/{run_id}/structures/structures/{view_id}/{time}", format="svg"
-    )
+    view_graph.render(f"logs/{run_id}/graphs/{view_id}/{time}", format="svg")
     return view_graph
 
 
 def get_structure_json(run_id, structure_id, time):
+    """Rebuilds the structure at time from the changes logged up to then."""
     time = int(time)
+    log_file = f"logs/{run_id}/structures.jsonl"
+    if not os.path.exists(log_file):
+        return get_legacy_structure_json(run_id, structure_id, time)
+    if run_id not in structure_histories:
+        structure_histories[run_id] = {}
+        with open(log_file) as f:
+            for line in f:
+                record = json.loads(line)
+                structure_histories[run_id].setdefault(record["id"], []).append(record)
+    structure_json = {}
+    for record in structure_histories[run_id].get(structure_id, []):
+        if record["time"] > time:
+            break
+        structure_json.update(record["changes"])
+        for field in record.get("removed", []):
+            structure_json.pop(field)
+    return structure_json
+
+
+def get_legacy_structure_json(run_id, structure_id, time):
     log_directory = f"logs/{run_id}/structures/structures"
     structure_directory = f"{log_directory}/{structure_id}"
     structure_files = os.listdir(structure_directory)
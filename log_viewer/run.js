@@ -1,5 +1,7 @@
 var fs = require('fs');
 var tools = require('./tools');
+var codelet_log = require('./codelet_log');
+var structure_log = require('./structure_log');
 
 exports.run = function(query) {
     run_id = query.run_id;
@@ -25,22 +27,13 @@ br {
 `
     details = JSON.parse(fs.readFileSync(details_file));
 
-    structures_directory = `logs/${run_id}/structures/structures`;
-    structure_directories = fs.readdirSync(structures_directory);
-    structure_directories.forEach(directory => {
-	if (!directory.includes("ContextualSpace")) {
+    structure_log.ids(run_id).forEach(structure_id => {
+	if (!structure_id.includes("ContextualSpace")) {
 	    return;
 	}
-	structure_directory = `${structures_directory}/${directory}`;
-	snapshot_files = fs.readdirSync(structure_directory);
-	try {
-	    file_path = `${structure_directory}/0.json`;
-	    structure = JSON.parse(fs.readFileSync(file_path));
-	    if (structure["is_main_input"]) {
-		details["main_input"] = structure["structure_id"];
-		return;
-	    }
-	} catch (err) {
+	snapshot = structure_log.at(run_id, structure_id, 0);
+	if (snapshot !== null && snapshot.structure["is_main_input"]) {
+	    details["main_input"] = snapshot.structure["structure_id"];
 	}
     });
 
@@ -68,17 +61,13 @@ br {
 
     worldviews = [];
     focuses = [];
-    codelets_directory = `logs/${run_id}/codelets/ids`;
-    codelet_files = fs.readdirSync(codelets_directory);
-    codelet_files.forEach(file => {
-	if (file.includes("WorldviewSetter")) {
-	    file_path = `${codelets_directory}/${file}`;
-	    codelet = JSON.parse(fs.readFileSync(file_path));
+    codelet_log.index(run_id).forEach(entry => {
+	if (entry.id.includes("WorldviewSetter")) {
+	    codelet = codelet_log.entry(run_id, entry);
 	    worldviews.push({"worldview": codelet["worldview"], "time": codelet["time"]});
 	}
-	if (file.includes("Focus")) {
-	    file_path = `${codelets_directory}/${file}`;
-	    codelet = JSON.parse(fs.readFileSync(file_path));
+	if (entry.id.includes("Focus")) {
+	    codelet = codelet_log.entry(run_id, entry);
 	    focuses.push({"focus": codelet["focus"], "time": codelet["time"]});
 	}
     });
@@ -98,21 +87,7 @@ br {
 	    return;
 	}
 
-	structure_directory = `logs/${run_id}/structures/structures/${view}`;
-	structure_files = fs.readdirSync(structure_directory).filter(
-	    (f) => {return f.endsWith("json")}
-	);
-	structure_file = '';
-	latest_file_time = -1;
-	structure_files.forEach(file => {
-	    file_time = Number(file.split(".")[0]);
-	    if (file_time <= time && file_time > latest_file_time) {
-	    structure_file = file;
-	    latest_file_time = file_time;
-	    }
-	});
-	structure_file_path = `${structure_directory}/${structure_file}`;
-        structure_json = JSON.parse(fs.readFileSync(structure_file_path));
+	structure_json = structure_log.at(run_id, view, time).structure;
 
 	text = structure_json["output"];
 
@@ -143,30 +118,10 @@ br {
 	    return;
 	}
 
-	structure_directory = `logs/${run_id}/structures/structures/${view}`;
-	structure_files = fs.readdirSync(structure_directory).filter(
-	    (f) => {return f.endsWith("json")}
-	);
-	structure_file = '';
-	latest_file_time = -1;
-	structure_files.forEach(file => {
-	    file_time = Number(file.split(".")[0]);
-	    if (file_time <= time && file_time > latest_file_time) {
-	    structure_file = file;
-	    latest_file_time = file_time;
-	    }
-	});
-	structure_file_path = `${structure_directory}/${structure_file}`;
-        structure_json = JSON.parse(fs.readFileSync(structure_file_path));
+	structure_json = structure_log.at(run_id, view, time).structure;
 
 	parent_frame = structure_json["parent_frame"];
-	frame_directory = `logs/${run_id}/structures/structures/${parent_frame}`;
-	structure_files = fs.readdirSync(frame_directory).filter(
-	    (f) => {return f.endsWith("json")}
-	);
-	frame_file_name = structure_files[0];
-	frame_file_path = `${frame_directory}/${frame_file_name}`;
-	frame_json = JSON.parse(fs.readFileSync(frame_file_path));
+	frame_json = structure_log.at(run_id, parent_frame).structure;
 	frame_name = frame_json["name"];
 
 	doc += `
@@ -1,5 +1,6 @@
 var fs = require('fs');
 var tools = require('./tools');
+var structure_log = require('./structure_log');
 
 exports.run = function(query) {
     const run_id = query.run_id;
@@ -26,18 +27,12 @@ div.plot {
     <h2>${structure_id}</h2>
     <p>
 `;
-    structure_directory = log_directory + 'structures/structures/' + structure_id;
-    snapshot_files = fs.readdirSync(structure_directory).filter(
-	function(a) {return a.split(".")[1] == "json"}
-    );
-    snapshot_files.sort(
-	function(a, b) {return Number(a.split(".")[0]) - Number(b.split(".")[0])}
-    );
+    snapshot_times = structure_log.times(run_id, structure_id);
     slice_start = (page - 1) * items_per_page;
     slice_end = slice_start + items_per_page;
     const prev_page = page - 1
     const next_page = page + 1
-    const last_page = Math.ceil(snapshot_files.length / items_per_page);
+    const last_page = Math.ceil(snapshot_times.length / items_per_page);
     if (page > 1) {
 	doc +=`
       <a href="structure_lifetime?run_id=${run_id}&structure_id=${structure_id}&page=1&items_per_page=${items_per_page}">&lt;&lt;</a>
@@ -54,8 +49,7 @@ div.plot {
     doc += `
     <ul>
 `;
-    snapshot_files.slice(slice_start, slice_end).forEach(file => {
-	const time = file.split(".")[0]
+    snapshot_times.slice(slice_start, slice_end).forEach(time => {
 	doc += `
       <li>
         <a href="structure_snapshot?run_id=${run_id}&structure_id=${structure_id}&time=${time}">${time}</a>
@@ -115,18 +109,11 @@ const quality_graph_script = function(query) {
 }
 
 const data_string_for_field = function(query, field_name) {
-    const structure_directory = `logs/${query.run_id}/structures/structures/${query.structure_id}`;
-    snapshot_files = fs.readdirSync(structure_directory);
-    snapshot_files = fs.readdirSync(structure_directory).filter(
-	file_name => {return file_name.endsWith("json")}
-    );
-    snapshot_files.sort(
-	function(a, b) {return Number(a.split(".")[0]) - Number(b.split(".")[0])}
-    );
     data = '[';
-    snapshot_files.forEach(file => {
-	const time = file.split(".")[0];
-	const structure_json = JSON.parse(fs.readFileSync(`${structure_directory}/${file}`));
+    structure_log.times(query.run_id, query.structure_id).forEach(time => {
+	const structure_json = structure_log.at(
+	    query.run_id, query.structure_id, time
+	).structure;
 	const value = structure_json[field_name];
 	if (data.length > 1) {
 	    data += ', ';
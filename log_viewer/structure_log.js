@@ -0,0 +1,82 @@
+const fs = require('fs');
+
+// Structures are logged as JSON lines in structures.jsonl, each holding a
+// structure's id, the time and the fields which changed since the structure
+// was last logged. Logs written before that have a directory for each
+// structure in structures/structures with a file for each time.
+
+const histories = {};
+
+function history(run_id) {
+    const log_file = `logs/${run_id}/structures.jsonl`;
+    const size = fs.statSync(log_file).size;
+    if (histories[run_id] !== undefined && histories[run_id].size === size) {
+	return histories[run_id].records;
+    }
+    const records = {};
+    String(fs.readFileSync(log_file))
+	.split("\n")
+	.filter(line => line !== "")
+	.forEach(line => {
+	    const record = JSON.parse(line);
+	    if (records[record.id] === undefined) {
+		records[record.id] = [];
+	    }
+	    records[record.id].push(record);
+	});
+    histories[run_id] = {"size": size, "records": records};
+    return records;
+}
+
+function is_legacy(run_id) {
+    return !fs.existsSync(`logs/${run_id}/structures.jsonl`);
+}
+
+function legacy_directory(run_id, structure_id) {
+    return `logs/${run_id}/structures/structures/${structure_id}`;
+}
+
+exports.ids = function(run_id) {
+    if (is_legacy(run_id)) {
+	return fs.readdirSync(`logs/${run_id}/structures/structures`);
+    }
+    return Object.keys(history(run_id));
+}
+
+exports.times = function(run_id, structure_id) {
+    if (is_legacy(run_id)) {
+	return fs.readdirSync(legacy_directory(run_id, structure_id))
+	    .filter(file => file.endsWith("json"))
+	    .map(file => Number(file.split(".")[0]))
+	    .sort(function(a, b) {return a - b});
+    }
+    const records = history(run_id)[structure_id] || [];
+    return [...new Set(records.map(record => record.time))];
+}
+
+// Returns the structure as it was at time, or as it was last logged if time is
+// undefined, with the time at which it was logged.
+exports.at = function(run_id, structure_id, time) {
+    time = time === undefined ? Infinity : Number(time);
+    if (is_legacy(run_id)) {
+	const times = exports.times(run_id, structure_id).filter(t => t <= time);
+	if (times.length === 0) {
+	    return null;
+	}
+	const latest_time = times[times.length - 1];
+	const file_name = `${legacy_directory(run_id, structure_id)}/${latest_time}.json`;
+	return {"time": latest_time, "structure": JSON.parse(fs.readFileSync(file_name))};
+    }
+    const records = (history(run_id)[structure_id] || []).filter(
+	record => record.time <= time
+    );
+    if (records.length === 0) {
+	return null;
+    }
+    const structure = {};
+    records.forEach(record => {
+	Object.assign(structure, record.changes);
+	(record.removed || []).forEach(field => {delete structure[field]});
+    });
+    return {"time": records[records.length - 1].time, "structure": structure};
+}
@@ -1,29 +1,17 @@
 var fs = require('fs');
 var tools = require('./tools');
+var structure_log = require('./structure_log');
 
 exports.run = function(query) {
     const run_id = query.run_id;
     const structure_id = query.structure_id;
     const time = query.time
-    const structure_directory = `logs/${run_id}/structures/structures/${structure_id}`;
-    const structure_files = fs.readdirSync(structure_directory);
-
-    var structure_file = '';
-    var latest_time = -1;
-    var previous_time = -1;
-    var next_time = -1;
-    structure_files.forEach(file => {
-	file_time = Number(file.split(".")[0]);
-	if (file_time <= query.time && time > latest_time && file.endsWith("json")) {
-	    structure_file = file;
-	    previous_time = latest_time;
-	    latest_time = file_time;
-	} else {
-	    if (next_time == -1 && file.endsWith("json")) {
-		next_time = file_time;
-	    }
-	}
-    });
+    const snapshot_times = structure_log.times(run_id, structure_id);
+    const earlier_times = snapshot_times.filter(t => t <= Number(time));
+    const later_times = snapshot_times.filter(t => t > Number(time));
+    const previous_time = earlier_times.length > 1 ?
+	  earlier_times[earlier_times.length - 2] : -1;
+    const next_time = later_times.length > 0 ? later_times[0] : -1;
 
     const previous_link = previous_time > -1 ?
 	  `<a href="structure_snapshot?run_id=${run_id}&structure_id=${structure_id}`
@@ -40,18 +28,9 @@ exports.run = function(query) {
     const graph_file = tools.get_graph(run_id, structure_id, time);
     const graph_svg = fs.readFileSync(graph_file);
 
-    const log_file = structure_directory + '/' + structure_file;
-    const structure_json = JSON.parse(fs.readFileSync(log_file));
+    const structure_json = structure_log.at(run_id, structure_id, time).structure;
     const structure_html = tools.json_to_html(structure_json, query);
 
-    snapshot_files = fs.readdirSync(structure_directory).filter(
-	function(a) {return a.split(".")[1] == "json"}
-    );
-    snapshot_files.sort(
-	function(a, b) {return Number(a.split(".")[0]) - Number(b.split(".")[0])}
-    );
-
-
     const doc = `
 <html>
   <body>
@@ -1,4 +1,5 @@
 var fs = require('fs');
+var structure_log = require('./structure_log');
 
 exports.run = function(query) {
     run_id = query.run_id;
@@ -12,8 +13,7 @@ exports.run = function(query) {
     doc += '<p><a href="codelets?run_id=' + run_id + '">Codelets</a></p>';
     doc += '<p><a href="structures?run_id=' + run_id + '">Structures</a></p>';
 
-    structures_directory = log_directory + 'structures/structures';
-    structure_directories = fs.readdirSync(structures_directory);
+    structure_ids = structure_log.ids(run_id);
     slice_start = (page - 1) * items_per_page;
     slice_end = slice_start + items_per_page;
 
@@ -28,7 +28,7 @@ exports.run = function(query) {
 	    + '">Previous Page</a> ';
     }
     doc += page + ' ';
-    last_page = Math.ceil(structure_directories.length / items_per_page);
+    last_page = Math.ceil(structure_ids.length / items_per_page);
     if (page < last_page) {
 	doc += '<a href="structures?run_id=' + run_id
 	    + '&page=' + (page + 1)
@@ -42,9 +42,9 @@ exports.run = function(query) {
     doc += '</p>';
 
     doc += '<ul>';
-    structure_directories.slice(slice_start, slice_end).forEach(directory => {
-	url = 'structure_lifetime?run_id=' + run_id + '&structure_id=' + directory;
-	doc += '<ul><a href="' + url + '">' + directory + '</a></ul>';
+    structure_ids.slice(slice_start, slice_end).forEach(structure_id => {
+	url = 'structure_lifetime?run_id=' + run_id + '&structure_id=' + structure_id;
+	doc += '<ul><a href="' + url + '">' + structure_id + '</a></ul>';
     });
     doc += '</ul>';
     doc += '</body></html>';
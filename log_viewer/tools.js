@@ -1,16 +1,15 @@
 const fs = require('fs');
 const {spawn} = require('child_process');
+const structure_log = require('./structure_log');
 
 exports.array_average = function(array) {
     return array.reduce((a,b) => a + b, 0) / array.length;
 }
 
 exports.get_graph = function(run_id, structure_id, time) {
-    const structure_directory = `logs/${run_id}/structures/structures/${structure_id}`;
-    const file_name = `${time}.svg`;
-    const structure_files = fs.readdirSync(structure_directory);
-    if (file_name in structure_files) {
-	return `${structure_directory}/${file_name}`;
+    const graph_file = `logs/${run_id}/graphs/${structure_id}/${time}.svg`;
+    if (fs.existsSync(graph_file)) {
+	return graph_file;
     }
     const python = spawn(
 	'python',
@@ -25,7 +24,7 @@ exports.get_graph = function(run_id, structure_id, time) {
     python.on('close', (code) => {
 	console.log(`child process exited with code ${code}`);
     });
-    return `${structure_directory}/${file_name}`;
+    return graph_file;
 }
 
 exports.json_to_html = function(input,query) {
@@ -124,27 +123,11 @@ structure_to_html = function(id, query) {
     if (id === null) {
 	return "undefined";
     }
-    var structure_directory = 'logs/' + query.run_id + '/structures/structures/' + id;
-    var structure_files = fs.readdirSync(structure_directory).filter(
-	(f) => {return f.endsWith("json")}
-    );
-    var structure_file = '';
-    var latest_time = -1;
+    var snapshot = structure_log.at(query.run_id, id, query.time);
     if (query.time === undefined) {
-	query.time = Infinity;
-    }
-    structure_files.forEach(file => {
-	time = Number(file.split(".")[0]);
-	if (time <= query.time && time > latest_time) {
-	    structure_file = file;
-	    latest_time = time;
-	}
-    });
-    if (query.time === Infinity) {
-	query.time = latest_time;
+	query.time = snapshot.time;
     }
-    structure_file = structure_directory + '/' + structure_file;
-    var structure_json = JSON.parse(fs.readFileSync(structure_file));
+    var structure_json = snapshot.structure;
     if (is_chunk_id(id)
 	|| is_contextual_space_id(id)
 	|| is_view_id(id)
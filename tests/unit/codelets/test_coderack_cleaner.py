@@ -29,14 +29,14 @@ def test_coderack_cleaner_removes_low_urgency_offending_codelets(
         bubble_chamber.loggers = {"activity": Mock()}
         bubble_chamber.satisfaction = current_satisfaction_score
         coderack = Coderack(Mock(), Mock())
-        coderack._codelets = [
-            OffendingCodelet(0.9),
-            OffendingCodelet(0.7),
-            OffendingCodelet(0.5),
-            OffendingCodelet(0.3),
-            OffendingCodelet(0.1),
-            NonOffendingCodelet(),
-        ]
+        coderack._codelets = {
+            OffendingCodelet(0.9): None,
+            OffendingCodelet(0.7): None,
+            OffendingCodelet(0.5): None,
+            OffendingCodelet(0.3): None,
+            OffendingCodelet(0.1): None,
+            NonOffendingCodelet(): None,
+        }
         coderack.recently_run = {OffendingCodelet}
         coderack_cleaner = CoderackCleaner(
             "", "", bubble_chamber, coderack, last_satisfaction_score, Mock()
@@ -0,0 +1,123 @@
+import random
+from unittest.mock import Mock
+
+from linguoplotter.location import Location
+from linguoplotter.structure_collections import StructureSet
+from linguoplotter.tools import centroid_euclidean_distance
+
+
+class Item:
+    def __init__(self, is_chunk: bool, parent_concept=None):
+        self.is_chunk = is_chunk
+        self.is_raw = False
+        self._parent_concept = parent_concept
+        self.indexing_sets = {}
+
+    @property
+    def parent_concept(self):
+        return self._parent_concept
+
+    @parent_concept.setter
+    def parent_concept(self, concept):
+        self._parent_concept = concept
+        for structure_set in list(self.indexing_sets.values()):
+            structure_set.reindex(self, "parent_concept")
+
+
+def test_indexed_where_matches_unindexed_where():
+    concept_a, concept_b = Mock(), Mock()
+    items = [Item(i % 2 == 0, concept_a if i % 3 else concept_b) for i in range(12)]
+    indexed = StructureSet(Mock(), items, indexed=True)
+    unindexed = StructureSet(Mock(), items)
+    for kwargs in [
+        {"is_chunk": True},
+        {"is_chunk": False, "is_raw": False},
+        {"parent_concept": concept_b},
+        {"is_chunk": True, "parent_concept": concept_a},
+    ]:
+        assert list(indexed.where(**kwargs)) == list(unindexed.where(**kwargs))
+
+
+def test_where_sees_frames_which_become_merged_frames():
+    items = [Item(False) for _ in range(3)]
+    for item in items:
+        item.is_merged_frame = False
+    indexed = StructureSet(Mock(), items, indexed=True)
+    assert list(indexed.where(is_merged_frame=True)) == []
+    items[1].is_merged_frame = True
+    assert list(indexed.where(is_merged_frame=True)) == [items[1]]
+    assert list(indexed.where(is_merged_frame=False)) == [items[0], items[2]]
+
+
+def test_indexes_follow_add_remove_and_reindex():
+    concept_a, concept_b = Mock(), Mock()
+    items = [Item(True, concept_a) for _ in range(4)]
+    indexed = StructureSet(Mock(), items[:3], indexed=True)
+    assert list(indexed.where(parent_concept=concept_a)) == items[:3]
+    indexed.add(items[3])
+    indexed.remove(items[0])
+    assert list(indexed.where(is_chunk=True)) == items[1:]
+    items[2].parent_concept = concept_b
+    items[1].parent_concept = concept_b
+    assert list(indexed.where(parent_concept=concept_b)) == items[1:3]
+    assert list(indexed.where(parent_concept=concept_a)) == [items[3]]
+    items[0].parent_concept = concept_b
+    assert items[0] not in indexed.where(parent_concept=concept_b)
+
+
+class PlacedItem(Item):
+    def __init__(self, is_chunk: bool, location: Location):
+        Item.__init__(self, is_chunk)
+        self.location = location
+
+    def location_in_space(self, space):
+        return self.location
+
+
+def test_indexed_near_matches_unindexed_near():
+    space = Mock(is_conceptual_space=True, no_of_dimensions=2)
+    space.parent_concept.distance_function = centroid_euclidean_distance
+    space.parent_concept.distance_to_proximity_weight = 1.5
+    generator = random.Random(0)
+
+    def location():
+        return Location([[generator.uniform(0, 20), generator.uniform(0, 20)]], space)
+
+    items = [PlacedItem(i % 3 > 0, location()) for i in range(200)]
+    indexed = StructureSet(Mock(), items[:150], indexed=True)
+    unindexed = StructureSet(Mock(), items[:150])
+
+    def assert_same_results():
+        for _ in range(20):
+            query = location()
+            assert list(indexed.near(query)) == list(unindexed.near(query))
+            assert list(indexed.near(query, is_chunk=True)) == list(
+                unindexed.near(query).where(is_chunk=True)
+            )
+
+    assert_same_results()
+    for item in items[150:]:
+        indexed.add(item)
+        unindexed.add(item)
+    for item in items[:50]:
+        indexed.remove(item)
+        unindexed.remove(item)
+    for item in items[50:100]:
+        item.location.coordinates = location().coordinates
+    assert_same_results()
+
+
+def test_empty_sets_share_their_structures_until_something_is_added():
+    item = Item(True)
+    structure_set = StructureSet(Mock(), [])
+    other_set = StructureSet(Mock(), [])
+    assert structure_set.structures is other_set.structures
+    assert structure_set.is_empty
+    assert list(structure_set.where(is_chunk=True)) == []
+    structure_set.remove(item)
+    structure_set.add(item)
+    assert structure_set.structures is not other_set.structures
+    assert list(structure_set) == [item]
+    assert other_set.is_empty
+    structure_set.remove(item)
+    assert structure_set.is_empty
@@ -0,0 +1,79 @@
+import random
+from unittest.mock import Mock
+
+from linguoplotter.activation_engine import ActivationEngine
+from linguoplotter.hyper_parameters import HyperParameters
+from linguoplotter.structure import Structure
+from linguoplotter.structure_collections import StructureSet
+
+
+def make_bubble_chamber():
+    bubble_chamber = Mock()
+    bubble_chamber.random_machine.select = lambda collection, *_: list(collection)[0]
+    return bubble_chamber
+
+
+def make_node(activation):
+    node = Structure(
+        Mock(),
+        Mock(),
+        [],
+        Mock(),
+        StructureSet(Mock(), []),
+        StructureSet(Mock(), []),
+        Mock(),
+        Mock(),
+        Mock(),
+    )
+    node._activation = activation
+    node._activation_buffer = activation / 2
+    node.instances = StructureSet(Mock(), [])
+    node.hyper_parameters = HyperParameters(
+        ACTIVATION_UPDATE_RELATIVES_WEIGHT=0.5,
+        ACTIVATION_UPDATE_INSTANCES_WEIGHT=0.2,
+    )
+    return node
+
+
+def relate(start, end, activation):
+    relation = Mock(is_relation=True, activation=activation)
+    relation.arguments = StructureSet(make_bubble_chamber(), [start, end])
+    start.links_out.add(relation)
+    end.links_in.add(relation)
+
+
+def scalar_buffers(nodes):
+    buffers = [node._activation_buffer for node in nodes]
+    for node in nodes:
+        node.recalculate_activation()
+    expected = [node._activation_buffer for node in nodes]
+    for node, buffer in zip(nodes, buffers):
+        node._activation_buffer = buffer
+    return expected
+
+
+def test_recalculate_activations_matches_scalar_rule():
+    rng = random.Random(0)
+    nodes = [make_node(rng.choice([1.0, rng.random()])) for _ in range(20)]
+    for _ in range(40):
+        relate(rng.choice(nodes), rng.choice(nodes), rng.random())
+    for node in nodes:
+        for _ in range(rng.randint(0, 3)):
+            node.instances.add(Mock(quality=rng.random(), activation=rng.random()))
+    engine = ActivationEngine()
+    expected = scalar_buffers(nodes)
+    engine.recalculate_activations(nodes)
+    assert [node._activation_buffer for node in nodes] == expected
+
+    relate(nodes[0], nodes[1], 1.0)
+    nodes[1]._activation = 1.0
+    expected = scalar_buffers(nodes)
+    engine.recalculate_activations(nodes)
+    assert [node._activation_buffer for node in nodes] == expected
+
+
+def test_recalculate_activations_uses_own_method_for_other_structures():
+    space = Mock()
+    engine = ActivationEngine()
+    engine.recalculate_activations([space])
+    space.recalculate_activation.assert_called_once()
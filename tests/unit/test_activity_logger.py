@@ -0,0 +1,58 @@
+import io
+import json
+from unittest.mock import Mock
+
+from linguoplotter.loggers import ActivityLogger
+
+
+class Targets:
+    def __dict__(self) -> dict:
+        return {}
+
+
+def test_codelets_can_be_read_from_their_index():
+    codelets_stream = io.StringIO()
+    codelets_index_stream = io.StringIO()
+    logger = ActivityLogger(
+        codelets_stream, codelets_index_stream=codelets_index_stream
+    )
+    for codelet_id in ["ChunkSuggester1", "LabelSuggester2"]:
+        codelet = Mock(
+            codelet_id=codelet_id,
+            parent_id="",
+            urgency=0.5,
+            targets=Targets(),
+            child_codelets=[],
+        )
+        codelet.result.name = "SUCCESS"
+        codelet.child_structures = None
+        codelet.bubble_chamber.satisfaction = 0.0
+        codelet.bubble_chamber.views = []
+        codelet.bubble_chamber.focus.view = None
+        codelet.bubble_chamber.worldview.view = None
+        logger.log_codelet_start(codelet)
+        logger.log(f"Running {codelet_id}")
+        logger.log_codelet_end(10)
+    codelets = codelets_stream.getvalue()
+    index = [line.split(",") for line in codelets_index_stream.getvalue().split()]
+    assert [(time, codelet_id) for time, codelet_id, _, _ in index] == [
+        ("1", "ChunkSuggester1"),
+        ("2", "LabelSuggester2"),
+    ]
+    for time, codelet_id, offset, length in index:
+        record = json.loads(codelets[int(offset) : int(offset) + int(length)])
+        assert record["id"] == codelet_id
+        assert record["time"] == int(time)
+        assert record["activity"] == [f"Running {codelet_id}"]
+
+
+def test_messages_are_formatted_with_their_args():
+    logger = ActivityLogger(io.StringIO())
+    logger.codelet_json = {"activity": []}
+    logger.log("{} added to {}", "Chunk1", "chunks").log("Quality: {}", 0.5)
+    logger.log("Unformatted {}")
+    assert logger.codelet_json["activity"] == [
+        "Chunk1 added to chunks",
+        "Quality: 0.5",
+        "Unformatted {}",
+    ]
@@ -0,0 +1,121 @@
+import csv
+import json
+import os
+import pathlib
+
+import pytest
+
+from linguoplotter.batch import run_grid
+from linguoplotter.linguoplotter import Linguoplotter
+
+ROOT = pathlib.Path(__file__).parents[2]
+
+
+@pytest.fixture
+def hyper_parameters_file(tmp_path):
+    with open(ROOT / "default_hyper_parameters.json") as f:
+        hyper_parameters = json.load(f)
+    hyper_parameters["CODELET_RUN_LIMIT"] = 30
+    hyper_parameters["TESTING"] = True
+    hyper_parameters_file = tmp_path / "hyper_parameters.json"
+    hyper_parameters_file.write_text(json.dumps(hyper_parameters))
+    return str(hyper_parameters_file)
+
+
+def run(hyper_parameters_file, seeds, **kwargs):
+    return run_grid(
+        [hyper_parameters_file],
+        ["narration-1.lisp"],
+        seeds,
+        program_directory=str(ROOT / "example-programs/weather"),
+        builtin_file=str(ROOT / "builtin.lisp"),
+        **kwargs,
+    )
+
+
+def test_run_grid_gives_the_same_results_in_parallel(hyper_parameters_file):
+    working_directory = os.getcwd()
+
+    def results(processes):
+        return sorted(
+            [
+                (result["random_seed"], result["Program"], result["codelets_run"])
+                for result in run(hyper_parameters_file, [1, 2], processes=processes)
+            ]
+        )
+
+    sequential = results(1)
+    assert sequential == results(2)
+    assert [seed for seed, _, _ in sequential] == [1, 2]
+    assert os.getcwd() == working_directory
+
+
+def test_runs_from_a_knowledge_base_snapshot_match_full_runs(
+    hyper_parameters_file, tmp_path
+):
+    def codelet_ids(knowledge_base_file):
+        logs_directory = tmp_path / str(knowledge_base_file is not None)
+        logs_directory.mkdir()
+        for _ in run(
+            hyper_parameters_file,
+            [3],
+            knowledge_base_file=knowledge_base_file,
+            logs_directory=str(logs_directory),
+            processes=1,
+        ):
+            pass
+        (log,) = logs_directory.glob("*/codelet_times.csv")
+        with open(log) as f:
+            return [row["id"] for row in csv.DictReader(f)]
+
+    assert codelet_ids(None) == codelet_ids(
+        str(ROOT / "example-programs/weather/narration-kb.lisp")
+    )
+
+
+def test_development_runs_log_the_knowledge_base_first(hyper_parameters_file, tmp_path):
+    for _ in run(
+        hyper_parameters_file,
+        [1],
+        logs_directory=str(tmp_path),
+        development=True,
+        processes=1,
+    ):
+        pass
+    (log,) = tmp_path.glob("*/structures.jsonl")
+    with open(log) as f:
+        records = [json.loads(line) for line in f]
+    first_chunk = next(
+        i for i, record in enumerate(records) if record["id"].startswith("Chunk")
+    )
+    names = {record["changes"].get("name") for record in records[:first_chunk]}
+    assert {"input", "text", "activity"} <= names
+
+
+def test_texts_of_parallel_runs_are_gathered_whole(
+    hyper_parameters_file, tmp_path, monkeypatch
+):
+    run_narrator = Linguoplotter.run
+
+    def run_and_log_texts(narrator):
+        for time in range(100):
+            narrator.loggers["text"].log_text(time, "it is hot " * 20, 0.5)
+        return run_narrator(narrator)
+
+    monkeypatch.setattr(Linguoplotter, "run", run_and_log_texts)
+    results = list(
+        run(
+            hyper_parameters_file,
+            [1, 2, 3],
+            logs_directory=str(tmp_path),
+            log_intermediate_texts=True,
+            processes=3,
+        )
+    )
+    assert all("texts_file" not in result for result in results)
+    assert len(list(tmp_path.glob("*/texts.csv"))) == 3
+    with open(tmp_path / "texts.csv") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 300
+    assert all(len(row) == 6 for row in rows)
+    assert sorted(row[1] for row in rows) == ["1"] * 100 + ["2"] * 100 + ["3"] * 100
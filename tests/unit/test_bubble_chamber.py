@@ -1,7 +1,11 @@
+import pathlib
 import pytest
 from unittest.mock import Mock
 
 from linguoplotter.bubble_chamber import BubbleChamber
+from linguoplotter.hyper_parameters import HyperParameters
+from linguoplotter.interpreter import Interpreter
+from linguoplotter.loggers import MockLogger
 from linguoplotter.random_machine import RandomMachine
 from linguoplotter.structure_collection import StructureCollection
 
@@ -15,3 +19,117 @@ def test_setup():
     bubble_chamber = BubbleChamber.setup(Mock(), random_seed=1)
     assert isinstance(bubble_chamber.random_machine, RandomMachine)
     assert bubble_chamber.random_machine.seed == 1
+
+
+def test_aggregate_views_are_rebuilt_only_after_changes():
+    bubble_chamber = BubbleChamber.setup(Mock(), {})
+    chunk, label = Mock(indexing_sets={}), Mock(indexing_sets={})
+    bubble_chamber.chunks.add(chunk)
+    structures = bubble_chamber.structures
+    assert bubble_chamber.structures is structures
+    assert list(structures) == [chunk]
+    bubble_chamber.labels.add(label)
+    assert bubble_chamber.structures is not structures
+    assert list(bubble_chamber.structures) == [chunk, label]
+    bubble_chamber.chunks.remove(chunk)
+    assert list(bubble_chamber.structures) == [label]
+
+
+def test_satisfaction_is_only_recalculated_after_changes():
+    bubble_chamber = BubbleChamber.setup(Mock(), {})
+    bubble_chamber.random_machine = Mock()
+    bubble_chamber.focus = Mock(satisfaction=0.5)
+    bubble_chamber.recalculate_general_satisfaction = Mock()
+    bubble_chamber.recalculate_satisfaction()
+    bubble_chamber.recalculate_satisfaction()
+    assert bubble_chamber.focus.recalculate_satisfaction.call_count == 1
+    assert bubble_chamber.satisfaction == 0.5
+    bubble_chamber.chunks.add(Mock(indexing_sets={}))
+    bubble_chamber.recalculate_satisfaction()
+    assert bubble_chamber.focus.recalculate_satisfaction.call_count == 2
+    assert bubble_chamber.random_machine.recalculate_determinism.call_count == 3
+
+
+def test_classifications_are_reused_until_structures_change():
+    bubble_chamber = BubbleChamber.setup(Mock(), {})
+    classifier = Mock()
+    classifier.classify.return_value = 0.5
+    start, end, space = Mock(), Mock(), Mock()
+    assert bubble_chamber.classify(classifier, start=start, space=space) == 0.5
+    assert bubble_chamber.classify(classifier, space=space, start=start) == 0.5
+    assert classifier.classify.call_count == 1
+    bubble_chamber.classify(classifier, start=start, end=end, space=space)
+    assert classifier.classify.call_count == 2
+    assert bubble_chamber.classification_hits == 1
+    assert bubble_chamber.classification_misses == 2
+    bubble_chamber.chunks.add(Mock(indexing_sets={}))
+    bubble_chamber.classify(classifier, start=start, space=space)
+    assert classifier.classify.call_count == 3
+    bubble_chamber.classify(classifier, collection=Mock(), space=space)
+    bubble_chamber.classify(classifier, collection=Mock(), space=space)
+    assert classifier.classify.call_count == 5
+    assert bubble_chamber.classification_misses == 3
+
+
+def test_load_raw_input_matches_def_chunk_forms():
+    root = pathlib.Path(__file__).parents[2]
+
+    def interpret(program):
+        loggers = {"activity": MockLogger(), "structure": MockLogger()}
+        bubble_chamber = BubbleChamber.setup(HyperParameters(), loggers)
+        interpreter = Interpreter(bubble_chamber)
+        interpreter.interpret_file(str(root / "builtin.lisp"))
+        interpreter.interpret_file(
+            str(root / "example-programs/weather/narration-kb.lisp")
+        )
+        interpreter.interpret_string(program)
+        return bubble_chamber
+
+    def raw_chunks(bubble_chamber):
+        return [
+            [(location.space.name, location.coordinates) for location in c.locations]
+            for c in bubble_chamber.chunks
+            if c.is_raw
+        ]
+
+    def_chunk_forms = "".join(
+        f"""(def-chunk :is_raw True :parent_space input-space
+        :locations (list (Location (list) input-space)
+                         (Location (list (list {t})) temperature-space)
+                         (Location (list (list 0)) time-space)
+                         (Location (list (list {n} {e})) location-space)))"""
+        for t, n, e in [(3, 1, 1), (5, 1, 3), (4, 3, 1)]
+    )
+    load_raw_input_form = """(load-raw-input
+      (list (list 3 0 1 1) (list 5 0 1 3) (list 4 0 3 1)) input-space
+      (list temperature-space time-space location-space))"""
+    from_forms = interpret(def_chunk_forms)
+    from_rows = interpret(load_raw_input_form)
+    assert len(raw_chunks(from_rows)) == 3
+    assert raw_chunks(from_rows) == raw_chunks(from_forms)
+    assert [len(c.contents) for c in from_rows.contextual_spaces] == [
+        len(c.contents) for c in from_forms.contextual_spaces
+    ]
+
+    with pytest.raises(ValueError):
+        from_rows.load_raw_input(
+            [[1, 2]],
+            from_rows.contextual_spaces["input"],
+            [from_rows.conceptual_spaces["temperature"]],
+        )
+
+
+def test_structures_share_the_bubble_chamber_hyper_parameters():
+    root = pathlib.Path(__file__).parents[2]
+    hyper_parameters = HyperParameters(DECAY_RATE=0.1)
+    loggers = {"activity": MockLogger(), "structure": MockLogger()}
+    bubble_chamber = BubbleChamber.setup(hyper_parameters, loggers)
+    interpreter = Interpreter(bubble_chamber)
+    interpreter.interpret_file(str(root / "builtin.lisp"))
+    for structure in bubble_chamber.structures:
+        assert structure.hyper_parameters is hyper_parameters
+        assert structure.DECAY_RATE == 0.1
+    concept = bubble_chamber.concepts.get()
+    assert concept.is_concept and concept.is_node and not concept.is_link
+    with pytest.raises(AttributeError):
+        concept.undeclared_attribute = None
@@ -1,8 +1,12 @@
 import pytest
 from unittest.mock import Mock
 
+from linguoplotter.codelets import Suggester
 from linguoplotter.coderack import Coderack
+from linguoplotter.errors import NoMoreCodelets
+from linguoplotter.hyper_parameters import HyperParameters
 from linguoplotter.random_machine import RandomMachine
+from linguoplotter.structure_collections import StructureDict, StructureSet
 
 
 @pytest.mark.parametrize(
@@ -43,7 +47,117 @@ def test_select_a_codelet(
     for urgency_value in urgency_values:
         codelet = Mock()
         codelet.urgency = urgency_value
-        coderack._codelets.append(codelet)
+        coderack._codelets[codelet] = None
     for expected_urgency in expected_urgencies:
         codelet = coderack._select_a_codelet()
         assert expected_urgency == codelet.urgency
+
+
+class SuggesterA(Suggester):
+    pass
+
+
+class SuggesterB(Suggester):
+    pass
+
+
+def make_suggester(suggester_class, bubble_chamber, targets, urgency):
+    return suggester_class(
+        "", "", bubble_chamber, StructureDict(bubble_chamber, targets), urgency
+    )
+
+
+def test_add_codelet_merges_codelets_with_equal_targets():
+    bubble_chamber = Mock()
+    coderack = Coderack(bubble_chamber, HyperParameters(), Mock())
+    structure_one, structure_two = Mock(), Mock()
+    existing = make_suggester(
+        SuggesterA, bubble_chamber, {"start": structure_one, "end": None}, 0.25
+    )
+    coderack.add_codelet(existing)
+    duplicate = make_suggester(
+        SuggesterA, bubble_chamber, {"start": structure_one, "end": None}, 0.5
+    )
+    coderack.add_codelet(duplicate)
+    assert coderack.population_size == 1
+    assert existing.urgency == 0.75
+    other_type = make_suggester(
+        SuggesterB, bubble_chamber, {"start": structure_one, "end": None}, 0.5
+    )
+    other_targets = make_suggester(
+        SuggesterA, bubble_chamber, {"start": structure_two, "end": None}, 0.5
+    )
+    coderack.add_codelet(other_type)
+    coderack.add_codelet(other_targets)
+    assert coderack.population_size == 3
+    coderack.remove_codelet(existing)
+    coderack.add_codelet(duplicate)
+    assert coderack.population_size == 3
+    assert duplicate in coderack._codelets
+
+
+def test_add_codelet_merges_codelets_targeting_equal_empty_sets():
+    bubble_chamber = Mock()
+    coderack = Coderack(bubble_chamber, HyperParameters(), Mock())
+    structure = Mock()
+    emptied_set = StructureSet(bubble_chamber, {structure: True})
+    emptied_set.remove(structure)
+    existing = make_suggester(
+        SuggesterA, bubble_chamber, {"frames": StructureSet(bubble_chamber, {})}, 0.25
+    )
+    coderack.add_codelet(existing)
+    duplicate = make_suggester(SuggesterA, bubble_chamber, {"frames": emptied_set}, 0.5)
+    coderack.add_codelet(duplicate)
+    assert coderack.population_size == 1
+    assert existing.urgency == 0.75
+
+
+def test_sum_tree_selection_tracks_urgency_changes():
+    bubble_chamber = Mock()
+    bubble_chamber.random_machine = RandomMachine(
+        bubble_chamber, HyperParameters(), seed=1
+    )
+    bubble_chamber.random_machine.randomness = 0.0
+    coderack = Coderack(
+        bubble_chamber, HyperParameters(SUM_TREE_CODELET_SELECTION=True), Mock()
+    )
+    codelets = [
+        make_suggester(SuggesterA, bubble_chamber, {"start": Mock()}, 0.5)
+        for _ in range(10)
+    ]
+    for codelet in codelets:
+        coderack.add_codelet(codelet)
+    for codelet in codelets[:-1]:
+        codelet.urgency = 0.0
+    assert codelets[-1] == coderack._select_a_codelet()
+    assert coderack.population_size == 9
+    bubble_chamber.random_machine.randomness = 1.0
+    selected = {coderack._select_a_codelet() for _ in range(9)}
+    assert selected == set(codelets[:-1])
+    with pytest.raises(NoMoreCodelets):
+        coderack._select_a_codelet()
+
+
+def test_sum_tree_selection_with_no_urgency_left():
+    bubble_chamber = Mock()
+    bubble_chamber.random_machine = RandomMachine(
+        bubble_chamber, HyperParameters(), seed=1
+    )
+    bubble_chamber.random_machine.randomness = 0.0
+    coderack = Coderack(
+        bubble_chamber, HyperParameters(SUM_TREE_CODELET_SELECTION=True), Mock()
+    )
+    codelets = [
+        make_suggester(SuggesterA, bubble_chamber, {"start": Mock()}, urgency)
+        for urgency in (0.1, 0.2, 0.3, 0.7)
+    ]
+    for codelet in codelets:
+        coderack.add_codelet(codelet)
+    coderack._select_a_codelet()
+    for codelet in codelets:
+        codelet.urgency = 0.0
+    selected = {coderack._select_a_codelet() for _ in range(3)}
+    assert len(selected) == 3
+    assert selected < set(codelets)
+    with pytest.raises(NoMoreCodelets):
+        coderack._select_a_codelet()
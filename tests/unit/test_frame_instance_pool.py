@@ -0,0 +1,105 @@
+import pathlib
+from unittest.mock import Mock
+
+from linguoplotter.bubble_chamber import BubbleChamber
+from linguoplotter.hyper_parameters import HyperParameters
+from linguoplotter.interpreter import Interpreter
+from linguoplotter.loggers import MockLogger
+
+
+def setup_bubble_chamber(pool_size):
+    root = pathlib.Path(__file__).parents[2]
+    loggers = {"activity": MockLogger(), "structure": MockLogger()}
+    bubble_chamber = BubbleChamber.setup(
+        HyperParameters(FRAME_INSTANCE_POOL_SIZE=pool_size), loggers
+    )
+    interpreter = Interpreter(bubble_chamber)
+    interpreter.interpret_file(str(root / "builtin.lisp"))
+    interpreter.interpret_file(str(root / "example-programs/weather/narration-kb.lisp"))
+    return bubble_chamber
+
+
+def instantiate(bubble_chamber, frame, parent_id=""):
+    return bubble_chamber.frame_instance_pool.instantiate(
+        frame,
+        input_space=frame.input_space,
+        conceptual_spaces_map={},
+        parent_id=parent_id,
+        bubble_chamber=bubble_chamber,
+    )
+
+
+def garbage_collect(bubble_chamber, instance):
+    bubble_chamber.frame_instance_pool.add(instance)
+    bubble_chamber.remove(instance)
+
+
+def test_discarded_instances_are_reset_and_reused():
+    bubble_chamber = setup_bubble_chamber(1)
+    pool = bubble_chamber.frame_instance_pool
+    frame = bubble_chamber.frames.where(name="s-be").get()
+    instance = instantiate(bubble_chamber, frame)
+    other_instance = instantiate(bubble_chamber, frame)
+    chunk = instance.output_space.contents.where(is_chunk=True).get()
+    coordinates = chunk.location_in_space(instance.output_space).coordinates
+    sub_frames = list(instance.sub_frames)
+    structure_ids = {instance.structure_id, chunk.structure_id}
+    name = instance.name
+    instance.parent_view = Mock()
+    instance.activation = 1.0
+    chunk.location_in_space(instance.output_space).coordinates = [[9]]
+    chunk.parent_spaces.remove(instance.output_space)
+    instance.output_space.contents.remove(chunk)
+    instance.sub_frames.remove(sub_frames[0])
+    garbage_collect(bubble_chamber, instance)
+    garbage_collect(bubble_chamber, other_instance)
+    assert len(pool) == 1
+    assert instantiate(bubble_chamber, frame, parent_id="ViewBuilder1") is instance
+    assert pool.hits == 1 and pool.misses == 2 and pool.hit_rate == 1 / 3
+    assert instance in bubble_chamber.frames
+    assert instance.parent_view is None
+    assert instance.activation == 0.0
+    assert chunk in instance.output_space.contents
+    assert instance.output_space in chunk.parent_spaces
+    assert chunk.location_in_space(instance.output_space).coordinates == coordinates
+    assert list(instance.sub_frames) == sub_frames
+    assert not structure_ids & {instance.structure_id, chunk.structure_id}
+    assert instance.name != name
+    assert instance.parent_id == "ViewBuilder1"
+    assert instance in frame.instances
+    assert all(
+        sub_frame in sub_frame.parent_frame.instances for sub_frame in sub_frames
+    )
+
+
+def test_instances_linked_to_other_structures_are_not_reused():
+    bubble_chamber = setup_bubble_chamber(1)
+    pool = bubble_chamber.frame_instance_pool
+    frame = bubble_chamber.frames.where(name="ap[jj]").get()
+    instance = instantiate(bubble_chamber, frame)
+    instance.input_space.contents.get().links_in.add(Mock(indexing_sets={}))
+    garbage_collect(bubble_chamber, instance)
+    assert instantiate(bubble_chamber, frame) is not instance
+    assert pool.hits == 0 and pool.misses == 2
+    assert len(pool) == 0
+
+
+def test_instances_are_not_pooled_by_default():
+    bubble_chamber = setup_bubble_chamber(0)
+    frame = bubble_chamber.frames.where(name="ap[jj]").get()
+    instance = instantiate(bubble_chamber, frame)
+    garbage_collect(bubble_chamber, instance)
+    assert instantiate(bubble_chamber, frame) is not instance
+    assert len(bubble_chamber.frame_instance_pool) == 0
+
+
+def test_records_of_instances_removed_without_the_pool_are_dropped():
+    bubble_chamber = setup_bubble_chamber(1)
+    pool = bubble_chamber.frame_instance_pool
+    frame = bubble_chamber.frames.where(name="ap[jj]").get()
+    instance = instantiate(bubble_chamber, frame)
+    bubble_chamber.remove(instance)
+    assert instance not in pool._records
+    pool.add(instance)
+    assert len(pool) == 0
+    assert instantiate(bubble_chamber, frame) is not instance
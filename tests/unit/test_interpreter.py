@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock
 
 from linguoplotter.bubble_chamber import BubbleChamber
+from linguoplotter import interpreter as interpreter_module
 from linguoplotter.interpreter import Interpreter
 
 
@@ -16,11 +17,11 @@ def test_parse():
     )
     parse_tree = interpreter.parse(program)
 
-    assert parse_tree == [
+    assert parse_tree == (
         "eval",
-        ["define", "input-concept", ["def-concept", "bla", "blah"]],
-        ["define", "input-space", ["def-contextual-space", "blu", "bluh"]],
-    ]
+        ("define", "input-concept", ("def-concept", "bla", "blah")),
+        ("define", "input-space", ("def-contextual-space", "blu", "bluh")),
+    )
 
 
 def test_evaluate():
@@ -92,3 +93,85 @@ def test_interpret_file(tmpdir):
     input_concept = bubble_chamber.concepts["input"]
     assert input_concept.name == "input"
     assert input_concept.depth == 1.0
+
+
+def test_load_skips_files_which_have_already_been_interpreted(tmpdir):
+    interpreter = Interpreter(Mock())
+
+    knowledge_base = tmpdir.join("knowledge_base")
+    with open(knowledge_base.strpath, "w") as f:
+        f.write("(define x (list 1))")
+    program = tmpdir.join("program")
+    with open(program.strpath, "w") as f:
+        f.write('(define x (list 2))\n(load "knowledge_base")')
+
+    interpreter.interpret_file(knowledge_base.strpath)
+    interpreter.interpret_file(program.strpath)
+    assert interpreter.names["x"] == [2]
+
+
+def test_evaluate_leaves_the_parse_tree_intact():
+    interpreter = Interpreter(Mock())
+    parse_tree = interpreter.parse('(define a (dict (list (tuple "k" 1))))')
+    interpreter.evaluate(parse_tree)
+    interpreter.evaluate(parse_tree)
+    assert parse_tree == (
+        "eval",
+        ("define", "a", ("dict", ("list", ("tuple", '"k"', 1)))),
+    )
+    assert interpreter.names["a"] == {"k": 1}
+
+
+def test_parse_file_reuses_cached_parse_trees(tmpdir):
+    interpreter = Interpreter(Mock())
+    program = tmpdir.join("program")
+    with open(program.strpath, "w") as f:
+        f.write("(define x (list 1))")
+
+    parse_tree = interpreter.parse_file(program.strpath)
+    assert tmpdir.join("__lispcache__", "program.pickle").check()
+
+    interpreter_module._PARSE_TREES.clear()
+    interpreter.parse = Mock()
+    assert interpreter.parse_file(program.strpath) == parse_tree
+    interpreter.parse.assert_not_called()
+
+    with open(program.strpath, "w") as f:
+        f.write("(define x (list 1 2))")
+    interpreter.parse = Interpreter(Mock()).parse
+    interpreter.interpret_file(program.strpath)
+    assert interpreter.names["x"] == [1, 2]
+
+
+def test_tokenize():
+    interpreter = Interpreter(Mock())
+    program = '(define s """hello (big) world""")\n(f :x -1.5)'
+    assert interpreter.tokenize(program) == [
+        "(",
+        "define",
+        "s",
+        '"hello (big) world"',
+        ")",
+        "(",
+        "f",
+        ":x",
+        "-1.5",
+        ")",
+    ]
+    with pytest.raises(SyntaxError):
+        interpreter.tokenize('(define s """hello)')
+    with pytest.raises(SyntaxError):
+        interpreter.parse("(define s 1))")
+
+
+def test_load_finds_files_relative_to_a_relative_file_name(tmpdir):
+    interpreter = Interpreter(Mock())
+    tmpdir.mkdir("programs")
+    with open(tmpdir.join("programs", "knowledge_base").strpath, "w") as f:
+        f.write("(define x (list 1))")
+    with open(tmpdir.join("programs", "program").strpath, "w") as f:
+        f.write('(load "knowledge_base")')
+
+    with tmpdir.as_cwd():
+        interpreter.interpret_file("programs/program")
+    assert interpreter.names["x"] == [1]
@@ -1,5 +1,7 @@
+import gc
 import pytest
 from unittest.mock import Mock
+import weakref
 
 from linguoplotter.location import Location
 from linguoplotter.tools import centroid_euclidean_distance
@@ -63,3 +65,36 @@ def test_is_near(self_coordinates, other_coordinates, nearness, expected):
     location_1 = Location(self_coordinates, space)
     location_2 = Location(other_coordinates, space)
     assert expected == location_1.is_near(location_2)
+
+
+def test_distances_are_remembered_until_coordinates_change():
+    distance_function = Mock(side_effect=centroid_euclidean_distance)
+    a = Location([[0, 0]], Mock())
+    b = Location([[3, 4]], Mock())
+    assert a.distance_to(b, distance_function) == 5
+    assert a.distance_to(b, distance_function) == 5
+    assert distance_function.call_count == 1
+    b.coordinates = [[6, 8]]
+    assert a.distance_to(b, distance_function) == 10
+    a.coordinates = [[3, 4]]
+    assert a.distance_to(b, distance_function) == 5
+    assert a.distance_to(b, distance_function, return_nan=True) == 5
+    assert distance_function.call_count == 4
+
+
+def test_remembered_distances_do_not_keep_locations_alive():
+    distance_function = Mock(side_effect=centroid_euclidean_distance)
+    a = Location([[0, 0]], Mock())
+    b = Location([[3, 4]], Mock())
+    b_reference = weakref.ref(b)
+    assert a.distance_to(b, distance_function) == 5
+    del b
+    gc.collect()
+    assert b_reference() is None
+    others = [
+        Location([[i, 0]], Mock())
+        for i in range(Location.MAXIMUM_REMEMBERED_DISTANCES + 1)
+    ]
+    for other in others:
+        a.distance_to(other, distance_function)
+    assert len(a._distances) <= Location.MAXIMUM_REMEMBERED_DISTANCES
@@ -0,0 +1,19 @@
+from unittest.mock import MagicMock
+
+from linguoplotter.loggers import MockLogger
+
+
+class Unserialisable:
+    def __dict__(self) -> dict:
+        raise AssertionError
+
+
+def test_nothing_is_formatted_or_serialised():
+    logger = MockLogger()
+    structure = MagicMock()
+    assert not logger.is_enabled
+    assert logger.log("{} added to {}", structure, "chunks") == logger
+    assert logger.log_set(Unserialisable()) == logger
+    assert logger.log_dict(Unserialisable(), "targets") == logger
+    assert structure.mock_calls == []
+    structure.__str__.assert_not_called()
@@ -1,8 +1,32 @@
+from collections import Counter
 import pytest
 import random
 from unittest.mock import Mock, patch
 
-from linguoplotter.random_machine import RandomMachine
+from linguoplotter.errors import MissingStructureError
+from linguoplotter.random_machine import DistinctPairs, RandomMachine
+from linguoplotter.sum_tree import SumTree
+
+
+def test_random_machines_do_not_share_state():
+    random_machine_1 = RandomMachine(Mock(), Mock(), seed=1)
+    random_machine_2 = RandomMachine(Mock(), Mock(), seed=1)
+    numbers_1 = [random_machine_1.generate_number()]
+    random.seed(2)
+    numbers_2 = [random_machine_2.generate_number(), random_machine_2.generate_number()]
+    numbers_1.append(random_machine_1.generate_number())
+    assert numbers_1 == numbers_2
+
+
+def test_generate_numbers_matches_generate_number():
+    random_machine_1 = RandomMachine(Mock(), Mock(), seed=1)
+    random_machine_2 = RandomMachine(Mock(), Mock(), seed=1)
+    assert random_machine_1.generate_numbers(5) == [
+        random_machine_2.generate_number() for _ in range(5)
+    ]
+    assert random_machine_1.generate_numbers(3, minimum=0.5) == [
+        random_machine_2.generate_number(minimum=0.5) for _ in range(3)
+    ]
 
 
 def test_random_machine_seed():
@@ -35,7 +59,7 @@ def test_randomize_number(satisfaction, number, random_number, expected):
     bubble_chamber.satisfaction = satisfaction
     random_machine = RandomMachine(bubble_chamber)
     random_machine.determinism_smoothing_function = lambda x: x
-    with patch.object(random, "random", return_value=random_number):
+    with patch.object(random_machine.generator, "random", return_value=random_number):
         assert expected == random_machine.randomize_number(number)
 
 
@@ -63,3 +87,86 @@ def test_select():
 
     selection = random_machine.select(collection, lambda x: x.quality)
     assert selection == b
+
+
+def test_distinct_pairs():
+    items = ["a", "b", "c", "d"]
+    pairs = [(a, b) for a in items for b in items if a != b]
+    assert list(DistinctPairs(items)) == pairs
+    assert DistinctPairs(items)[-1] == pairs[-1]
+    assert len(DistinctPairs(["a"])) == 0
+    with pytest.raises(IndexError):
+        DistinctPairs(items)[len(pairs)]
+
+
+@pytest.mark.parametrize("number_of_items, determinism", [(4, 0.9), (60, 0.01)])
+def test_select_pair_matches_select_from_every_pair(number_of_items, determinism):
+    items = list(range(number_of_items))
+    pairs = [(a, b) for a in items for b in items if a != b]
+    random_machine_1 = RandomMachine(Mock(), Mock(), seed=1)
+    random_machine_2 = RandomMachine(Mock(), Mock(), seed=1)
+    for random_machine in (random_machine_1, random_machine_2):
+        random_machine.determinism = determinism
+        random_machine.randomness = 1 - determinism
+    key = lambda x: (x[0] * 7 + x[1]) % 10 / 10
+    for _ in range(10):
+        assert random_machine_1.select_pair(items, key=key) == (
+            random_machine_2.select(pairs, key=key)
+        )
+
+
+def test_select_does_not_change_collection_or_exclude():
+    random_machine = RandomMachine(Mock(), Mock(), seed=1)
+    random_machine.determinism = 0.5
+    random_machine.randomness = 0.5
+    collection = {"a": True, "b": True, "c": True}
+    exclude = ["a", "b"]
+    assert random_machine.select(collection, exclude=exclude) == "c"
+    assert collection == {"a": True, "b": True, "c": True}
+    assert exclude == ["a", "b"]
+    assert random_machine.select(iter(["d"])) == "d"
+    with pytest.raises(MissingStructureError):
+        random_machine.select(collection, exclude=["a", "b", "c"])
+
+
+def test_select_skips_keys_without_determinism():
+    random_machine = RandomMachine(Mock(), Mock(), seed=1)
+    random_machine.determinism = 0
+    random_machine.randomness = 1
+    key = Mock(return_value=1)
+    assert random_machine.select(["a", "b", "c"], key=key) in ["a", "b", "c"]
+    key.assert_not_called()
+
+
+@pytest.mark.parametrize("determinism", [0.0, 0.5, 0.9])
+def test_select_index_and_select_pick_frequencies(determinism):
+    urgencies = [0.1, 0.2, 0.3, 0.4, 0.5]
+    random_machine = RandomMachine(Mock(), Mock(), seed=1)
+    random_machine.determinism = determinism
+    random_machine.randomness = 1 - determinism
+    draws = 5000
+    sampled = Counter(
+        random_machine.select(range(5), key=lambda i: urgencies[i])
+        for _ in range(draws)
+    )
+    weighted = Counter(
+        random_machine.select_index(SumTree(urgencies), SumTree([1] * 5))
+        for _ in range(draws)
+    )
+    # select_index draws in proportion to urgency with probability equal to
+    # determinism and uniformly otherwise
+    for i, urgency in enumerate(urgencies):
+        expected = determinism * urgency / sum(urgencies) + (1 - determinism) / 5
+        assert weighted[i] / draws == pytest.approx(expected, abs=0.03)
+    # both favour more urgent codelets, but select picks the most urgent
+    # far more often once determinism is high
+    for i in range(4):
+        assert sampled[i] <= sampled[i + 1] or determinism == 0.0
+        assert weighted[i] <= weighted[i + 1] or determinism == 0.0
+    if determinism == 0.0:
+        assert sampled[4] / draws == pytest.approx(0.2, abs=0.03)
+    else:
+        assert sampled[4] > weighted[4]
+    if determinism == 0.9:
+        assert sampled[4] / draws > 0.9
+        assert weighted[4] / draws < 0.4
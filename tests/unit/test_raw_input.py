@@ -0,0 +1,24 @@
+import numpy
+import pytest
+
+from linguoplotter.raw_input import read_rows
+
+
+def test_read_rows_from_csv(tmp_path):
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("temperature,time,north,east\n3,0,1,1\n4.5,0,1,3\n")
+    rows = read_rows(str(csv_file))
+    assert rows == [[3.0, 0, 1, 1], [4.5, 0, 1, 3]]
+    assert all(isinstance(row[1], int) for row in rows)
+
+
+def test_read_rows_from_npy(tmp_path):
+    npy_file = tmp_path / "input.npy"
+    numpy.save(npy_file, numpy.array([[3, 0, 1, 1], [5, 0, 1, 3]]))
+    rows = read_rows(str(npy_file))
+    assert rows == [[3, 0, 1, 1], [5, 0, 1, 3]]
+    assert all(isinstance(value, int) for row in rows for value in row)
+
+    numpy.save(npy_file, numpy.array([3, 5]))
+    with pytest.raises(ValueError):
+        read_rows(str(npy_file))
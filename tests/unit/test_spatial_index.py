@@ -0,0 +1,58 @@
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from linguoplotter.location import Location
+from linguoplotter.spatial_index import SpatialIndex
+
+
+class Item:
+    def __init__(self, location: Location):
+        self.location = location
+
+    def location_in_space(self, space):
+        return self.location
+
+
+@pytest.mark.parametrize("distance_function", SpatialIndex.DISTANCE_FUNCTIONS)
+def test_candidates_include_every_near_structure(distance_function):
+    space = Mock(no_of_dimensions=2)
+    space.parent_concept.distance_function = distance_function
+    space.parent_concept.distance_to_proximity_weight = 1.0
+    generator = random.Random(0)
+
+    def location():
+        return Location(
+            [
+                [generator.randint(0, 12), generator.randint(0, 12)]
+                for _ in range(generator.randint(1, 3))
+            ],
+            space,
+        )
+
+    items = [Item(location()) for _ in range(300)]
+    unplaced = Item(Location([[float("nan"), 1]], space))
+    spatial_index = SpatialIndex(space, items + [unplaced])
+    assert spatial_index.is_usable
+    for _ in range(50):
+        query = location()
+        candidates = spatial_index.candidates(query)
+        assert unplaced in candidates
+        assert len(candidates) < len(items)
+        for item in items:
+            if item.location.is_near(query):
+                assert item in candidates
+
+
+def test_candidates_follow_changes_to_coordinates():
+    space = Mock(no_of_dimensions=1)
+    space.parent_concept.distance_function = SpatialIndex.DISTANCE_FUNCTIONS[0]
+    space.parent_concept.distance_to_proximity_weight = 1.0
+    item = Item(Location([[0]], space))
+    spatial_index = SpatialIndex(space, [item])
+    assert item not in spatial_index.candidates(Location([[50]], space))
+    item.location.coordinates = [[50]]
+    assert item in spatial_index.candidates(Location([[50]], space))
+    spatial_index.remove(item)
+    assert item.location.spatial_indexes == {}
@@ -89,6 +89,15 @@ def test_eq_and_ne():
     assert not collection_f != collection_g
 
 
+def test_contains():
+    structure_1 = Mock()
+    structure_2 = Mock()
+    collection = StructureCollection(Mock(), {structure_1: True})
+    assert structure_1 in collection
+    assert structure_2 not in collection
+    assert StructureCollection(Mock(), {}) not in collection
+
+
 def test_get_item():
     structure_1 = Mock()
     structure_2 = Mock()
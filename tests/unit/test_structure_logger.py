@@ -0,0 +1,58 @@
+import io
+import json
+from unittest.mock import Mock
+
+from linguoplotter.loggers import StructureLogger
+
+
+class Structure:
+    def __init__(self, structure_id: str, fields: dict):
+        self.structure_id = structure_id
+        self.fields = fields
+
+    def __dict__(self) -> dict:
+        return dict(self.fields)
+
+
+def test_only_changed_fields_are_logged():
+    stream = io.StringIO()
+    coderack = Mock(codelets_run=0)
+    logger = StructureLogger(stream, coderack=coderack)
+    structure = Structure("Label1", {"activation": 0.0, "quality": 0.5})
+    logger.log(structure)
+    coderack.codelets_run = 1
+    logger.log(structure)
+    coderack.codelets_run = 2
+    structure.fields["activation"] = 1.0
+    logger.log(structure)
+    coderack.codelets_run = 3
+    structure.fields.pop("quality")
+    logger.log(structure)
+    records = [json.loads(line) for line in stream.getvalue().split("\n") if line]
+    assert records == [
+        {
+            "id": "Label1",
+            "time": 0,
+            "changes": {"activation": 0.0, "quality": 0.5},
+        },
+        {"id": "Label1", "time": 2, "changes": {"activation": 1.0}},
+        {"id": "Label1", "time": 3, "changes": {}, "removed": ["quality"]},
+    ]
+
+
+def test_forgotten_structures_are_logged_in_full():
+    stream = io.StringIO()
+    coderack = Mock(codelets_run=0)
+    logger = StructureLogger(stream, coderack=coderack)
+    structure = Structure("Label1", {"activation": 0.0, "quality": 0.5})
+    logger.log(structure)
+    logger.forget(structure)
+    assert logger.fields == {}
+    coderack.codelets_run = 1
+    logger.log(structure)
+    records = [json.loads(line) for line in stream.getvalue().split("\n") if line]
+    assert records[1] == {
+        "id": "Label1",
+        "time": 1,
+        "changes": {"activation": 0.0, "quality": 0.5},
+    }
@@ -0,0 +1,46 @@
+import pytest
+
+from linguoplotter.sum_tree import SumTree
+
+
+@pytest.mark.parametrize(
+    "weights, value, expected_index",
+    [
+        ([1.0, 1.0, 1.0], 0.0, 0),
+        ([1.0, 1.0, 1.0], 1.5, 1),
+        ([1.0, 1.0, 1.0], 2.9, 2),
+        ([0.5, 0.0, 0.5], 0.5, 2),
+        ([0.0, 0.0, 0.3, 0.1, 0.6], 0.35, 3),
+    ],
+)
+def test_find(weights, value, expected_index):
+    tree = SumTree(weights)
+    assert expected_index == tree.find(value)
+
+
+def test_append_and_update_keep_prefix_sums():
+    tree = SumTree()
+    weights = [0.1 * i for i in range(1, 20)]
+    for weight in weights:
+        tree.append(weight)
+    tree.update(4, 0.0)
+    weights[4] = 0.0
+    tree.update(11, 2.0)
+    weights[11] = 2.0
+    for i in range(len(weights)):
+        assert sum(weights[:i]) == pytest.approx(tree.prefix_sum(i))
+    assert sum(weights) == pytest.approx(tree.total)
+    assert 4 != tree.find(sum(weights[:4]))
+
+
+def test_total_is_zero_when_every_weight_is_zero():
+    tree = SumTree()
+    weights = [0.1, 0.2, 0.3]
+    for weight in weights:
+        tree.append(weight)
+    for i in range(len(weights)):
+        tree.update(i, 0.0)
+    assert 0.0 == tree.total
+    tree.update(2, 0.5)
+    assert 0.5 == tree.total
+    assert 2 == tree.find(0.25)
@@ -1,5 +1,6 @@
 import math
 import pytest
+import statistics
 from unittest.mock import Mock
 
 from linguoplotter.tools import *
@@ -25,6 +26,13 @@ def test_average_vector(vectors, expected_average):
     assert average_vector(vectors) == expected_average
 
 
+def test_average_vector_matches_fmean_exactly():
+    vectors = [[0.1, 1e16], [0.2, 1.0], [0.3, -1e16], [1 / 3, 3.0]]
+    assert average_vector(vectors) == [
+        statistics.fmean([vector[i] for vector in vectors]) for i in range(2)
+    ]
+
+
 @pytest.mark.parametrize(
     "a, b, result",
     [